@@ -0,0 +1,62 @@
+"""Time each HTML parser backend on game pages and check they produce identical DataFrames.
+
+    python -m benchmarks.bench_parsers [cached page URLs...]
+
+Without URLs the bundled test fixture is used.
+"""
+import sys
+import time
+from pathlib import Path
+import pandas as pd
+from scrapers.games_page.etl import parse_game_page, scrape_game_page
+from scrapers.games_page.ingest import GamePageScraper
+from scrapers.parsers import PARSER_BACKENDS
+
+FIXTURE = Path(__file__).resolve().parent.parent / 'tests' / 'fixtures' / 'boxscore_202309070kan.html'
+FIXTURE_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+REFERENCE_BACKEND = 'html.parser'
+ROUNDS = 10
+
+
+def load_pages(urls: list[str]) -> list[tuple[str, str]]:
+    if not urls:
+        return [(FIXTURE_URL, FIXTURE.read_text())]
+    pages = []
+    for url in urls:
+        html = GamePageScraper.page_cache.get(url)
+        if html is None:
+            raise ValueError(f'[!] Page not in cache: {url}')
+        pages.append((url, html))
+    return pages
+
+
+def parse_with(backend: str, pages: list[tuple[str, str]]):
+    GamePageScraper.parser_backend = backend
+    return [parse_game_page(url, html) for url, html in pages]
+
+
+def main(urls: list[str]) -> None:
+    pages = load_pages(urls)
+    reference = parse_with(REFERENCE_BACKEND, pages)
+
+    for backend in PARSER_BACKENDS:
+        try:
+            frames = parse_with(backend, pages)
+        except ImportError as e:
+            print(f'{backend:<12} skipped: {e}')
+            continue
+        for expected, actual in zip(reference, frames):
+            for name, a, b in zip(expected._fields, expected, actual):
+                pd.testing.assert_frame_equal(a, b, obj=f'{backend} {name}')
+
+        # Only the scraping step depends on the backend, so only it is timed
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            for url, html in pages:
+                scrape_game_page(url, html)
+        per_page = (time.perf_counter() - start) / (ROUNDS * len(pages)) * 1000
+        print(f'{backend:<12} {per_page:8.1f} ms/page scraped  (identical DataFrames)')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
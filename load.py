@@ -1,58 +1,203 @@
-import psycopg2
+import hashlib
+import io
+import threading
+import time
+from typing import NamedTuple
+from pathlib import Path
+import pandas as pd
 import sqlalchemy
-from sqlalchemy.dialects.postgresql import insert
 from nfl_datacollector.config import DatabaseConfig
+from nfl_datacollector.urlindex import UrlIndex
+
+# Columns each table deduplicates on; rows that collide with an existing row are skipped
+TABLE_CONFLICT_KEYS = {
+    'game_info': ['game_id'],
+    'game_stats': ['game_id', 'team_id'],
+    'game_player_stats': ['id'],
+    'player_profiles': ['player_id'],
+    'season_team_info': ['id'],
+    'game_drives': ['game_id', 'team_id', 'drive_num'],
+    'season_info': ['season_year'],
+    'season_team_seeds': ['id'],
+    'ap_team_votes': ['id'],
+    'page_hashes': ['url'],
+}
+
+# Tables whose url column records which pages have been loaded
+URL_TABLES = ('game_info', 'player_profiles')
+
+# Unquoted marker for NULL in the COPY stream, so empty strings survive as ''
+COPY_NULL = '\\N'
+
+
+class InsertResult(NamedTuple):
+    inserted: int
+    skipped: int
+
+
+class CopyStatements(NamedTuple):
+    create_staging: str
+    copy: str
+    merge: str
+    drop_staging: str
+    integer_columns: frozenset
+
+
+class TableSpec:
+    """A reflected table with its conflict keys and the SQL insert_df runs against it.
+
+    Statements are built the first time a column set is loaded and reused
+    after that, so repeated inserts never touch the catalog.
+    """
+
+    def __init__(self, table: sqlalchemy.Table, conflict_keys):
+        self.table = table
+        self.name = table.name
+        self.columns = tuple(column.name for column in table.columns)
+        self.primary_key = tuple(column.name for column in table.primary_key.columns)
+        self.conflict_keys = tuple(conflict_keys)
+        self.integer_columns = frozenset(column.name for column in table.columns
+                                         if isinstance(column.type, sqlalchemy.Integer))
+        self._statements: dict[tuple, CopyStatements] = {}
+
+        unique_keys = [set(self.primary_key)] + [
+            {column.name for column in constraint.columns}
+            for constraint in table.constraints if isinstance(constraint, sqlalchemy.UniqueConstraint)
+        ]
+        if set(self.conflict_keys) not in unique_keys:
+            raise ValueError(f'[!] {self.name} has no unique constraint on {list(self.conflict_keys)}; '
+                             f'recreate it with DatabaseLoader.create_{self.name}_table()')
+
+    def copy_statements(self, columns: tuple, upsert: bool = False) -> CopyStatements:
+        statements = self._statements.get((columns, upsert))
+        if statements is None:
+            unknown = [column for column in columns if column not in self.columns]
+            if unknown:
+                raise ValueError(f'[!] {self.name} has no columns named {unknown}')
+            statements = self._statements[columns, upsert] = self._build_statements(columns, upsert)
+        return statements
+
+    def _build_statements(self, columns: tuple, upsert: bool) -> CopyStatements:
+        column_list = ', '.join(f'"{column}"' for column in columns)
+        conflict_keys = ', '.join(f'"{column}"' for column in self.conflict_keys)
+        updates = ', '.join(f'"{column}" = EXCLUDED."{column}"' for column in columns
+                            if column not in self.conflict_keys)
+        on_conflict = f'DO UPDATE SET {updates}' if upsert and updates else 'DO NOTHING'
+        staging = f'_staging_{self.name}'
+        return CopyStatements(
+            # CREATE ... AS ... WITH NO DATA copies the column types but none of the constraints
+            create_staging=f'CREATE TEMP TABLE {staging} ON COMMIT DROP AS '
+                           f'SELECT {column_list} FROM {self.name} WITH NO DATA',
+            copy=f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            merge=f'INSERT INTO {self.name} ({column_list}) SELECT {column_list} FROM {staging} '
+                  f'ON CONFLICT ({conflict_keys}) {on_conflict}',
+            drop_staging=f'DROP TABLE {staging}',
+            integer_columns=self.integer_columns.intersection(columns),
+        )
+
+
+def frame_to_copy_csv(df: pd.DataFrame, integer_columns=()) -> io.StringIO:
+    """Serializes a frame as the CSV body of a COPY ... FROM STDIN.
+
+    Missing values (None, NaN, pd.NA) become COPY_NULL, nullable and numpy
+    numbers are written as plain literals and booleans as true/false. Float
+    columns listed in integer_columns are written without the trailing .0,
+    which COPY would reject for an INTEGER column.
+    """
+    converted = {}
+    for column, dtype in df.dtypes.items():
+        if column in integer_columns and pd.api.types.is_float_dtype(dtype):
+            converted[column] = df[column].astype('Int64')
+        elif pd.api.types.is_bool_dtype(dtype):
+            converted[column] = df[column].map({True: 'true', False: 'false'})
+    if converted:
+        df = df.assign(**converted)
+
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL)
+    buffer.seek(0)
+    return buffer
+
 
 class DatabaseLoader:
-    def __init__(self, config: DatabaseConfig):
+    def __init__(self, config: DatabaseConfig, url_index_dir: str | Path | None = None):
         self.config = config
         self.engine = None
+        # When set, URL indexes persist a Bloom filter here instead of loading every URL each run
+        self.url_index_dir = Path(url_index_dir) if url_index_dir is not None else None
+        self._lock = threading.Lock()
+        self._table_specs: dict[str, TableSpec] = {}
+        self._url_indexes: dict[str, UrlIndex] = {}
 
     def get_connection(self):
-        return psycopg2.connect(
-            host=self.config.hostname,
-            dbname=self.config.database,
-            user=self.config.username,
-            password=self.config.password,
-            port=self.config.port
-        )
+        # A DBAPI connection checked out of the shared pool; close() returns it to the pool
+        return self.get_engine().raw_connection()
 
     def get_engine(self):
-        if self.engine is None:
-            self.engine = sqlalchemy.create_engine(self.config.get_connection_string())
+        # One pooled engine per loader, shared by every read, write and DDL call
+        with self._lock:
+            if self.engine is None:
+                self.engine = sqlalchemy.create_engine(self.config.get_connection_string(),
+                                                       **self.config.get_engine_options())
         return self.engine
+
+    def close(self) -> None:
+        for url_index in self._url_indexes.values():
+            url_index.save()
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
     
     
-    def get_all_game_urls(self) -> list[str]:
+    def get_all_urls(self, table_name: str) -> list[str]:
+        if table_name not in URL_TABLES:
+            raise ValueError(f'[!] {table_name} has no url column to index')
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT url FROM game_info;")
-                    rows = cur.fetchall()
-                    return [row[0] for row in rows]
+            with self.get_engine().connect() as conn:
+                return list(conn.exec_driver_sql(f"SELECT url FROM {table_name};").scalars())
         except Exception as e:
-            print("Error fetching URLs from game_info:", e)
+            print(f"Error fetching URLs from {table_name}:", e)
             return []
     
     
+    def get_all_game_urls(self) -> list[str]:
+        return self.get_all_urls('game_info')
+    
+    
     def get_all_player_urls(self) -> list[str]:
-        try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT url FROM player_profiles;")
-                    rows = cur.fetchall()
-                    return [row[0] for row in rows]
-        except Exception as e:
-            print("Error fetching URLs from player_profiles:", e)
-            return []
+        return self.get_all_urls('player_profiles')
+    
+    
+    def url_exists(self, table_name: str, url: str) -> bool:
+        if table_name not in URL_TABLES:
+            raise ValueError(f'[!] {table_name} has no url column to index')
+        with self.get_engine().connect() as conn:
+            query = sqlalchemy.text(f'SELECT EXISTS (SELECT 1 FROM {table_name} WHERE url = :url)')
+            return conn.execute(query, {'url': url}).scalar()
+    
+    
+    def get_url_index(self, table_name: str) -> UrlIndex:
+        # One index per table and loader; insert_df adds the url of every committed row to it
+        with self._lock:
+            url_index = self._url_indexes.get(table_name)
+            if url_index is None:
+                if table_name not in URL_TABLES:
+                    raise ValueError(f'[!] {table_name} has no url column to index')
+                bloom_path = self.url_index_dir / f'{table_name}.bloom' if self.url_index_dir else None
+                url_index = self._url_indexes[table_name] = UrlIndex(
+                    lambda: self.get_all_urls(table_name),
+                    lambda url: self.url_exists(table_name, url),
+                    bloom_path,
+                )
+        return url_index
     
     
     def create_table(self, query: str, table_name: str):
+        self._table_specs.pop(table_name, None)
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(query)
-                    print(f"{table_name} table created successfully")
+            with self.get_engine().begin() as conn:
+                conn.exec_driver_sql(query)
+            print(f"{table_name} table created successfully")
         except Exception as e:
             print(f"Error creating {table_name} table:", e)
     
@@ -87,6 +232,7 @@ class DatabaseLoader:
             url VARCHAR(200) NOT NULL,
             PRIMARY KEY (game_id)
         );
+        CREATE INDEX idx_game_info_url ON game_info(url);
         '''
         self.create_table(query, 'game_info')
     
@@ -277,7 +423,8 @@ class DatabaseLoader:
             college VARCHAR(100),
             url VARCHAR(200) NOT NULL,
             PRIMARY KEY (player_id)
-        )
+        );
+        CREATE INDEX idx_player_profiles_url ON player_profiles(url);
         '''
         self.create_table(query, 'player_profiles')
     
@@ -290,14 +437,15 @@ class DatabaseLoader:
             team_id VARCHAR(10) NOT NULL,
             drive_num VARCHAR(10),
             quarter VARCHAR(10),
-            time_start VARCHAR(20),
+            time_start INTEGER,         -- seconds left in the quarter
             start_at VARCHAR(50),
-            plays VARCHAR(100),
-            time_total VARCHAR(20),
-            net_yds VARCHAR(20),
+            plays INTEGER,
+            time_total INTEGER,         -- drive length in seconds
+            net_yds INTEGER,
             end_event VARCHAR(100),
             opposing_touchdown BOOLEAN DEFAULT FALSE,
             points_scored INTEGER DEFAULT 0,
+            UNIQUE (game_id, team_id, drive_num),
             FOREIGN KEY (game_id) REFERENCES game_info(game_id) ON DELETE CASCADE
         );
         
@@ -307,6 +455,44 @@ class DatabaseLoader:
         self.create_table(query, 'game_drives')
     
     
+    def migrate_game_drives_table(self):
+        # Upgrades a game_drives table created before the clock and count columns became
+        # INTEGER and before the unique drive key, keeping its rows. Safe to run more than once.
+        clock_columns = ('time_start', 'time_total')
+        count_columns = ('plays', 'net_yds')
+        self._table_specs.pop('game_drives', None)
+        with self.get_engine().begin() as conn:
+            text_columns = set(conn.exec_driver_sql(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = 'game_drives' AND data_type = 'character varying'"
+            ).scalars())
+            alterations = []
+            for column in clock_columns + count_columns:
+                if column not in text_columns:
+                    continue
+                if column in clock_columns:
+                    # Clocks were stored as 'mm:ss'
+                    using = (f"CASE WHEN trim({column}) = '' THEN NULL "
+                             f"ELSE split_part({column}, ':', 1)::integer * 60 + split_part({column}, ':', 2)::integer END")
+                else:
+                    using = f"NULLIF(trim({column}), '')::integer"
+                alterations.append(f'ALTER COLUMN {column} TYPE INTEGER USING {using}')
+            if alterations:
+                conn.exec_driver_sql(f"ALTER TABLE game_drives {', '.join(alterations)}")
+
+            unique_keys = [set(constraint['column_names'])
+                           for constraint in sqlalchemy.inspect(conn).get_unique_constraints('game_drives')]
+            if set(TABLE_CONFLICT_KEYS['game_drives']) not in unique_keys:
+                # Keep the first copy of every drive so the constraint can be added
+                conn.exec_driver_sql('''
+                DELETE FROM game_drives a USING game_drives b
+                WHERE a.id > b.id AND a.game_id = b.game_id AND a.team_id = b.team_id AND a.drive_num = b.drive_num;
+                ALTER TABLE game_drives
+                    ADD CONSTRAINT game_drives_game_id_team_id_drive_num_key UNIQUE (game_id, team_id, drive_num);
+                ''')
+        print("game_drives table migrated successfully")
+    
+    
     def create_season_team_info_table(self):
         query = '''
         DROP TABLE IF EXISTS season_team_info;
@@ -434,73 +620,113 @@ class DatabaseLoader:
         self.create_table(query, 'ap_team_votes')
         
         
-    def insert_df(self, df, table_name):
-        engine = self.get_engine()
+    def create_page_hashes_table(self):
+        query = '''
+        DROP TABLE IF EXISTS page_hashes;
+        CREATE TABLE page_hashes (
+            url VARCHAR(200) PRIMARY KEY,
+            content_hash CHAR(64) NOT NULL,  -- SHA-256 of the rows last written from the page
+            updated_at TIMESTAMPTZ NOT NULL
+        );
+        '''
+        self.create_table(query, 'page_hashes')
         
-        with engine.begin() as conn:
-            meta = sqlalchemy.MetaData()
-            table = sqlalchemy.Table(table_name, meta, autoload_with=engine)
-            
-            for _, row in df.iterrows():
-                stmt = insert(table).values(**row.to_dict())
-                
-                # Handle conflicts based on table type
-                if table_name == 'game_team_stats':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['game_id', 'team_id'])
-                elif table_name == 'game_info':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['game_id'])
-                elif table_name == 'game_player_stats':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['id'])
-                elif table_name == 'player_profiles':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['player_id'])
-                elif table_name == 'season_team_info':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['id'])
-                elif table_name == 'game_drives':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['game_id', 'team_id', 'drive_num'])
-                elif table_name == 'season_info':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['season_year'])
-                elif table_name == 'season_team_seeds':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['id'])
-                elif table_name == 'ap_team_votes':
-                    stmt = stmt.on_conflict_do_nothing(index_elements=['id'])
-                else:
-                    raise ValueError(f'Invalid table name: {table_name}')
-                
-                result = conn.execute(stmt)
-                
-                # Log insertion results for game_info table
-                if table_name == 'game_info':
-                    if result.rowcount == 0:
-                        print(f"Skipped duplicate for game_id={row['game_id']}")
-                    else:
-                        print(f"Inserted row for game_id={row['game_id']}")
-                
-                if table_name == 'season_team_info':
-                    if result.rowcount == 0:
-                        print(f"Skipped duplicate for id={row['id']}")
-                    else:
-                        print(f"Inserted row for id={row['id']}")
-
-                if table_name == 'player_profiles':
-                    if result.rowcount == 0:
-                        print(f"Skipped duplicate for player_id={row['player_id']}")
-                    else:
-                        print(f"Inserted row for player_id={row['player_id']}")
-                
-                if table_name == 'season_info':
-                    if result.rowcount == 0:
-                        print(f"Skipped duplicate for season_info year={row['season_year']}")
-                    else:
-                        print(f"Inserted row for season_info year={row['season_year']}")
-                
-                if table_name == 'ap_team_votes':
-                    if result.rowcount == 0:
-                        print(f"Skipped duplicate for ap_team_votes id={row['id']}")
-                    else:
-                        print(f"Inserted row for ap_team_votes player_id={row['player_id']} and season_year={row['season_year']}")
-    
+        
+    def get_table_spec(self, table_name: str, conn=None) -> TableSpec:
+        # Reflected once per loader; create_table() drops the entry when it recreates a table
+        spec = self._table_specs.get(table_name)
+        if spec is None:
+            if table_name not in TABLE_CONFLICT_KEYS:
+                raise ValueError(f'Invalid table name: {table_name}')
+            table = sqlalchemy.Table(table_name, sqlalchemy.MetaData(), autoload_with=conn or self.get_engine())
+            spec = self._table_specs[table_name] = TableSpec(table, TABLE_CONFLICT_KEYS[table_name])
+        return spec
+
+    def insert_df(self, df, table_name, conn=None, upsert: bool = False) -> InsertResult:
+        # COPY the frame into a staging table, then merge it with a single INSERT ... SELECT.
+        # Rows that collide on the conflict keys are skipped, or overwritten when upsert is set.
+        if table_name not in TABLE_CONFLICT_KEYS:
+            raise ValueError(f'Invalid table name: {table_name}')
+        if df.empty:
+            return InsertResult(0, 0)
+        if conn is None:
+            with self.get_engine().begin() as conn:
+                return self.insert_df(df, table_name, conn, upsert)
+
+        statements = self.get_table_spec(table_name, conn).copy_statements(tuple(df.columns), upsert)
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(statements.create_staging)
+            cursor.copy_expert(statements.copy, frame_to_copy_csv(df, statements.integer_columns))
+            cursor.execute(statements.merge)
+            inserted = cursor.rowcount
+            cursor.execute(statements.drop_staging)
+        finally:
+            cursor.close()
+
+        # A persisted Bloom filter must see every committed URL, whichever path wrote it;
+        # an in-memory index only needs the rows committed after it was loaded
+        url_index = self._url_indexes.get(table_name)
+        if url_index is None and self.url_index_dir is not None and table_name in URL_TABLES:
+            url_index = self.get_url_index(table_name)
+        if url_index is not None and 'url' in df.columns:
+            urls = df['url'].dropna().tolist()
+            sqlalchemy.event.listen(conn, 'commit', lambda _: url_index.update(urls), once=True)
+
+        result = InsertResult(inserted, len(df) - inserted)
+        if upsert:
+            print(f'{table_name}: upserted {result.inserted} rows')
+        else:
+            print(f'{table_name}: inserted {result.inserted} rows, skipped {result.skipped} duplicates')
+        return result
+
+    def insert_dfs(self, frames, conn=None) -> dict[str, InsertResult]:
+        # (table_name, df) pairs written in order in one transaction; list parent tables first
+        if conn is None:
+            with self.get_engine().begin() as conn:
+                return self.insert_dfs(frames, conn)
+        return {table_name: self.insert_df(df, table_name, conn) for table_name, df in frames}
+
+    def get_page_hash(self, url: str) -> str | None:
+        with self.get_engine().connect() as conn:
+            query = sqlalchemy.text('SELECT content_hash FROM page_hashes WHERE url = :url')
+            return conn.execute(query, {'url': url}).scalar()
+
+    def refresh_page(self, url: str, frames) -> bool:
+        """Upsert the (table_name, df) frames scraped from url, unless they are unchanged.
+
+        The content hash covers exactly what would be written. It is stored in
+        page_hashes in the same transaction as the rows, so a page whose
+        data has not changed since the last run costs one lookup and no writes.
+        Returns whether anything was written.
+        """
+        digest = hashlib.sha256()
+        for table_name, df in frames:
+            digest.update(table_name.encode())
+            digest.update(','.join(map(str, df.columns)).encode())
+            digest.update(frame_to_copy_csv(df).getvalue().encode())
+        content_hash = digest.hexdigest()
+        if self.get_page_hash(url) == content_hash:
+            print(f'{url} unchanged since the last run. Skipping')
+            return False
+
+        page_hash = pd.DataFrame({'url': [url], 'content_hash': [content_hash],
+                                  'updated_at': [pd.Timestamp.now(tz='UTC')]})
+        with self.get_engine().begin() as conn:
+            for table_name, df in frames:
+                self.insert_df(df, table_name, conn, upsert=True)
+            self.insert_df(page_hash, 'page_hashes', conn, upsert=True)
+        return True
+
+    def get_loaded_weeks(self, season_year: int) -> dict[int, int]:
+        # Number of games stored for each week of the season
+        with self.get_engine().connect() as conn:
+            query = sqlalchemy.text('SELECT season_week, COUNT(*) FROM game_info '
+                                    'WHERE season_year = :season_year GROUP BY season_week')
+            return dict(conn.execute(query, {'season_year': season_year}).all())
+
     def insert_game_team_stats_df(self, df):
-        self.insert_df(df, 'game_team_stats')
+        self.insert_df(df, 'game_stats')
     
     def insert_game_player_stats_df(self, df):
         self.insert_df(df, 'game_player_stats')
@@ -534,12 +760,93 @@ class DatabaseLoader:
         self.create_player_profiles_table()
         self.create_season_team_info_table()
         self.create_game_drives_table()
+        self.create_season_team_seeds_table()
         self.create_season_info_table()
         self.create_ap_team_votes_table()
-        self.create_season_team_seeds()
+        self.create_page_hashes_table()
         print("All tables created successfully!")
 
 
+class BatchWriter:
+    """Buffers the frames of many items (e.g. games) and writes them in one transaction.
+
+    Each item is a NamedTuple of DataFrames. tables maps its fields to table
+    names in write order, parents before children, so foreign keys hold inside
+    the transaction. The buffer is flushed when it holds max_items items or
+    its oldest item has waited max_seconds (checked on add), and on leaving a
+    with block. If a batch fails, its items are retried one transaction each
+    and the ones that still fail are recorded in failed with their exception.
+    on_flush, if given, is called after every flush with the keys written and
+    a dict of the keys that failed.
+    """
+
+    def __init__(self, loader: DatabaseLoader, tables: dict[str, str], max_items: int = 50,
+                 max_seconds: float = 30.0, on_flush=None):
+        self.loader = loader
+        self.tables = tables
+        self.max_items = max_items
+        self.max_seconds = max_seconds
+        self.on_flush = on_flush
+        self.written = []
+        self.failed = {}
+        self._items = []
+        self._oldest = None
+
+    def __enter__(self) -> 'BatchWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        # Items buffered before an error were parsed fine, so they are still written
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, key, frames) -> None:
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        self._items.append((key, frames))
+        if len(self._items) >= self.max_items or time.monotonic() - self._oldest >= self.max_seconds:
+            self.flush()
+
+    def flush(self) -> list:
+        items, self._items, self._oldest = self._items, [], None
+        if not items:
+            return []
+        try:
+            self.loader.insert_dfs(self._combine(items))
+            written = [key for key, _ in items]
+        except Exception as e:
+            if len(items) == 1:
+                written = []
+                self._fail(items[0][0], e)
+            else:
+                print(f'[!] Batch of {len(items)} failed ({e}), writing them one at a time')
+                written = [key for key, frames in items if self._write_one(key, frames)]
+        self.written.extend(written)
+        if self.on_flush is not None:
+            self.on_flush(written, {key: self.failed[key] for key, _ in items if key in self.failed})
+        return written
+
+    def _write_one(self, key, frames) -> bool:
+        try:
+            self.loader.insert_dfs(self._combine([(key, frames)]))
+        except Exception as e:
+            self._fail(key, e)
+            return False
+        return True
+
+    def _fail(self, key, error: Exception) -> None:
+        print(f'[!] Failed to write {key}: {error}')
+        self.failed[key] = error
+
+    def _combine(self, items: list) -> list[tuple[str, pd.DataFrame]]:
+        return [
+            (table_name, pd.concat([getattr(frames, field) for _, frames in items], ignore_index=True))
+            for field, table_name in self.tables.items()
+        ]
+
+
 # Legacy function wrappers for backward compatibility
 def get_db_connection(loader: DatabaseLoader):
     return loader.get_connection()
@@ -569,6 +876,9 @@ def create_player_profiles_table(loader: DatabaseLoader):
 def create_game_drives_table(loader: DatabaseLoader):
     loader.create_game_drives_table()
 
+def migrate_game_drives_table(loader: DatabaseLoader):
+    loader.migrate_game_drives_table()
+
 def create_season_info_table(loader: DatabaseLoader):
     loader.create_season_info_table()
 
@@ -577,6 +887,9 @@ def create_season_team_seeds(loader: DatabaseLoader):
     
 def create_ap_team_votes_table(loader: DatabaseLoader):
     loader.create_ap_team_votes_table()
+
+def create_page_hashes_table(loader: DatabaseLoader):
+    loader.create_page_hashes_table()
     
     
 def insert_df(df, table_name, loader: DatabaseLoader):
@@ -13,16 +13,9 @@ from load import *
 # if __name__ == "__main__":
 #     config = DatabaseConfig.load()
 #     loader = DatabaseLoader(config)
-#     logged_urls = get_all_db_player_urls(loader)
-#     for team in list(TEAM_ID_TO_CITY_MAP.keys()):
-#         game_links = extract_game_links_from_team_page(f'https://www.pro-football-reference.com/teams/{team}/2019.htm')
-#         for game_link in game_links:
-#             player_urls = extract_player_urls_from_game_page(game_link)
-#             for player_url in player_urls:
-#                 if player_url not in logged_urls:
-#                     ETL_player_profile(player_url, loader)
-#                 else:
-#                     print(f'{player_url} already logged. Skipping')
+#     with CrawlFrontier() as frontier:
+#         ETL_games_season_year(2019, loader, frontier=frontier)
+#         ETL_pending_player_profiles(loader, frontier)
 #     print('FINISHED ALL GAMES')
 
 
@@ -4,5 +4,6 @@ __version__ = "0.1.0"
 
 from .config import DatabaseConfig
 from .utils import polite_sleep
+from .ratelimit import RateLimiter
 
-__all__ = ["DatabaseConfig", "polite_sleep"] 
\ No newline at end of file
+__all__ = ["DatabaseConfig", "polite_sleep", "RateLimiter"] 
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""On-disk cache of raw HTML pages fetched from Pro Football Reference."""
+
+import gzip
+import hashlib
+import os
+import re
+import tarfile
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(".page_cache")
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Pages for a season that is still being played change as games are completed.
+CURRENT_SEASON_TTL = 6 * HOUR
+PLAYER_PROFILE_TTL = 30 * DAY
+DEFAULT_TTL = DAY
+
+_BOXSCORE_RE = re.compile(r"/boxscores/\d{9}[a-z]{3}\.htm")
+_SEASON_YEAR_RE = re.compile(r"/(?:years|teams/[a-z]{3})/(\d{4})")
+_PLAYER_RE = re.compile(r"/players/[A-Z]/")
+
+
+def current_season(today: date | None = None) -> int:
+    """Return the season year in progress; a season ends with the Super Bowl in February."""
+    today = today or date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def page_ttl(url: str, today: date | None = None) -> float | None:
+    """Return how many seconds a cached copy of url stays fresh, or None if it never expires."""
+    if _BOXSCORE_RE.search(url):
+        return None
+
+    match = _SEASON_YEAR_RE.search(url)
+    if match:
+        if int(match.group(1)) < current_season(today):
+            return None
+        return CURRENT_SEASON_TTL
+
+    if _PLAYER_RE.search(url):
+        return PLAYER_PROFILE_TTL
+
+    return DEFAULT_TTL
+
+
+class PageCache:
+    """Gzip-compressed HTML store keyed by the SHA-256 of the page URL."""
+
+    # An offline store never falls back to the network on a miss
+    offline = False
+
+    def __init__(self, root: str | Path = DEFAULT_CACHE_DIR, ttl=page_ttl):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def path_for(self, url: str) -> Path:
+        key = self.key_for(url)
+        return self.root / key[:2] / f"{key}.html.gz"
+
+    def get(self, url: str) -> str | None:
+        """Return the cached HTML for url, or None if it is missing or stale."""
+        path = self.path_for(url)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        ttl = self.ttl(url)
+        if ttl is not None and age > ttl:
+            return None
+
+        return self._decode(path.read_bytes())[1]
+
+    def put(self, url: str, html: str) -> None:
+        """Store html for url, replacing any previous copy atomically."""
+        path = self.path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(url.encode("utf-8") + b"\n")
+                f.write(html.encode("utf-8"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def iter_urls(self):
+        """Yield the URL of every page stored in the cache."""
+        for path in sorted(self.root.glob("*/*.html.gz")):
+            with gzip.open(path, "rb") as f:
+                yield f.readline().decode("utf-8").rstrip("\n")
+
+    @staticmethod
+    def _decode(data: bytes) -> tuple[str, str]:
+        url, _, html = gzip.decompress(data).decode("utf-8").partition("\n")
+        return url, html
+
+
+class PageArchive(PageCache):
+    """Read-only page corpus for replaying ETL runs offline.
+
+    The archive is either a PageCache directory or a tarball of one
+    (e.g. ``tar czf pages.tgz -C .page_cache .``). Archived pages never expire.
+    """
+
+    offline = True
+
+    def __init__(self, path: str | Path):
+        super().__init__(path, ttl=lambda url: None)
+        self._tar = None
+        self._members = {}
+        self._lock = threading.Lock()
+
+        if self.root.is_file():
+            self._tar = tarfile.open(self.root, "r:*")
+            self._members = {
+                Path(member.name).name: member
+                for member in self._tar.getmembers()
+                if member.isfile() and member.name.endswith(".html.gz")
+            }
+        elif not self.root.is_dir():
+            raise ValueError(f"[!] Page archive not found: {self.root}")
+
+    def get(self, url: str) -> str | None:
+        if self._tar is None:
+            return super().get(url)
+
+        member = self._members.get(f"{self.key_for(url)}.html.gz")
+        if member is None:
+            return None
+
+        # TarFile reads share one file handle
+        with self._lock:
+            data = self._tar.extractfile(member).read()
+        return self._decode(data)[1]
+
+    def put(self, url: str, html: str) -> None:
+        raise ValueError(f"[!] Cannot store {url}: page archives are read-only")
+
+    def iter_urls(self):
+        if self._tar is None:
+            yield from super().iter_urls()
+            return
+
+        for name in sorted(self._members):
+            with self._lock:
+                data = self._tar.extractfile(self._members[name]).read()
+            yield self._decode(data)[0]
@@ -14,6 +14,12 @@ class DatabaseConfig:
     username: str
     password: str
     port: int
+    # Connection pool shared by every DatabaseLoader read and write
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    # Per-statement server-side limit in milliseconds; 0 disables it
+    statement_timeout_ms: int = 300_000
     
     @classmethod
     def from_local_file(cls):
@@ -103,6 +109,18 @@ class DatabaseConfig:
         except Exception as e:
             print(f"Error saving configuration: {e}")
     
+    def get_engine_options(self) -> dict:
+        """Get keyword arguments for sqlalchemy.create_engine()."""
+        options = {
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_timeout': self.pool_timeout,
+            'pool_pre_ping': True,
+        }
+        if self.statement_timeout_ms:
+            options['connect_args'] = {'options': f'-c statement_timeout={self.statement_timeout_ms}'}
+        return options
+
     def get_connection_string(self) -> str:
         """Get SQLAlchemy connection string."""
         return f"postgresql+psycopg2://{self.username}:{self.password}@{self.hostname}:{self.port}/{self.database}" 
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""Durable crawl frontier: every discovered URL with its progress, stored in SQLite."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+DEFAULT_FRONTIER_PATH = Path(".crawl_frontier.sqlite3")
+
+PENDING = "pending"
+FETCHED = "fetched"
+PARSED = "parsed"
+LOADED = "loaded"
+FAILED = "failed"
+STATUSES = (PENDING, FETCHED, PARSED, LOADED, FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url         TEXT NOT NULL,
+    job         TEXT NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'pending',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    last_error  TEXT,
+    updated_at  REAL NOT NULL,
+    PRIMARY KEY (url, job)
+);
+CREATE INDEX IF NOT EXISTS idx_frontier_job_status ON frontier (job, status);
+PRAGMA user_version = 1;
+"""
+
+# Version 0 keyed the frontier on url alone, so a URL could belong to one job only
+_MIGRATE_FROM_V0 = """
+DROP INDEX IF EXISTS idx_frontier_job_status;
+ALTER TABLE frontier RENAME TO frontier_v0;
+""" + _SCHEMA + """
+INSERT INTO frontier (url, job, status, attempts, last_error, updated_at)
+    SELECT url, job, status, attempts, last_error, updated_at FROM frontier_v0;
+DROP TABLE frontier_v0;
+"""
+
+
+class CrawlFrontier:
+    """Remembers which URLs a crawl has discovered and how far each one got.
+
+    URLs are grouped by job (e.g. "games:2023") and move from pending through
+    fetched and parsed to loaded, or to failed with the error and the number of
+    attempts. A crawl that stops part way resumes from the URLs that are not
+    loaded yet, and failed URLs are retried only when asked to. The same URL
+    can belong to several jobs, each with its own progress.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_FRONTIER_PATH):
+        # ':memory:' keeps the frontier for this run only
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        exists = self._db.execute("SELECT 1 FROM sqlite_master WHERE name = 'frontier'").fetchone()
+        self._db.executescript(_MIGRATE_FROM_V0 if exists and version == 0 else _SCHEMA)
+
+    @property
+    def persistent(self) -> bool:
+        return str(self.path) != ":memory:"
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "CrawlFrontier":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, urls: Iterable[str], job: str) -> int:
+        """Record newly discovered URLs as pending; known URLs keep their progress. Returns the number added."""
+        now = time.time()
+        with self._lock, self._db:
+            before = self._db.total_changes
+            self._db.executemany(
+                "INSERT OR IGNORE INTO frontier (url, job, updated_at) VALUES (?, ?, ?)",
+                ((url, job, now) for url in urls),
+            )
+            return self._db.total_changes - before
+
+    def mark(self, url: str, job: str, status: str, error: str | Exception | None = None) -> None:
+        """Move url to status within job; a failure counts as an attempt and keeps its error."""
+        self.mark_many([url], job, status, error)
+
+    def mark_many(self, urls: Iterable[str], job: str, status: str, error: str | Exception | None = None) -> None:
+        if status not in STATUSES:
+            raise ValueError(f"[!] Unknown frontier status: {status}. Choose one of {STATUSES}")
+        failed = status == FAILED
+        params = ((status, int(failed), f"{type(error).__name__}: {error}" if isinstance(error, Exception) else error,
+                   time.time(), url, job) for url in urls)
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE frontier SET status = ?, attempts = attempts + ?, last_error = ?, updated_at = ? "
+                "WHERE url = ? AND job = ?",
+                params,
+            )
+
+    def status(self, url: str, job: str) -> str | None:
+        with self._lock:
+            row = self._db.execute("SELECT status FROM frontier WHERE url = ? AND job = ?", (url, job)).fetchone()
+        return row[0] if row else None
+
+    def pending(self, job: str) -> list[str]:
+        """URLs of job that have not been loaded and have not failed, in discovery order."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT url FROM frontier WHERE job = ? AND status NOT IN (?, ?) ORDER BY rowid",
+                (job, LOADED, FAILED),
+            ).fetchall()
+        return [url for url, in rows]
+
+    def failed(self, job: str) -> dict[str, str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT url, last_error FROM frontier WHERE job = ? AND status = ? ORDER BY rowid", (job, FAILED)
+            ).fetchall()
+        return dict(rows)
+
+    def retry_failed(self, job: str, max_attempts: int | None = None) -> int:
+        """Return failed URLs of job to pending, optionally only those tried fewer than max_attempts times."""
+        query = "UPDATE frontier SET status = ?, updated_at = ? WHERE job = ? AND status = ?"
+        params = [PENDING, time.time(), job, FAILED]
+        if max_attempts is not None:
+            query += " AND attempts < ?"
+            params.append(max_attempts)
+        with self._lock, self._db:
+            return self._db.execute(query, params).rowcount
+
+    def counts(self, job: str) -> dict[str, int]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM frontier WHERE job = ? GROUP BY status", (job,)
+            ).fetchall()
+        return {status: 0 for status in STATUSES} | dict(rows)
@@ -0,0 +1,143 @@
+"""Shared HTTP session with connection pooling, compression and retry/backoff."""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ratelimit import RateLimiter, default_rate_limiter
+
+DEFAULT_TIMEOUT = (10, 30)  # (connect, read) seconds
+DEFAULT_POOL_SIZE = 10
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 5.0
+MAX_BACKOFF_SECONDS = 300.0
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+USER_AGENT = "Mozilla/5.0 (compatible; nfl-datacollector/0.1)"
+
+
+def _accept_encoding() -> str:
+    # urllib3 only decodes brotli when a brotli package is installed
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Create a keep-alive session that reuses up to pool_size connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": _accept_encoding(),
+    })
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_seconds(attempt: int) -> float:
+    delay = BACKOFF_BASE_SECONDS * 2 ** attempt
+    return min(MAX_BACKOFF_SECONDS, delay + random.uniform(0, BACKOFF_BASE_SECONDS))
+
+
+def _retry_delay(url: str, attempt: int, max_retries: int,
+                 response: requests.Response | None = None,
+                 error: Exception | None = None) -> float | None:
+    """Return the seconds to back off before retrying, or None if response is final."""
+    if error is not None:
+        if attempt == max_retries:
+            raise error
+        delay = _backoff_seconds(attempt)
+        reason = type(error).__name__
+    else:
+        if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+            response.raise_for_status()
+            return None
+        retry_after = _retry_after_seconds(response)
+        delay = retry_after if retry_after is not None else _backoff_seconds(attempt)
+        reason = f"HTTP {response.status_code}"
+
+    print(f"[!] {reason} for {url}; retrying in {delay:.0f}s ({attempt + 1}/{max_retries})")
+    return delay
+
+
+def fetch(url: str, session: requests.Session | None = None,
+          rate_limiter: RateLimiter = default_rate_limiter,
+          timeout=DEFAULT_TIMEOUT, max_retries: int = MAX_RETRIES) -> requests.Response:
+    """GET url under the rate limiter, retrying connection errors, 429 and 5xx responses.
+
+    Retries back off exponentially unless the server sends Retry-After. The
+    backoff is applied to the host in the rate limiter, so every other caller
+    waits as well. Raises requests.HTTPError once retries run out or on any
+    other error status.
+    """
+    session = session or get_session()
+
+    for attempt in range(max_retries + 1):
+        rate_limiter.wait(url)
+        try:
+            response = session.get(url, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            delay = _retry_delay(url, attempt, max_retries, error=e)
+        else:
+            delay = _retry_delay(url, attempt, max_retries, response=response)
+            if delay is None:
+                return response
+        rate_limiter.defer(url, delay)
+
+
+async def fetch_async(url: str, session: requests.Session | None = None,
+                      rate_limiter: RateLimiter = default_rate_limiter,
+                      timeout=DEFAULT_TIMEOUT, max_retries: int = MAX_RETRIES) -> requests.Response:
+    """Asyncio counterpart of fetch; waits on the rate limiter without blocking the event loop."""
+    session = session or get_session()
+
+    for attempt in range(max_retries + 1):
+        await rate_limiter.wait_async(url)
+        try:
+            response = await asyncio.to_thread(session.get, url, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            delay = _retry_delay(url, attempt, max_retries, error=e)
+        else:
+            delay = _retry_delay(url, attempt, max_retries, response=response)
+            if delay is None:
+                return response
+        rate_limiter.defer(url, delay)
@@ -0,0 +1,63 @@
+"""Per-host request rate limiting shared by threads and asyncio tasks."""
+
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+# Pro Football Reference blocks clients that exceed 20 requests per minute
+DEFAULT_REQUESTS_PER_MINUTE = 10.0
+DEFAULT_JITTER_SECONDS = 2.0
+
+
+class RateLimiter:
+    """Spaces requests to each host by 60 / requests_per_minute seconds plus random jitter.
+
+    Callers wait only for the time still owed since the previous request to the
+    same host, so time spent parsing or loading counts towards the delay.
+    """
+
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                 jitter: float = DEFAULT_JITTER_SECONDS):
+        if requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {requests_per_minute}")
+        self.interval = 60.0 / requests_per_minute
+        self.jitter = jitter
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        return urlparse(url_or_host).netloc or url_or_host
+
+    def reserve(self, url_or_host: str) -> float:
+        """Claim the next request slot for a host and return the seconds to wait for it."""
+        host = self._host(url_or_host)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval + random.uniform(0, self.jitter)
+        return slot - now
+
+    def defer(self, url_or_host: str, seconds: float) -> None:
+        """Hold back every request to a host for at least the given number of seconds."""
+        host = self._host(url_or_host)
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            self._next_slot[host] = max(self._next_slot.get(host, resume_at), resume_at)
+
+    def wait(self, url_or_host: str) -> None:
+        """Block the calling thread until a request to the host is allowed."""
+        delay = self.reserve(url_or_host)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, url_or_host: str) -> None:
+        """Suspend the calling task until a request to the host is allowed."""
+        delay = self.reserve(url_or_host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+default_rate_limiter = RateLimiter()
@@ -0,0 +1,156 @@
+"""Membership index of page URLs that are already loaded into the database."""
+
+import hashlib
+import math
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+_BLOOM_MAGIC = b"NFLBLOOM"
+_BLOOM_HEADER = struct.Struct("<8sQIQQ")  # magic, bit count, hash count, capacity, items added
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings that can be saved to and loaded from disk.
+
+    Sized for capacity items at error_rate false positives. There are no false
+    negatives, so a miss always means the item was never added.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def save(self, path: str | Path) -> None:
+        """Write the filter atomically, so a crash never leaves a truncated file behind."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, self.num_bits, self.num_hashes, self.capacity, self.count))
+                f.write(self.bits)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BloomFilter":
+        data = Path(path).read_bytes()
+        magic, num_bits, num_hashes, capacity, count = _BLOOM_HEADER.unpack_from(data)
+        bits = data[_BLOOM_HEADER.size:]
+        if magic != _BLOOM_MAGIC or len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"[!] {path} is not a saved BloomFilter")
+
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.capacity = capacity
+        bloom.count = count
+        bloom.bits = bytearray(bits)
+        return bloom
+
+
+class UrlIndex:
+    """Answers "is this URL already loaded?" in O(1) without a query per check.
+
+    Without bloom_path, every URL is pulled once with load_urls and kept in a
+    hashed set. With bloom_path, startup reads the saved Bloom filter instead
+    (building and saving it from load_urls the first time). A filter miss
+    means the URL is new. A hit may be a false positive, so it is confirmed
+    once with exists(url). URLs passed to add() are remembered for the rest of
+    the run and go into the filter on the next save().
+    """
+
+    def __init__(self, load_urls: Callable[[], Iterable[str]], exists: Callable[[str], bool] | None = None,
+                 bloom_path: str | Path | None = None, error_rate: float = 0.001):
+        if bloom_path is not None and exists is None:
+            raise ValueError("[!] A Bloom filter index needs an exists() lookup to confirm hits")
+        self.load_urls = load_urls
+        self.exists = exists
+        self.bloom_path = Path(bloom_path) if bloom_path is not None else None
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._known = None
+        self._absent = set()
+        self._bloom = None
+        self._unsaved = False
+
+    def _ensure_loaded(self) -> None:
+        if self._known is not None:
+            return
+        self._known = set()
+        if self.bloom_path is None:
+            self._known.update(self.load_urls())
+            return
+
+        if self.bloom_path.exists():
+            self._bloom = BloomFilter.load(self.bloom_path)
+        # An overfull filter answers "maybe" too often, so it is rebuilt with room to grow
+        if self._bloom is None or self._bloom.count > self._bloom.capacity:
+            self._bloom = self._build_bloom()
+
+    def _build_bloom(self) -> BloomFilter:
+        urls = list(self.load_urls())
+        bloom = BloomFilter(capacity=max(100_000, 2 * len(urls)), error_rate=self.error_rate)
+        for url in urls:
+            bloom.add(url)
+        bloom.save(self.bloom_path)
+        return bloom
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            if url in self._known:
+                return True
+            if self._bloom is None or url in self._absent or url not in self._bloom:
+                return False
+        # A possible false positive; the answer is cached either way
+        found = self.exists(url)
+        with self._lock:
+            (self._known if found else self._absent).add(url)
+        return found
+
+    def add(self, url: str) -> None:
+        self.update([url])
+
+    def update(self, urls: Iterable[str]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            for url in urls:
+                if url in self._known:
+                    continue
+                self._known.add(url)
+                self._absent.discard(url)
+                if self._bloom is not None:
+                    self._bloom.add(url)
+                    self._unsaved = True
+
+    def save(self) -> None:
+        """Persist the Bloom filter with every URL added this run; a no-op without bloom_path."""
+        with self._lock:
+            if self._bloom is not None and self._unsaved:
+                self._bloom.save(self.bloom_path)
+                self._unsaved = False
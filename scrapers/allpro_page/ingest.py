@@ -6,8 +6,8 @@ from nfl_datacollector.utils import TEAM_ABR_TO_TEAM_ID_MAP
 _YEAR_RE = re.compile(r"/years/(\d{4})/")
 
 class AllProPageScraper(PageScraper):
-    def load_page(self, url: str) -> None:
-        super().load_page(url)
+    def load_html(self, url: str, html: str) -> None:
+        super().load_html(url, html)
         self.url = url
 
     def get_ap_team_votes(self) -> pd.DataFrame:
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from nfl_datacollector.ratelimit import RateLimiter, default_rate_limiter
+from .scraper import PageScraper, fetch_html_async
+from .games_page.etl import parse_game_page, game_batch_writer
+
+_DONE = object()
+
+
+class GamePageCrawler:
+    """Crawls game pages with fetch, parse and load overlapping.
+
+    Fetch tasks keep requests flowing at the rate limiter's pace while earlier
+    pages are parsed in an executor (a process pool by default) and written by
+    a single loader task, so a season is bound by the politeness limit rather
+    than by fetch + parse + DB latency. The loader task commits batch_size
+    games per transaction, or fewer once the oldest has waited batch_seconds.
+    """
+
+    def __init__(self, loader, fetch_concurrency: int = 2, parse_workers: int | None = None,
+                 queue_size: int = 16, parse_executor: Executor | None = None,
+                 rate_limiter: RateLimiter = default_rate_limiter, batch_size: int = 50,
+                 batch_seconds: float = 30.0):
+        self.loader = loader
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.fetch_concurrency = fetch_concurrency
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.parse_executor = parse_executor
+        self.rate_limiter = rate_limiter
+
+        self.loaded = []
+        self.failed = {}
+
+    def crawl(self, urls) -> list[str]:
+        """Run the crawl to completion and return the URLs that were loaded."""
+        return asyncio.run(self.run(urls))
+
+    async def run(self, urls) -> list[str]:
+        """Crawl every URL from an iterable or async iterable of game page URLs."""
+        start = time.monotonic()
+        url_queue = asyncio.Queue(self.queue_size)
+        parse_queue = asyncio.Queue(self.queue_size)
+        load_queue = asyncio.Queue(self.queue_size)
+
+        executor = self.parse_executor or ProcessPoolExecutor(self.parse_workers)
+        try:
+            fetchers = [asyncio.create_task(self._fetch_worker(url_queue, parse_queue))
+                        for _ in range(self.fetch_concurrency)]
+            parsers = [asyncio.create_task(self._parse_worker(parse_queue, load_queue, executor))
+                       for _ in range(self.parse_workers)]
+            writer = asyncio.create_task(self._load_worker(load_queue))
+
+            try:
+                await self._produce(urls, url_queue)
+            finally:
+                # Even when the URL source raises, the games already queued are parsed and written
+                await self._drain(url_queue, fetchers)
+                await self._drain(parse_queue, parsers)
+                await self._drain(load_queue, [writer])
+        finally:
+            if self.parse_executor is None:
+                executor.shutdown()
+
+        print(f'Crawl finished in {time.monotonic() - start:.0f}s: '
+              f'{len(self.loaded)} loaded, {len(self.failed)} failed')
+        return self.loaded
+
+    @staticmethod
+    async def _produce(urls, url_queue: asyncio.Queue) -> None:
+        if hasattr(urls, '__aiter__'):
+            async for url in urls:
+                await url_queue.put(url)
+        else:
+            for url in urls:
+                await url_queue.put(url)
+
+    @staticmethod
+    async def _drain(queue: asyncio.Queue, workers: list[asyncio.Task]) -> None:
+        for _ in workers:
+            await queue.put(_DONE)
+        await asyncio.gather(*workers)
+
+    async def _fetch_worker(self, url_queue: asyncio.Queue, parse_queue: asyncio.Queue) -> None:
+        while (url := await url_queue.get()) is not _DONE:
+            try:
+                html = await fetch_html_async(url, PageScraper.page_cache, self.rate_limiter)
+            except Exception as e:
+                self._fail(url, 'fetch', e)
+                continue
+            await parse_queue.put((url, html))
+
+    async def _parse_worker(self, parse_queue: asyncio.Queue, load_queue: asyncio.Queue,
+                            executor: Executor) -> None:
+        loop = asyncio.get_running_loop()
+        while (item := await parse_queue.get()) is not _DONE:
+            url, html = item
+            try:
+                frames = await loop.run_in_executor(executor, parse_game_page, url, html)
+            except Exception as e:
+                self._fail(url, 'parse', e)
+                continue
+            await load_queue.put((url, frames))
+
+    async def _load_worker(self, load_queue: asyncio.Queue) -> None:
+        # A single writer keeps inserts in order and off the event loop
+        writer = game_batch_writer(self.loader, self.batch_size, self.batch_seconds)
+        while (item := await load_queue.get()) is not _DONE:
+            await asyncio.to_thread(writer.add, *item)
+        await asyncio.to_thread(writer.flush)
+
+        self.loaded.extend(writer.written)
+        self.failed.update((url, f'load: {type(error).__name__}: {error}') for url, error in writer.failed.items())
+
+    def _fail(self, url: str, stage: str, error: Exception) -> None:
+        print(f'[!] Failed to {stage} {url}: {error}')
+        self.failed[url] = f'{stage}: {error}'
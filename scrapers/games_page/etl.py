@@ -0,0 +1,79 @@
+from typing import NamedTuple
+import pandas as pd
+from load import BatchWriter
+from .ingest import GamePageScraper
+from .transform import GamePageTransformer
+
+
+class GameFrames(NamedTuple):
+    game_info: pd.DataFrame
+    game_stats: pd.DataFrame
+    player_stats: pd.DataFrame
+    drives: pd.DataFrame
+
+
+# GameFrames fields and their tables, in write order: game_info first, the tables referencing it after
+GAME_FRAME_TABLES = {
+    'game_info': 'game_info',
+    'game_stats': 'game_stats',
+    'player_stats': 'game_player_stats',
+    'drives': 'game_drives',
+}
+
+
+def transform_game_page(scraper: GamePageScraper) -> GameFrames:
+    raw = GameFrames(
+        scraper.get_game_info(),
+        scraper.get_game_stats(),
+        scraper.get_game_player_stats(),
+        scraper.get_game_drives(),
+    )
+    return transform_game_frames(raw)
+
+
+def transform_game_frames(raw: GameFrames) -> GameFrames:
+    transformer = GamePageTransformer(raw.game_info, raw.game_stats, raw.player_stats)
+    df_game_info = transformer.transform_game_info_df()
+    df_team_stats = transformer.transform_game_stats_df()
+    df_player_stats = transformer.transform_player_stats_df()
+
+    return GameFrames(df_game_info, df_team_stats, df_player_stats, raw.drives)
+
+
+def transform_game_frames_batch(raws: list[GameFrames]) -> GameFrames:
+    """Transform the raw frames of many games with one GamePageTransformer.
+
+    The frames of all games are concatenated first, so the per-call pandas overhead of
+    renaming, splitting and type coercion is paid once per batch instead of once per
+    game. Returns one frame per table covering every game in the batch.
+    """
+    if not raws:
+        raise ValueError('[!] Cannot transform an empty batch of games')
+    combined = GameFrames(*(pd.concat(frames, ignore_index=True) for frames in zip(*raws)))
+    return transform_game_frames(combined)
+
+
+def scrape_game_page(url: str, html: str) -> GameFrames:
+    # Module-level so it can run in a process pool; returns the untransformed frames
+    scraper = GamePageScraper()
+    scraper.load_html(url, html)
+    return GameFrames(
+        scraper.get_game_info(),
+        scraper.get_game_stats(),
+        scraper.get_game_player_stats(),
+        scraper.get_game_drives(),
+    )
+
+
+def parse_game_page(url: str, html: str) -> GameFrames:
+    return transform_game_frames(scrape_game_page(url, html))
+
+
+def load_game_page(frames: GameFrames, loader) -> None:
+    # One transaction for all four tables (or for every game, when frames cover a batch)
+    loader.insert_dfs([(table_name, getattr(frames, field)) for field, table_name in GAME_FRAME_TABLES.items()])
+
+
+def game_batch_writer(loader, max_games: int = 50, max_seconds: float = 30.0, on_flush=None) -> BatchWriter:
+    """Buffer GameFrames passed to add(url, frames) and commit max_games games per transaction."""
+    return BatchWriter(loader, GAME_FRAME_TABLES, max_items=max_games, max_seconds=max_seconds, on_flush=on_flush)
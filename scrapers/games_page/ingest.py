@@ -1,8 +1,10 @@
 import pandas as pd
-import requests
 import re
+from typing import NamedTuple
 from bs4 import BeautifulSoup, Comment, Tag
-from scrapers.scraper import PageScraper
+from scrapers.scraper import PageScraper, fetch_html
+from scrapers.parsers import get_parser_backend
+from scrapers.games_page.transform import COMBINED_TEAM_STATS, split_combined_stat
 
 SEASON_WEEK_SCORES_DIV_ID = 'div_other_scores'
 SCOREBOX_DIV_ID = 'scorebox'
@@ -12,6 +14,7 @@ LINESCORE_TABLE_CLASSID = 'linescore nohover stats_table no_freeze'
 GAME_INFO_TABLE_ID = 'game_info'
 TEAM_STATS_TABLE_ID = 'team_stats'
 GAME_SUMMARIES_CLASSID = 'game_summaries'
+GAME_SUMMARY_CLASSID = 'game_summary'
 GAME_LINK_CLASSID = 'right gamelink'
 
 GENERAL_OFFENSIVE_STATS_TABLE_ID = 'player_offense'
@@ -34,38 +37,105 @@ PLAYER_GENERAL_STATS_TABLE_IDS_LIST = [GENERAL_OFFENSIVE_STATS_TABLE_ID, GENERAL
 PLAYER_ADVANCED_STATS_TABLE_IDS_LIST = [RETURN_STATS_TABLE_ID, PASSING_ADVANCED_TABLE_ID, RUSHING_ADVANCED_TABLE_ID, RECEIVING_ADVANCED_TABLE_ID, 
                                         DEFENSIVE_ADVANCED_TABLE_ID, SNAPCOUNT_HOME_TEAM_TABLE_ID, SNAPCOUNT_VISITING_TEAM_TABLE_ID]
 
+DRIVE_COLUMNS = ['team_id', 'drive_num', 'quarter', 'time_start', 'start_at', 'plays', 'time_total',
+                 'net_yds', 'end_event', 'opposing_touchdown', 'points_scored']
+DRIVE_INT_DTYPES = {'time_start': 'Int64', 'plays': 'Int64', 'time_total': 'Int64', 'net_yds': 'Int64'}
+
+# Every element GamePageScraper reads; the rest of the page is never built
+GAME_PAGE_ELEMENT_IDS = [SEASON_WEEK_SCORES_DIV_ID, SCOREBOX_DIV_ID, SCOREBOX_META_DIV_ID, LINESCORE_TABLE_CLASSID,
+                         GAME_INFO_TABLE_ID, TEAM_STATS_TABLE_ID, HOME_DRIVES_TABLE_ID, VIS_DRIVES_TABLE_ID, SCORING_TABLE_ID,
+                         *PLAYER_GENERAL_STATS_TABLE_IDS_LIST, *PLAYER_ADVANCED_STATS_TABLE_IDS_LIST]
+
+def week_index_url(week, year) -> str:
+    return f'https://www.pro-football-reference.com/years/{year}/week_{week}.htm'
+
+
 def get_urls_by_week_and_year(week, year) -> list[str]:
-    url = f'https://www.pro-football-reference.com/years/{year}/week_{week}.htm'
-    res = requests.get(url)
-    soup = BeautifulSoup(res.content, 'html.parser')
+    return get_game_urls_from_week_index(week_index_url(week, year))
+
+
+class WeekIndex(NamedTuple):
+    played: list[str]   # box score URLs of the finished games
+    scheduled: int      # every game listed for the week, finished or not
+
+
+def get_game_urls_from_week_index(url: str) -> list[str]:
+    return get_week_index(url).played
+
+
+def get_week_index(url: str) -> WeekIndex:
+    html = fetch_html(url, PageScraper.page_cache)
+    soup = get_parser_backend().parse(html)
 
-    links = []
     game_summaries = soup.find('div', class_=GAME_SUMMARIES_CLASSID)
     if not game_summaries:
         raise ValueError(f'[!] Cannot find div of class={GAME_SUMMARIES_CLASSID} at {url}')
     
-    game_links = game_summaries.find_all('td', class_=GAME_LINK_CLASSID)
-    if game_links is None:
-        raise ValueError(f'Cannot find table-data of class={GAME_LINK_CLASSID} at {url}')
-    
-    for td in game_links:
-        a_tag = td.find('a')
-        if not a_tag or not 'href' in a_tag.attrs:
-            raise ValueError(f'Cannot find link at table-data class={GAME_LINK_CLASSID}')
-        full_url = 'https://www.pro-football-reference.com' + a_tag['href']
-        links.append(full_url)
-    return links
-    
-    
-    
-    
+    summaries = game_summaries.find_all('div', class_=GAME_SUMMARY_CLASSID)
+    played = [game_url for game_url in map(_finished_game_url, summaries) if game_url]
+    return WeekIndex(played, len(summaries))
+
+
+def _finished_game_url(summary: Tag) -> str | None:
+    # A game is finished once its summary links a box score and shows both teams' scores;
+    # games still to be played list the teams with empty score cells
+    game_link = summary.find('td', class_=GAME_LINK_CLASSID)
+    a_tag = game_link.find('a') if game_link else None
+    if not a_tag or not a_tag.get('href', '').startswith('/boxscores/'):
+        return None
+    
+    scores = []
+    for row in summary.find_all('tr'):
+        if not any(a.get('href', '').startswith('/teams/') for a in row.find_all('a')):
+            continue
+        score = row.find('td', class_='right')
+        scores.append(score.get_text(strip=True) if score else '')
+    if len(scores) != 2 or not all(score.isdigit() for score in scores):
+        return None
+    return 'https://www.pro-football-reference.com' + a_tag['href']
+    
+    
+class LinescoreLine(NamedTuple):
+    team_id: str
+    quarters: tuple[int | None, ...]   # points in Q1-Q4
+    overtime: int | None               # None when the game did not go to overtime
+    total: int | None
+
+
+class Linescore(NamedTuple):
+    away: LinescoreLine
+    home: LinescoreLine
+    overtime: bool
+
+
+class ScoringPlay(NamedTuple):
+    quarter: str
+    time: str
+    seconds_remaining: int
+    team: str
+    description: str
+    vis_score: int
+    home_score: int
+    vis_score_change: int
+    home_score_change: int
+    points: int
+    scoring_team_id: str | None
+
+
 class GamePageScraper(PageScraper):
+    parse_only = tuple(GAME_PAGE_ELEMENT_IDS)
+
     def __init__(self):
         super().__init__()
         self.game_stats_df = pd.DataFrame()
         self.game_info_df = {}
         self.game_player_stats_df = pd.DataFrame()
         self.game_drives_df = pd.DataFrame()
+        self._player_stats = {}
+        self._player_stat_columns = {}
+        self._scoring_plays = None
+        self._scoring_index = None
+        self._linescore = None
         
         self.home_team_id = None
         self.away_team_id = None
@@ -74,8 +144,8 @@ class GamePageScraper(PageScraper):
         self.game_id = None
 
     
-    def load_page(self, url: str) -> None:
-        super().load_page(url)
+    def load_html(self, url: str, html: str) -> None:
+        super().load_html(url, html)
         self.game_info_df['url'] = url
         self.game_id = self._create_game_id()
  
@@ -143,34 +213,57 @@ class GamePageScraper(PageScraper):
     
     
     def _extract_team_ids(self) -> None:
+        linescore = self._get_linescore()
+        if linescore is None:
+            return
+        
+        self.home_team_id = linescore.home.team_id
+        self.away_team_id = linescore.away.team_id
+    
+    
+    def _get_linescore(self) -> 'Linescore | None':
+        # Parsed once per page; team ids, game info and game stats all read from it
+        if self._linescore is None:
+            self._linescore = self._parse_linescore()
+        return self._linescore
+    
+    
+    def _parse_linescore(self) -> 'Linescore | None':
         table = self._extract_table(LINESCORE_TABLE_CLASSID)
         if table is None:
-            return
+            return None
         
         rows = table.find('tbody').find_all('tr')
         if len(rows) != 2:
             raise ValueError(f'[!] Malformed linescore table: {len(rows)} rows found.')
         
-        away_team_row = rows[0].find_all('td')
-        home_team_row = rows[1].find_all('td')
-        
-        away_team_link = away_team_row[1].find('a')
-        home_team_link = home_team_row[1].find('a')
-        
-        if not away_team_link or not home_team_link:
-            raise ValueError(f"[!] Could not find team links in linescore table")
-        
-        away_team_href = away_team_link['href']
-        home_team_href = home_team_link['href']
-        
-        away_team_id = away_team_href.split('/')[2].split('.')[0]
-        home_team_id = home_team_href.split('/')[2].split('.')[0]
-        
-        if not away_team_id or not home_team_id:
-            raise ValueError(f"[!] Could not extract team IDs from hrefs: away='{away_team_href}', home='{home_team_href}'")
+        # Row 0 is the away team, row 1 the home team
+        lines = []
+        for i, row in enumerate(rows):
+            cells = row.find_all('td')
+            if len(cells) not in [7, 8]:
+                raise ValueError(f'[!] Malformed linescore table: {len(cells)} cells found at row {i}.')
+            
+            team_link = cells[1].find('a')
+            if not team_link:
+                raise ValueError(f"[!] Could not find team links in linescore table")
+            team_href = team_link['href']
+            team_id = team_href.split('/')[2].split('.')[0]
+            if not team_id:
+                raise ValueError(f"[!] Could not extract team ID from href: '{team_href}'")
+            
+            scores = [cells[i].get_text(strip=True) for i in range(2, len(cells))]
+            scores = [int(val) if val.isdigit() else None for val in scores]
+            lines.append(LinescoreLine(
+                team_id=team_id,
+                quarters=tuple(scores[:4]),
+                overtime=scores[4] if len(scores) == 6 else None,
+                total=scores[-1],
+            ))
         
-        self.home_team_id = home_team_id
-        self.away_team_id = away_team_id
+        # The overtime column only exists when the game went to overtime
+        overtime = len(rows[0].find_all('td')) == 8
+        return Linescore(away=lines[0], home=lines[1], overtime=overtime)
         
         
     
@@ -224,29 +317,20 @@ class GamePageScraper(PageScraper):
     
     
     def _parse_linescore_general_info(self) -> None:
-        table = self._extract_table(LINESCORE_TABLE_CLASSID)
-        if table is None:
-            raise ValueError(f'[!] Linescore table with id/class: ({GAME_INFO_TABLE_ID}) not found')
+        linescore = self._get_linescore()
+        if linescore is None:
+            raise ValueError(f'[!] Linescore table with id/class: ({LINESCORE_TABLE_CLASSID}) not found')
         
-        rows = table.find('tbody').find_all('tr')
-        if len(rows) != 2:
-            raise ValueError(f'[!] Malformed linescore table: {len(rows)} rows found.')
-    
-        
-        away_team_row = rows[0].find_all('td')
-        home_team_row = rows[1].find_all('td')
-        away_points = away_team_row[-1].get_text(strip=True)
-        home_points = home_team_row[-1].get_text(strip=True)
-        self.game_info_df['away_points'] = away_points
-        self.game_info_df['home_points'] = home_points
+        self.game_info_df['away_points'] = linescore.away.total
+        self.game_info_df['home_points'] = linescore.home.total
 
         self.game_info_df['away_team_id'] = self.away_team_id
         self.game_info_df['home_team_id'] = self.home_team_id
         
         self.game_info_df['winning_team_id'] = (
-            self.home_team_id if int(home_points) > int(away_points) else self.away_team_id
+            self.home_team_id if linescore.home.total > linescore.away.total else self.away_team_id
         )
-        self.game_info_df['overtime'] = len(away_team_row) == 8
+        self.game_info_df['overtime'] = linescore.overtime
         
         self.game_info_df['season_week'] = self.season_week
         self.game_info_df['season_year'] = self.season_year
@@ -259,53 +343,46 @@ class GamePageScraper(PageScraper):
     def _parse_team_stats_table(self) -> None:
         table = self._extract_table(TEAM_STATS_TABLE_ID)
         if table is None:
-            raise ValueError(f'[!] TeamStats table with id/class: ({GAME_INFO_TABLE_ID}) not found')
+            raise ValueError(f'[!] TeamStats table with id/class: ({TEAM_STATS_TABLE_ID}) not found')
         
         rows = table.find_all('tr')
         if not rows:
             raise ValueError('[!] Malformed TeamStats table: No rows found')
         
-        team_ids = [self.away_team_id, self.home_team_id]
+        # One pass over the rows fills a stat mapping per team, away first; combined
+        # cells like 'Rush-Yds-TDs' are split into their own columns on the way
+        team_stats = [{'team_id': self.away_team_id}, {'team_id': self.home_team_id}]
+        split_columns = []
+        for row in rows[1:]:
+            stat_name = row.find('th', {'data-stat': 'stat'}).get_text(strip=True)
+            cells = row.find_all('td')
+            for stats, cell in zip(team_stats, cells[:2]):
+                stat_val = cell.get_text(strip=True)
+                if stat_name in COMBINED_TEAM_STATS:
+                    stats.update(split_combined_stat(stat_name, stat_val))
+                else:
+                    stats[stat_name] = stat_val
+            if stat_name in COMBINED_TEAM_STATS:
+                split_columns += COMBINED_TEAM_STATS[stat_name]
         
-        self.game_stats_df = pd.DataFrame({'team_id': team_ids})
-
-        for idx, team_id in enumerate(team_ids):
-            for row in rows[1:]:
-                stat_name = row.find('th', {'data-stat': 'stat'}).get_text(strip=True)
-                stat_val = row.find_all('td')[idx].get_text(strip=True)
-                self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, stat_name] = stat_val
+        self.game_stats_df = pd.DataFrame(team_stats)
+        for column in split_columns:
+            self.game_stats_df[column] = pd.to_numeric(self.game_stats_df[column], errors='coerce')
 
 
     def _parse_linescore_stats(self) -> None:
-        table = self._extract_table(LINESCORE_TABLE_CLASSID)
-        if table is None:
-            raise ValueError(f'[!] Linescore table with id/class: ({GAME_INFO_TABLE_ID}) not found')    
-        
-        rows = table.find('tbody').find_all('tr')
-        if len(rows) != 2:
-            raise ValueError(f'[!] Malformed linescore table: {len(rows)} rows found.')
-        
-        for i, row in enumerate(rows):
-            cells = row.find_all('td')
-            if len(cells) not in [7, 8]:
-                raise ValueError(f'[!] Malformed linescore table: {len(cells)} cells found at row {i}.')
-
-            # Fix: Row 0 is away team (index 2), Row 1 is home team (index 1)
-            team_id = self.game_id.split('_')[2-i]
-            
-            scores = [cells[i].get_text(strip=True) for i in range(2, len(cells))]
-            scores = [int(val) if val.isdigit() else None for val in scores]
-
-            self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, 'points_q1'] = scores[0]
-            self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, 'points_q2'] = scores[1]
-            self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, 'points_q3'] = scores[2]
-            self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, 'points_q4'] = scores[3]
-            self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, 'points_total'] = scores[-1]
-
-            if len(scores) == 6: # Only triggers if linescore table shows overtime
-                self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, 'points_overtime'] = scores[4]
-            else:
-                self.game_stats_df.loc[self.game_stats_df['team_id'] == team_id, 'points_overtime'] = 0
+        linescore = self._get_linescore()
+        if linescore is None:
+            raise ValueError(f'[!] Linescore table with id/class: ({LINESCORE_TABLE_CLASSID}) not found')
+        
+        lines = {line.team_id: line for line in (linescore.away, linescore.home)}
+        team_lines = self.game_stats_df['team_id'].map(lines)
+        for q in range(4):
+            self.game_stats_df[f'points_q{q + 1}'] = pd.array([line.quarters[q] for line in team_lines], dtype='Int64')
+        self.game_stats_df['points_total'] = pd.array([line.total for line in team_lines], dtype='Int64')
+        self.game_stats_df['points_overtime'] = pd.array(
+            [line.overtime if linescore.overtime else 0 for line in team_lines], dtype='Int64'
+        )
     
     
     
@@ -316,38 +393,22 @@ class GamePageScraper(PageScraper):
         # Convert empty strings to null values
         if stat_value == '':
             stat_value = pd.NA
-        
-        # If player_id doesn't exist, add a new row with player_id
-        if ('player_id' not in self.game_player_stats_df.columns or 
-             player_id not in self.game_player_stats_df['player_id'].values):
-            self.game_player_stats_df = pd.concat(
-                [
-                    self.game_player_stats_df,
-                    pd.DataFrame([{'player_id': player_id, 'player_name': player_name}])
-                ],
-                ignore_index=True
-            )
 
-        # If stat_name column doesn't exist, create it (fill with NA)
-        if stat_name not in self.game_player_stats_df.columns:
-            self.game_player_stats_df[stat_name] = pd.NA
-
-        existing_value_series = self.game_player_stats_df.loc[
-            self.game_player_stats_df['player_id'] == player_id, stat_name
-        ]
+        # Records are keyed by player_id and built into game_player_stats_df once all tables are read
+        record = self._player_stats.get(player_id)
+        if record is None:
+            record = self._player_stats[player_id] = {'player_id': player_id, 'player_name': player_name}
+        self._player_stat_columns.setdefault(stat_name)
 
         # If value already exists and is not NA, validate that its the same value
-        if not existing_value_series.empty:
-            existing_value = existing_value_series.iloc[0]
-            if pd.isna(existing_value):
-                self.game_player_stats_df.loc[
-                    self.game_player_stats_df['player_id'] == player_id, stat_name
-                ] = stat_value
-            elif existing_value != stat_value:
-                raise ValueError(
-                    f"[!] Mismatched value for player_id={player_id}, stat='{stat_name}': "
-                    f"existing='{existing_value}' vs new='{stat_value}'"
-                )    
+        existing_value = record.get(stat_name, pd.NA)
+        if pd.isna(existing_value):
+            record[stat_name] = stat_value
+        elif not pd.isna(stat_value) and existing_value != stat_value:
+            raise ValueError(
+                f"[!] Mismatched value for player_id={player_id}, stat='{stat_name}': "
+                f"existing='{existing_value}' vs new='{stat_value}'"
+            )
     
     
     def _parse_player_stats_table(self, table: Tag, table_id: str) -> None:
@@ -404,6 +465,9 @@ class GamePageScraper(PageScraper):
             if table is None:
                 continue
             self._parse_player_stats_table(table, table_id)
+
+        columns = ['player_id', 'player_name', *self._player_stat_columns]
+        self.game_player_stats_df = pd.DataFrame(list(self._player_stats.values()), columns=columns)
     
     
     
@@ -411,11 +475,12 @@ class GamePageScraper(PageScraper):
     # Drives Methods
     # ---------------------------------------------
     def _parse_drives_table(self) -> None:
-        self._parse_team_drives_table(HOME_DRIVES_TABLE_ID, self.home_team_id)
-        self._parse_team_drives_table(VIS_DRIVES_TABLE_ID, self.away_team_id)
+        records = self._parse_team_drives_table(HOME_DRIVES_TABLE_ID, self.home_team_id)
+        records += self._parse_team_drives_table(VIS_DRIVES_TABLE_ID, self.away_team_id)
+        self.game_drives_df = pd.DataFrame(records, columns=DRIVE_COLUMNS).astype(DRIVE_INT_DTYPES)
     
     
-    def _parse_team_drives_table(self, table_id: str, team_id: str) -> None:
+    def _parse_team_drives_table(self, table_id: str, team_id: str) -> list[dict]:
         table = self._extract_table(table_id)
         if table is None:
             raise ValueError(f'[!] Drives table with id/class: ({table_id}) not found')
@@ -424,6 +489,7 @@ class GamePageScraper(PageScraper):
         if not rows:
             raise ValueError(f'[!] Malformed table with id={table_id}: No rows found')
         
+        records = []
         for row in rows:
             cells = row.find_all(['th', 'td'])
             if len(cells) != 8:
@@ -444,11 +510,14 @@ class GamePageScraper(PageScraper):
             }
             
             drive_data = self._check_scoring_event_new(drive_data)
-                        
-            self.game_drives_df = pd.concat([   
-                self.game_drives_df, 
-                pd.DataFrame([drive_data])
-            ], ignore_index=True)
+            
+            # Clock values are stored as seconds: time_start is the time left in the quarter
+            drive_data['time_start'] = self._clock_to_seconds(drive_data['time_start'])
+            drive_data['time_total'] = self._clock_to_seconds(drive_data['time_total'])
+            drive_data['plays'] = int(drive_data['plays']) if drive_data['plays'] else None
+            drive_data['net_yds'] = int(drive_data['net_yds']) if drive_data['net_yds'] else None
+            records.append(drive_data)
+        return records
     
     def _check_scoring_event(self, drive_data: dict) -> dict:
         table = self._extract_table(SCORING_TABLE_ID)
@@ -519,12 +588,6 @@ class GamePageScraper(PageScraper):
     
     def _check_scoring_event_new(self, drive_data: dict) -> dict:
         """New method to properly check for scoring events and calculate points based on score changes."""
-        table = self._extract_table(SCORING_TABLE_ID)
-        if table is None:
-            return drive_data
-        
-        rows = table.find('tbody').find_all('tr')
-        
         # Calculate when the drive ended
         drive_end_time = self._calculate_drive_end_time(drive_data['time_start'], drive_data['time_total'])
         drive_quarter = drive_data['quarter']
@@ -550,85 +613,108 @@ class GamePageScraper(PageScraper):
             search_quarter = str(next_quarter)
         else:
             search_quarter = drive_quarter
-                            
-        # First pass: find the matching scoring event and get its row index
-        matching_row_index = -1
-        for i, row in enumerate(rows):
-            cells = row.find_all(['th', 'td'])
-            if len(cells) < 6:
-                continue
-            
-            quarter_cell = cells[0].get_text(strip=True)
-            if quarter_cell:
-                current_quarter = quarter_cell
-            
-            score_time = cells[1].get_text(strip=True)
-            
-            # Check if this scoring event matches our drive
-            drive_end_seconds = self._time_to_seconds(drive_end_time)
-            score_time_seconds = self._time_to_seconds(score_time)
+        if search_quarter == '5':
+            search_quarter = 'OT'
+
+        play = self._get_scoring_index().get((search_quarter, self._time_to_seconds(drive_end_time)))
+        if play is not None:
+            # Check if this is an opposing touchdown
+            if play.scoring_team_id and play.scoring_team_id != drive_data['team_id']:
+                # The team that scored is different from the team that had the ball
+                drive_data['opposing_touchdown'] = True
+            else:
+                drive_data['opposing_touchdown'] = False
             
-            if search_quarter == '5':
-                search_quarter = 'OT'
-            if current_quarter == search_quarter and score_time_seconds == drive_end_seconds:
-                matching_row_index = i
-                break
+            drive_data['points_scored'] = play.points
+        else:
+            drive_data['points_scored'] = 0
+            drive_data['opposing_touchdown'] = False
+        
+        return drive_data
+    
+    
+    
+    # ---------------------------------------------
+    # Scoring Methods
+    # ---------------------------------------------
+    def get_scoring_plays(self) -> pd.DataFrame:
+        df = pd.DataFrame(self._get_scoring_plays(), columns=ScoringPlay._fields)
+        df['game_id'] = self.game_id
+        return df
+    
+    
+    def _get_scoring_index(self) -> dict[tuple[str, int], 'ScoringPlay']:
+        # (quarter, seconds remaining) -> first scoring play at that time, built once per page
+        if self._scoring_index is None:
+            self._scoring_index = {}
+            for play in self._get_scoring_plays():
+                self._scoring_index.setdefault((play.quarter, play.seconds_remaining), play)
+        return self._scoring_index
+    
+    
+    def _get_scoring_plays(self) -> list['ScoringPlay']:
+        if self._scoring_plays is not None:
+            return self._scoring_plays
         
-        if matching_row_index >= 0:
-            # Found the matching scoring event, now calculate the score change
-            matching_row = rows[matching_row_index]
-            cells = matching_row.find_all(['th', 'td'])
+        self._scoring_plays = []
+        table = self._extract_table(SCORING_TABLE_ID)
+        if table is None:
+            return self._scoring_plays
+        
+        # Quarter cells are only populated at the first row of each quarter section,
+        # so later rows inherit the current quarter.
+        current_quarter = None
+        previous_cells = None
+        for row in table.find('tbody').find_all('tr'):
+            cells = [cell.get_text(strip=True) for cell in row.find_all(['th', 'td'])]
+            if len(cells) < 6:
+                previous_cells = cells
+                continue
             
-            score_time = cells[1].get_text(strip=True)
-            vis_score = int(cells[4].get_text(strip=True) or 0)
-            home_score = int(cells[5].get_text(strip=True) or 0)
+            if cells[0]:
+                current_quarter = cells[0]
+            vis_score = int(cells[4] or 0)
+            home_score = int(cells[5] or 0)
             
-            # Find the previous scores by looking at the row before this one
+            # Score changes are measured against the row directly above
             previous_vis_score = 0
             previous_home_score = 0
+            if previous_cells is not None and len(previous_cells) >= 6 and previous_cells[4] and previous_cells[5]:
+                previous_vis_score = int(previous_cells[4])
+                previous_home_score = int(previous_cells[5])
+            previous_cells = cells
             
-            if matching_row_index > 0:
-                prev_row = rows[matching_row_index - 1]
-                prev_cells = prev_row.find_all(['th', 'td'])
-                if len(prev_cells) >= 6:
-                    prev_vis_score = prev_cells[4].get_text(strip=True)
-                    prev_home_score = prev_cells[5].get_text(strip=True)
-                    if prev_vis_score and prev_home_score:
-                        previous_vis_score = int(prev_vis_score)
-                        previous_home_score = int(prev_home_score)
-                        
-            # Calculate points based on score changes
             vis_score_change = vis_score - previous_vis_score
             home_score_change = home_score - previous_home_score
-                        
+            
             # Determine which team scored and how many points
             if vis_score_change > 0:
-                # Visiting team scored
-                points_scored = vis_score_change
-                scoring_team = self.away_team_id
+                points_scored, scoring_team = vis_score_change, self.away_team_id
             elif home_score_change > 0:
-                # Home team scored
-                points_scored = home_score_change
-                scoring_team = self.home_team_id
+                points_scored, scoring_team = home_score_change, self.home_team_id
             else:
-                # No score change
-                points_scored = 0
-                scoring_team = None
+                points_scored, scoring_team = 0, None
             
-            # Check if this is an opposing touchdown
-            if scoring_team and scoring_team != drive_data['team_id']:
-                # The team that scored is different from the team that had the ball
-                drive_data['opposing_touchdown'] = True
-            else:
-                drive_data['opposing_touchdown'] = False
-            
-            drive_data['points_scored'] = points_scored
-        else:
-            drive_data['points_scored'] = 0
-            drive_data['opposing_touchdown'] = False
-        
-        return drive_data
+            self._scoring_plays.append(ScoringPlay(
+                quarter=current_quarter,
+                time=cells[1],
+                seconds_remaining=self._time_to_seconds(cells[1]),
+                team=cells[2],
+                description=cells[3],
+                vis_score=vis_score,
+                home_score=home_score,
+                vis_score_change=vis_score_change,
+                home_score_change=home_score_change,
+                points=points_scored,
+                scoring_team_id=scoring_team,
+            ))
+        return self._scoring_plays
+    
+    
     
+    # ---------------------------------------------
+    # Time Helpers
+    # ---------------------------------------------
     def _time_to_seconds(self, time_str: str) -> int:
         """Convert time string (e.g., '2:46', '0:34') to total seconds."""
         if not time_str or time_str == '':
@@ -641,6 +727,10 @@ class GamePageScraper(PageScraper):
             return minutes * 60 + seconds
         return 0
     
+    def _clock_to_seconds(self, time_str: str) -> int | None:
+        # Unlike _time_to_seconds, a missing clock stays missing instead of becoming 0
+        return self._time_to_seconds(time_str) if time_str else None
+    
     def _calculate_drive_end_time(self, time_start: str, time_total: str) -> str:
         """Calculate the end time of a drive."""
         
@@ -691,6 +781,9 @@ class GamePageScraper(PageScraper):
             
         home_team_table = self._extract_table(SNAPCOUNT_HOME_TEAM_TABLE_ID)
         away_team_table = self._extract_table(SNAPCOUNT_VISITING_TEAM_TABLE_ID)
+        if home_team_table is None or away_team_table is None:
+            # Box scores from before snap counts were tracked have no player list
+            return []
         
         player_ids.update(_get_player_ids_from_table(home_team_table, SNAPCOUNT_HOME_TEAM_TABLE_ID))
         player_ids.update(_get_player_ids_from_table(away_team_table, SNAPCOUNT_VISITING_TEAM_TABLE_ID))
@@ -0,0 +1,71 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+import pandas as pd
+from nfl_datacollector.cache import PageCache, PageArchive
+from .etl import GameFrames, parse_game_page, scrape_game_page
+
+
+class RecordBatch(NamedTuple):
+    """Column names, dtypes and row tuples of a DataFrame; cheap to pickle between processes."""
+    columns: tuple
+    dtypes: tuple
+    rows: list
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'RecordBatch':
+        return cls(
+            tuple(df.columns),
+            tuple(str(dtype) for dtype in df.dtypes),
+            list(df.itertuples(index=False, name=None)),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        df = pd.DataFrame.from_records(self.rows, columns=list(self.columns))
+        return df.astype(dict(zip(self.columns, self.dtypes)))
+
+
+def to_record_batches(frames: GameFrames) -> GameFrames:
+    return GameFrames(*(RecordBatch.from_frame(df) for df in frames))
+
+
+def from_record_batches(batches: GameFrames) -> GameFrames:
+    return GameFrames(*(batch.to_frame() for batch in batches))
+
+
+# Each worker process opens its own page store; tar handles cannot be shared across processes
+_worker_pages = None
+
+
+def _init_worker(pages_root: str, offline: bool) -> None:
+    global _worker_pages
+    _worker_pages = PageArchive(pages_root) if offline else PageCache(pages_root)
+
+
+def _parse_stored_game_page(url: str, transform: bool = True):
+    html = _worker_pages.get(url)
+    if html is None:
+        return url, None, f'[!] Page not found in {_worker_pages.root}: {url}'
+    try:
+        parse = parse_game_page if transform else scrape_game_page
+        return url, to_record_batches(parse(url, html)), None
+    except Exception as e:
+        return url, None, f'{type(e).__name__}: {e}'
+
+
+def parse_stored_game_pages(urls, pages: PageCache, workers: int | None = None, transform: bool = True):
+    """Parse already-downloaded game pages across a process pool.
+
+    Workers read the HTML themselves and run the scraper and transformer, so
+    only URLs go out and compact record batches come back. With transform=False
+    workers only scrape, leaving the caller to transform games in batches. Yields
+    (url, GameFrames, None) or (url, None, error) in completion order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(str(pages.root), pages.offline)) as pool:
+        futures = [pool.submit(_parse_stored_game_page, url, transform) for url in urls]
+        for future in as_completed(futures):
+            url, batches, error = future.result()
+            frames = from_record_batches(batches) if batches is not None else None
+            yield url, frames, error
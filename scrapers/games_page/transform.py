@@ -1,3 +1,5 @@
+import re
+from itertools import zip_longest
 import numpy as np
 import pandas as pd
 from nfl_datacollector.utils import TEAM_ABR_TO_TEAM_ID_MAP
@@ -70,6 +72,26 @@ GAME_STATS_COL_MAP = {
 }
 
 
+# Team stats that PFR reports as one dash-separated cell, e.g. 'Cmp-Att-Yd-TD-INT' = '21-39-226-2-1'
+COMBINED_TEAM_STATS = {
+    'Rush-Yds-TDs': ['rushing_attempts', 'rushing_yards', 'rushing_touchdowns'],
+    'Cmp-Att-Yd-TD-INT': ['passing_completions', 'passing_attempts', 'passing_yards',
+                          'passing_touchdowns', 'passing_interceptions'],
+    'Sacked-Yards': ['sacks_total', 'sack_yards'],
+    'Fumbles-Lost': ['fumbles_total', 'fumbles_lost'],
+    'Penalties-Yards': ['penalties_total', 'penalty_yards'],
+    'Third Down Conv.': ['third_down_conversions', 'third_down_attempts'],
+    'Fourth Down Conv.': ['fourth_down_conversions', 'fourth_down_attempts'],
+}
+
+
+def split_combined_stat(stat_name: str, value: str) -> dict:
+    # Only a dash that follows a digit separates values, so negative yardage ('20--5-0') survives
+    columns = COMBINED_TEAM_STATS[stat_name]
+    parts = re.split(r'(?<=\d)-', value) if value else []
+    return {column: part for column, part in zip_longest(columns, parts[:len(columns)])}
+
+
 
 PLAYER_STATS_COL_MAP = {
     # Identifiers
@@ -212,6 +234,127 @@ PLAYER_STATS_COL_MAP = {
     'st_pct': 'snapcounts_special_teams_percentage',
 }
 
+
+
+# ---------------------------------------------
+# Column Types
+# ---------------------------------------------
+# Every output column is converted once to its declared type. Numbers drop '%' and
+# thousands separators (attendance '73,000'); empty cells become missing and anything else unparsable raises.
+INTEGER_DTYPES = {'Int16': np.int16, 'Int32': np.int32}
+NUMERIC_DTYPES = {'float32', *INTEGER_DTYPES}
+
+GAME_INFO_SCHEMA = {
+    'game_id': 'string',
+    'url': 'string',
+    'won_toss': 'string',
+    'roof_type': 'string',
+    'surface_type': 'string',
+    'game_duration': 'string',
+    'attendance': 'Int32',
+    'weather': 'string',
+    'vegas_line': 'string',
+    'over_under': 'string',
+    'date': 'string',
+    'start_time': 'string',
+    'stadium': 'string',
+    'overtime': 'boolean',
+    'home_team_id': 'string',
+    'away_team_id': 'string',
+    'winning_team_id': 'string',
+    'home_team_record': 'string',
+    'away_team_record': 'string',
+    'home_points': 'Int16',
+    'away_points': 'Int16',
+    'season_week': 'Int16',
+    'season_year': 'Int16',
+    'playoff_game': 'string',
+}
+
+GAME_STATS_SCHEMA = {
+    'game_id': 'string',
+    'team_id': 'string',
+    'time_of_possession': 'string',
+    **{col: 'Int16' for col in GAME_STATS_COL_MAP.values()
+       if col not in ('game_id', 'team_id', 'time_of_possession') and not col.endswith('_combined')},
+}
+
+PLAYER_STATS_STRING_COLUMNS = ['id', 'game_id', 'player_id', 'team_id', 'player_name', 'position']
+
+# Rates, averages and half sacks; every other player stat is a whole number
+PLAYER_STATS_FLOAT_COLUMNS = [
+    'pass_rating', 'pass_first_down_percentage', 'pass_target_yards_per_attempt', 'pass_air_yards_per_completion',
+    'pass_air_yds_per_att', 'pass_yards_after_catch_per_completion', 'pass_drop_percentage',
+    'pass_poor_throw_percentage', 'pass_pressured_percentage',
+    'rush_scrambles_yards_per_attempt', 'rush_yards_before_contact_per_rush', 'rush_yards_after_catch_per_rush',
+    'rush_broken_tackles_per_rush',
+    'receiving_air_yards_per_reception', 'receiving_yards_after_catch_per_reception',
+    'receiving_average_depth_of_target', 'receiving_broken_tackles_per_reception', 'receiving_drop_percentage',
+    'receiving_passer_rating',
+    'defensive_sacks', 'defensive_completion_percentage', 'defensive_completion_yards_per_completion',
+    'defensive_completion_yards_per_target', 'defensive_pass_rating', 'defensive_target_yards_per_attempt',
+    'defensive_tackles_missed_percentage',
+    'punt_yards_per_punt', 'kick_return_yards_per_return', 'punt_return_yards_per_return',
+    'snapcounts_offense_percentage', 'snapcounts_defense_percentage', 'snapcounts_special_teams_percentage',
+]
+
+PLAYER_STATS_SCHEMA = {
+    col: 'string' if col in PLAYER_STATS_STRING_COLUMNS else 'float32' if col in PLAYER_STATS_FLOAT_COLUMNS else 'Int16'
+    for col in PLAYER_STATS_COL_MAP.values()
+}
+
+
+def coerce_frame(df: pd.DataFrame, schema: dict, frame_name: str) -> pd.DataFrame:
+    undeclared = [col for col in df.columns if col not in schema]
+    if undeclared:
+        raise ValueError(f'[!] {frame_name}: no type declared for columns {undeclared}')
+
+    numeric_cols = [col for col in df.columns if schema[col] in NUMERIC_DTYPES]
+    numbers = _parse_numbers(df, numeric_cols, frame_name)
+    numeric_index = {col: i for i, col in enumerate(numeric_cols)}
+
+    columns = {}
+    for col in df.columns:
+        dtype = schema[col]
+        if dtype in NUMERIC_DTYPES:
+            columns[col] = _to_numeric_array(numbers[:, numeric_index[col]], dtype, frame_name, col)
+        else:
+            columns[col] = df[col].astype(dtype)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _parse_numbers(df: pd.DataFrame, columns: list, frame_name: str) -> np.ndarray:
+    # All numeric cells go through one Series, column by column, so the string
+    # cleaning and to_numeric run once per frame instead of once per column
+    n_rows = len(df)
+    cells = pd.Series(df[columns].to_numpy(dtype=object).ravel(order='F'), dtype=object)
+    text = cells.astype('string').str.strip().str.replace('%', '', regex=False).str.replace(',', '', regex=False)
+    text = text.replace('', pd.NA)
+    values = pd.to_numeric(text, errors='coerce')
+
+    unparsable = (values.isna() & text.notna()).to_numpy()
+    if unparsable.any():
+        bad = {columns[i // n_rows]: text.iloc[i] for i in np.flatnonzero(unparsable)}
+        raise ValueError(f'[!] {frame_name}: unexpected non-numeric values {bad}')
+
+    return values.to_numpy(dtype='float64', na_value=np.nan).reshape((n_rows, len(columns)), order='F')
+
+
+def _to_numeric_array(values: np.ndarray, dtype: str, frame_name: str, col: str):
+    if dtype == 'float32':
+        return values.astype(np.float32)
+
+    present = ~np.isnan(values)
+    whole = values[present]
+    info = np.iinfo(INTEGER_DTYPES[dtype])
+    if (whole % 1 != 0).any() or (whole < info.min).any() or (whole > info.max).any():
+        raise ValueError(f'[!] {frame_name}: {col} values {whole.tolist()} do not fit {dtype}')
+
+    data = np.zeros(len(values), dtype=INTEGER_DTYPES[dtype])
+    data[present] = whole
+    return pd.arrays.IntegerArray(data, ~present)
+
+
 class GamePageTransformer():
     def __init__(self, game_info_df, game_stats_df, player_stats_df):
         self.game_info_df = game_info_df
@@ -222,52 +365,36 @@ class GamePageTransformer():
     def transform_game_info_df(self) -> pd.DataFrame:
         self._normalize_df('game_info_df', GAME_INFO_COL_MAP)
         self._modify_game_info_features()
+        self.game_info_df = coerce_frame(self.game_info_df, GAME_INFO_SCHEMA, 'game_info')
         return self.game_info_df
     
     
     def transform_game_stats_df(self) -> pd.DataFrame:
         self._normalize_df('game_stats_df', GAME_STATS_COL_MAP)
         self._modify_game_stats_features()
+        self.game_stats_df = coerce_frame(self.game_stats_df, GAME_STATS_SCHEMA, 'game_stats')
         return self.game_stats_df
 
 
     def transform_player_stats_df(self) -> pd.DataFrame:
         self._normalize_df('player_stats_df', PLAYER_STATS_COL_MAP)
         self._modify_player_stats_features()
+        self.player_stats_df = coerce_frame(self.player_stats_df, PLAYER_STATS_SCHEMA, 'game_player_stats')
         return self.player_stats_df
     
     
     def _normalize_df(self, df_attr: str, col_map: dict) -> None:
+        # Missing columns come back empty; the schema coercion gives every column its type
         df = getattr(self, df_attr)
-        
-        for original_col, new_col in col_map.items():
-            if original_col not in df.columns:
-                df[original_col] = pd.NA
-
-        df = df.rename(columns=col_map)
-        df = df[list(col_map.values())]
-        
+        df = df.rename(columns=col_map).reindex(columns=list(col_map.values()))
         setattr(self, df_attr, df)
 
 
     def _modify_game_info_features(self) -> None:
-        attendance_value = self.game_info_df['attendance'].iloc[0]
-        
-        # --- Attendance Cleaning ---
-        if pd.notna(attendance_value):
-            # Process the single value
-            processed_value = str(attendance_value).replace(',', '')
-            if processed_value:
-                try:
-                    self.game_info_df.loc[0, 'attendance'] = int(float(processed_value))
-                except (ValueError, TypeError):
-                    self.game_info_df.loc[0, 'attendance'] = None
-            else:
-                self.game_info_df.loc[0, 'attendance'] = None
-
         # --- Playoff Game Label ---
-        season_year = self.game_info_df['season_year'].iloc[0]
-        season_week = self.game_info_df['season_week'].iloc[0]
+        # Works on any number of games, so a whole batch is labelled at once
+        season_year = self.game_info_df['season_year']
+        season_week = self.game_info_df['season_week']
 
         playoff_mapping_post2020 = {
             19: 'Wild Card',
@@ -283,102 +410,36 @@ class GamePageTransformer():
             21: 'Superbowl'
         }
 
-        playoff_game = None
-        if season_year > 2020:
-            playoff_game = playoff_mapping_post2020.get(season_week, None)
-        else:
-            playoff_game = playoff_mapping_pre2021.get(season_week, None)
-
-        self.game_info_df.loc[0, 'playoff_game'] = playoff_game
+        self.game_info_df['playoff_game'] = season_week.map(playoff_mapping_post2020).where(
+            season_year > 2020, season_week.map(playoff_mapping_pre2021)
+        )
     
     
     def _modify_game_stats_features(self) -> None:
-        # Parse rushing stats into separate columns
-        if 'rush_stats_combined' not in self.game_stats_df.columns:
-            raise ValueError("Missing expected column: 'rush_stats_combined'")
-        split_cols = self.game_stats_df['rush_stats_combined'].str.split('-', expand=True)
-        self.game_stats_df['rushing_attempts'] = pd.to_numeric(split_cols[0], errors='coerce')
-        self.game_stats_df['rushing_yards'] = pd.to_numeric(split_cols[1], errors='coerce')
-        self.game_stats_df['rushing_touchdowns'] = pd.to_numeric(split_cols[2], errors='coerce')
-        self.game_stats_df = self.game_stats_df.drop(columns=['rush_stats_combined'])
-
-        # Parse passing stats into separate columns
-        if 'passing_stats_combined' not in self.game_stats_df.columns:
-            raise ValueError("Missing expected column: 'passing_stats_combined'")
-        split_cols = self.game_stats_df['passing_stats_combined'].str.split('-', expand=True)
-        self.game_stats_df['passing_attempts'] = pd.to_numeric(split_cols[0], errors='coerce')
-        self.game_stats_df['passing_completions'] = pd.to_numeric(split_cols[1], errors='coerce')
-        self.game_stats_df['passing_yards'] = pd.to_numeric(split_cols[2], errors='coerce')
-        self.game_stats_df['passing_touchdowns'] = pd.to_numeric(split_cols[3], errors='coerce')
-        self.game_stats_df['passing_interceptions'] = pd.to_numeric(split_cols[4], errors='coerce')
-        self.game_stats_df = self.game_stats_df.drop(columns=['passing_stats_combined'])
-
-        # Parse sack stats into separate columns
-        if 'sack_stats_combined' not in self.game_stats_df.columns:
-            raise ValueError("Missing expected column: 'sack_stats_combined'")
-        split_cols = self.game_stats_df['sack_stats_combined'].str.split('-', expand=True)
-        self.game_stats_df['sacks_total'] = pd.to_numeric(split_cols[0], errors='coerce')
-        self.game_stats_df['sack_yards'] = pd.to_numeric(split_cols[1], errors='coerce')
-        self.game_stats_df = self.game_stats_df.drop(columns=['sack_stats_combined'])
-
-        # Parse fumble stats into separate columns
-        if 'fumble_stats_combined' not in self.game_stats_df.columns:
-            raise ValueError("Missing expected column: 'fumble_stats_combined'")
-        split_cols = self.game_stats_df['fumble_stats_combined'].str.split('-', expand=True)
-        self.game_stats_df['fumbles_total'] = pd.to_numeric(split_cols[0], errors='coerce')
-        self.game_stats_df['fumbles_lost'] = pd.to_numeric(split_cols[1], errors='coerce')
-        self.game_stats_df = self.game_stats_df.drop(columns=['fumble_stats_combined'])
-
-        # Parse penalty stats into separate columns
-        if 'penalty_stats_combined' not in self.game_stats_df.columns:
-            raise ValueError("Missing expected column: 'penalty_stats_combined'")
-        split_cols = self.game_stats_df['penalty_stats_combined'].str.split('-', expand=True)
-        self.game_stats_df['penalties_total'] = pd.to_numeric(split_cols[0], errors='coerce')
-        self.game_stats_df['penalty_yards'] = pd.to_numeric(split_cols[1], errors='coerce')
-        self.game_stats_df = self.game_stats_df.drop(columns=['penalty_stats_combined'])
-
-        # Parse third down stats into separate columns
-        if 'third_down_stats_combined' not in self.game_stats_df.columns:
-            raise ValueError("Missing expected column: 'third_down_stats_combined'")
-        split_cols = self.game_stats_df['third_down_stats_combined'].str.split('-', expand=True)
-        self.game_stats_df['third_down_conversions'] = pd.to_numeric(split_cols[0], errors='coerce')
-        self.game_stats_df['third_down_attempts'] = pd.to_numeric(split_cols[1], errors='coerce')
-        self.game_stats_df = self.game_stats_df.drop(columns=['third_down_stats_combined'])
-
-        # Parse fourth down stats into separate columns
-        if 'fourth_down_stats_combined' not in self.game_stats_df.columns:
-            raise ValueError("Missing expected column: 'fourth_down_stats_combined'")
-        split_cols = self.game_stats_df['fourth_down_stats_combined'].str.split('-', expand=True)
-        self.game_stats_df['fourth_down_conversions'] = pd.to_numeric(split_cols[0], errors='coerce')
-        self.game_stats_df['fourth_down_attempts'] = pd.to_numeric(split_cols[1], errors='coerce')
-        self.game_stats_df = self.game_stats_df.drop(columns=['fourth_down_stats_combined'])
-
-
-    def _modify_player_stats_features(self) -> None:    
-        for col in self.player_stats_df.columns:
-            col_data = self.player_stats_df[col]
-
-            if col_data.dtype == object or pd.api.types.is_string_dtype(col_data):
-                col_str = col_data.astype(str)
-
-                if col_str.str.contains('%').any():
-                    col_str = col_str.str.replace('%', '', regex=False)
-
-                col_str = col_str.replace({'': np.nan, '<NA>': np.nan, 'nan': np.nan})
-
-                self.player_stats_df[col] = col_str.infer_objects(copy=False)
-
-            try:
-                self.player_stats_df[col] = self.player_stats_df[col].astype(float)
-            except (ValueError, TypeError):
-                pass
-
-                
+        # GamePageScraper already splits the combined stats; only frames that still
+        # carry the combined strings are split here
+        for stat_name, columns in COMBINED_TEAM_STATS.items():
+            combined_col = GAME_STATS_COL_MAP[stat_name]
+            combined = self.game_stats_df[combined_col]
+            if combined.notna().any():
+                split = pd.DataFrame(
+                    [split_combined_stat(stat_name, value) if pd.notna(value) else {} for value in combined],
+                    columns=columns, index=self.game_stats_df.index,
+                )
+                for column in columns:
+                    self.game_stats_df[column] = pd.to_numeric(split[column], errors='coerce')
+        
+        combined_cols = [GAME_STATS_COL_MAP[stat_name] for stat_name in COMBINED_TEAM_STATS]
+        self.game_stats_df = self.game_stats_df.drop(columns=combined_cols)
+
+
+    def _modify_player_stats_features(self) -> None:
+        # Numeric columns, including '%' values, are parsed by the PLAYER_STATS_SCHEMA coercion
         self.player_stats_df.dropna(subset=['team_id'], inplace=True)
-        self.player_stats_df['team_id'] = self.player_stats_df['team_id'].apply(
-            lambda x: TEAM_ABR_TO_TEAM_ID_MAP.get(x, x) if x not in TEAM_ABR_TO_TEAM_ID_MAP.values() else x
-        )
+        # Abbreviations become team ids; values that already are team ids are kept
+        team_ids = self.player_stats_df['team_id']
+        mapped = team_ids.map(TEAM_ABR_TO_TEAM_ID_MAP)
+        keep = team_ids.isin(list(TEAM_ABR_TO_TEAM_ID_MAP.values())) | mapped.isna()
+        self.player_stats_df['team_id'] = team_ids.where(keep, mapped)
         
         self.player_stats_df['id'] = self.player_stats_df['player_id'] + '_' + self.player_stats_df['game_id']
-         
-        self.player_stats_df = self.player_stats_df.convert_dtypes()
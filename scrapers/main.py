@@ -1,8 +1,20 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import requests
 from nfl_datacollector.utils import TEAM_ID_TO_CITY_MAP
+from nfl_datacollector.cache import PageArchive, current_season, page_ttl
+from nfl_datacollector.frontier import CrawlFrontier, FAILED, LOADED, PARSED
 
-from .games_page.ingest import get_urls_by_week_and_year, GamePageScraper
-from .games_page.transform import GamePageTransformer
-from load import get_all_db_game_urls, get_all_db_player_urls
+from .scraper import PageScraper, fetch_html
+from .games_page.ingest import (get_urls_by_week_and_year, get_game_urls_from_week_index, get_week_index,
+                                week_index_url, GamePageScraper)
+from .games_page.etl import (transform_game_page, transform_game_frames, transform_game_frames_batch,
+                             scrape_game_page, load_game_page, game_batch_writer)
+from .games_page.parallel import parse_stored_game_pages
+from .crawler import GamePageCrawler
+from .pipeline import Pipeline, Stage
 
 from .team_page.ingest import TeamPageScraper
 from .team_page.transform import transform_season_team_info_df
@@ -14,12 +26,32 @@ from .season_page.transform import transform_season_info_df
 
 from .allpro_page.ingest import AllProPageScraper
 
+@contextmanager
+def replay_from(archive_path):
+    # Every ETL_* entry point run inside this block reads pages from the archive only
+    previous_cache = PageScraper.page_cache
+    PageScraper.page_cache = PageArchive(archive_path)
+    try:
+        yield PageScraper.page_cache
+    finally:
+        PageScraper.page_cache = previous_cache
+
+
+# Frontier job of player profiles harvested from ingested game pages
+PLAYER_PROFILES_JOB = 'players:harvested'
+# Frontier job recording the game pages whose players were queued; loaded means harvested
+HARVESTED_GAMES_JOB = 'games:harvested'
+
+
+def player_profile_urls(scraper: GamePageScraper) -> list[str]:
+    player_ids = sorted(scraper.extract_player_ids_from_game_page())
+    return [f'https://www.pro-football-reference.com/players/{player_id[0]}/{player_id}.htm' for player_id in player_ids]
+
+
 def extract_player_urls_from_game_page(url):
     scraper = GamePageScraper()
     scraper.load_page(url)
-    player_ids = scraper.extract_player_ids_from_game_page()
-    urls = [f'https://www.pro-football-reference.com/players/{player_id[0]}/{player_id}.htm' for player_id in player_ids]
-    return urls
+    return player_profile_urls(scraper)
 
 
 def extract_game_links_from_team_page(url):
@@ -36,50 +68,292 @@ def extract_team_links_from_season_page(url):
     return team_links
     
     
-def ETL_games_season_year(year: int, loader):
-    logged_urls = get_all_db_game_urls(loader)
-    years = ['1','2','3','4','5','6','7','8','9','10','11','12','13','14','15','16','17','18','19','20','21']
+def season_weeks(year: int) -> list[str]:
+    weeks = ['1','2','3','4','5','6','7','8','9','10','11','12','13','14','15','16','17','18','19','20','21']
     if year > 2020:
-        years.append('22')
-    for week in years:
-        game_urls = get_urls_by_week_and_year(week, year)
+        weeks.append('22')
+    return weeks
+
+
+def _expand_listings(frontier: CrawlFrontier, listing_urls, listing_job: str, job: str, extract) -> None:
+    # Adds the URLs each listing page links to into job. Listing pages that can no longer
+    # change (page_ttl is None) are marked loaded, so a resumed run does not fetch them again.
+    frontier.add(listing_urls, listing_job)
+    for listing_url in listing_urls:
+        if frontier.status(listing_url, listing_job) == LOADED:
+            continue
+        try:
+            frontier.add(extract(listing_url), job)
+        except Exception as e:
+            print(f'[!] Failed to read {listing_url}: {e}')
+            frontier.mark(listing_url, listing_job, FAILED, e)
+            continue
+        frontier.mark(listing_url, listing_job, LOADED if page_ttl(listing_url) is None else PARSED)
+
+
+def _record_flush(frontier: CrawlFrontier, job: str):
+    def on_flush(written, failed):
+        frontier.mark_many(written, job, LOADED)
+        for url, error in failed.items():
+            frontier.mark(url, job, FAILED, error)
+    return on_flush
+
+
+def _load_pending_games(job: str, loader, frontier: CrawlFrontier, batch_size: int = 50) -> dict:
+    # Scrapes and loads every game of job that the frontier has not loaded yet. Games already in
+    # game_info are marked loaded without being fetched. Returns the games of job that failed.
+    logged_urls = loader.get_url_index('game_info')
+    with game_batch_writer(loader, max_games=batch_size, on_flush=_record_flush(frontier, job)) as writer:
+        for url in frontier.pending(job):
+            if url in logged_urls:
+                print(f'{url} already logged. Skipping')
+                frontier.mark(url, job, LOADED)
+                continue
+            try:
+                ETL_game_page(url, loader, writer, frontier, job)
+            except Exception as e:
+                print(f'[!] Failed to scrape {url}: {e}')
+                frontier.mark(url, job, FAILED, e)
+    logged_urls.save()
+    return frontier.failed(job)
+
+
+def ETL_games_season_year(year: int, loader, batch_size: int = 50, frontier: CrawlFrontier | None = None):
+    # With a persistent frontier an interrupted run picks up where it stopped: week indexes
+    # that were read are not fetched again and only games not yet loaded are scraped.
+    # Returns the games that failed; frontier.retry_failed(f'games:{year}') queues them again.
+    frontier = frontier or CrawlFrontier(':memory:')
+    job = f'games:{year}'
+    week_urls = [week_index_url(week, year) for week in season_weeks(year)]
+    _expand_listings(frontier, week_urls, f'{job}:weeks', job, get_game_urls_from_week_index)
+    return _load_pending_games(job, loader, frontier, batch_size)
+
+
+def ETL_games_since_last_run(loader, season_year: int | None = None, batch_size: int = 50,
+                             frontier: CrawlFrontier | None = None, max_attempts: int | None = 3) -> dict:
+    """Load the games of the season played since the last run.
+
+    Week indexes are read in order (from the page cache while it is fresh).
+    A week is complete when game_info holds as many of its games as its index
+    lists, and complete weeks are skipped. The finished games of every other
+    week are added to the games:{season_year} job of the frontier. Reading
+    stops at the first week with no finished game, or whose index is not
+    published yet. Every game of the job that is not loaded yet is then
+    scraped, including games left pending by earlier runs. Failed games that
+    were tried fewer than max_attempts times are retried.
+    """
+    season_year = season_year or current_season()
+    loaded_weeks = loader.get_loaded_weeks(season_year)
+
+    frontier = frontier or CrawlFrontier(':memory:')
+    job = f'games:{season_year}'
+    if max_attempts:
+        frontier.retry_failed(job, max_attempts)
+    for week in season_weeks(season_year):
+        try:
+            week_index = get_week_index(week_index_url(week, season_year))
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            print(f'[!] Week {week} of {season_year} is not published yet')
+            break
+        except ValueError as e:
+            print(f'[!] Week {week} of {season_year} has no games yet: {e}')
+            break
+        if not week_index.played:
+            break
+        if loaded_weeks.get(int(week), 0) >= week_index.scheduled:
+            continue
+        frontier.add(week_index.played, job)
+    return _load_pending_games(job, loader, frontier, batch_size)
+
+
+def ETL_incremental_update(loader, season_year: int | None = None, frontier: CrawlFrontier | None = None) -> dict:
+    # The weekly in-season update: new games, then the season and team pages whose data changed
+    season_year = season_year or current_season()
+    failed = ETL_games_since_last_run(loader, season_year, frontier=frontier)
+    ETL_season_info_by_year(season_year, loader, refresh=True)
+    ETL_season_team_info_by_year(season_year, loader, refresh=True)
+    return failed
+
+
+def ETL_games_season_year_and_week(year: int, week: int, loader, batch_size: int = 50):
+    logged_urls = loader.get_url_index('game_info')
+    game_urls = get_urls_by_week_and_year(week, year)
+    with game_batch_writer(loader, max_games=batch_size) as writer:
         for url in game_urls:
             if url not in logged_urls:
-                ETL_game_page(url, loader)
+                ETL_game_page(url, loader, writer)
             else:
                 print(f'{url} already logged. Skipping')
+    logged_urls.save()
+    return writer.failed
 
 
-def ETL_games_season_year_and_week(year: int, week: int, loader):
-    logged_urls = get_all_db_game_urls(loader)
-    game_urls = get_urls_by_week_and_year(week, year)
-    for url in game_urls:
-        if url not in logged_urls:
-            ETL_game_page(url, loader)
-        else:
-            print(f'{url} already logged. Skipping')
+async def _unlogged_game_urls(year: int, logged_urls):
+    for week in season_weeks(year):
+        game_urls = await asyncio.to_thread(get_urls_by_week_and_year, week, year)
+        for url in game_urls:
+            if url not in logged_urls:
+                yield url
+            else:
+                print(f'{url} already logged. Skipping')
+
+
+def ETL_games_season_year_async(year: int, loader, fetch_concurrency: int = 2, parse_workers: int | None = None):
+    logged_urls = loader.get_url_index('game_info')
+    crawler = GamePageCrawler(loader, fetch_concurrency=fetch_concurrency, parse_workers=parse_workers)
+    crawler.crawl(_unlogged_game_urls(year, logged_urls))
+    logged_urls.save()
+    return crawler
+
+
+def _fetch_game_page(url):
+    return url, fetch_html(url, PageScraper.page_cache)
+
+
+def _scrape_fetched_game_page(page):
+    return scrape_game_page(*page)
+
+
+def ETL_game_pages_pipeline(urls, loader, fetch_workers: int = 2, parse_workers: int | None = None,
+                            transform_workers: int = 1, queue_size: int = 16, report_every: float | None = 60,
+                            batch_size: int = 50):
+    parse_workers = parse_workers or os.cpu_count() or 1
+    # The single load worker buffers games and commits batch_size of them per transaction
+    with ProcessPoolExecutor(parse_workers) as parse_pool, \
+            game_batch_writer(loader, max_games=batch_size) as writer:
+        pipeline = Pipeline([
+            Stage('fetch', _fetch_game_page, workers=fetch_workers),
+            Stage('parse', _scrape_fetched_game_page, workers=parse_workers, executor=parse_pool),
+            Stage('transform', transform_game_frames, workers=transform_workers),
+            Stage('load', lambda frames: writer.add(frames.game_info['url'].iloc[0], frames)),
+        ], queue_size=queue_size, report_every=report_every)
+        pipeline.run(urls)
+    # Games the writer could not commit passed the load stage, but were never written
+    load_stats = pipeline.stats['load']
+    for url, error in writer.failed.items():
+        print(f'[!] load failed for {url}: {error}')
+        load_stats.processed -= 1
+        load_stats.failed += 1
+        load_stats.errors.append(('load', url, error))
+    return pipeline
+
+
+def _iter_unlogged_game_urls(year: int, logged_urls):
+    for week in season_weeks(year):
+        for url in get_urls_by_week_and_year(week, year):
+            if url not in logged_urls:
+                yield url
+            else:
+                print(f'{url} already logged. Skipping')
 
 
-def ETL_game_page(url, loader):
+def ETL_games_season_year_pipeline(year: int, loader, **pipeline_options):
+    logged_urls = loader.get_url_index('game_info')
+    pipeline = ETL_game_pages_pipeline(_iter_unlogged_game_urls(year, logged_urls), loader, **pipeline_options)
+    logged_urls.save()
+    return pipeline
+
+
+def ETL_reparse_stored_game_pages(loader, archive_path=None, workers: int | None = None,
+                                  batch_size: int = 64) -> dict:
+    # Re-parses every downloaded box score in a process pool, then transforms and loads
+    # the scraped games batch_size at a time
+    pages = PageArchive(archive_path) if archive_path else PageScraper.page_cache
+    urls = [url for url in pages.iter_urls() if '/boxscores/' in url]
+    failed = {}
+    batch = []
+    for url, frames, error in parse_stored_game_pages(urls, pages, workers, transform=False):
+        if error:
+            print(f'[!] Failed to parse {url}: {error}')
+            failed[url] = error
+            continue
+        batch.append((url, frames))
+        if len(batch) >= batch_size:
+            _load_game_batch(batch, loader, failed)
+            batch = []
+    if batch:
+        _load_game_batch(batch, loader, failed)
+    print(f'Re-parsed {len(urls) - len(failed)} of {len(urls)} stored game pages')
+    return failed
+
+
+def _load_game_batch(batch: list, loader, failed: dict) -> None:
+    try:
+        load_game_page(transform_game_frames_batch([raw for _, raw in batch]), loader)
+    except Exception as e:
+        # One bad game fails the whole batch (and rolls back its transaction); redo it game by game to isolate it
+        print(f'[!] Batch failed ({e}), transforming and loading {len(batch)} games one at a time')
+        for url, raw in batch:
+            try:
+                load_game_page(transform_game_frames(raw), loader)
+            except Exception as game_error:
+                print(f'[!] Failed to transform or load {url}: {game_error}')
+                failed[url] = f'{type(game_error).__name__}: {game_error}'
+        return
+    print(f'Re-parsed and inserted {len(batch)} games')
+
+
+def ETL_game_page(url, loader, writer=None, frontier: CrawlFrontier | None = None, job: str | None = None):
+    # With a game_batch_writer the game is buffered and committed with the rest of its batch.
+    # With a persistent frontier the players on the page are queued for ETL_pending_player_profiles;
+    # an in-memory one would lose them when the run ends. The game's progress is recorded under
+    # job when one is given.
     print('Scraping and inserting for:', url)
     scraper = GamePageScraper()
     scraper.load_page(url)
+    frames = transform_game_page(scraper)
+    if frontier is not None and frontier.persistent:
+        try:
+            frontier.add(player_profile_urls(scraper), PLAYER_PROFILES_JOB)
+            # Also recorded when the page lists no players, so it is not read again for them
+            frontier.add([url], HARVESTED_GAMES_JOB)
+            frontier.mark(url, HARVESTED_GAMES_JOB, LOADED)
+        except Exception as e:
+            # A malformed player list stays unharvested; the game itself is still loaded
+            print(f'[!] Could not harvest player ids from {url}: {e}')
+    if frontier is not None and job is not None:
+        # Before the writer sees the game, since a flush marks it loaded or failed
+        frontier.mark(url, job, PARSED)
+    if writer is None:
+        load_game_page(frames, loader)
+        if frontier is not None and job is not None:
+            frontier.mark(url, job, LOADED)
+    else:
+        writer.add(url, frames)
     
-    df_game_info = scraper.get_game_info()
-    df_team_stats = scraper.get_game_stats()
-    df_player_stats = scraper.get_game_player_stats()
-    df_game_drives = scraper.get_game_drives()
-    
-    transformer = GamePageTransformer(df_game_info, df_team_stats, df_player_stats)
-    df_game_info = transformer.transform_game_info_df()
-    df_team_stats = transformer.transform_game_stats_df()
-    df_player_stats = transformer.transform_player_stats_df()
-    
-    loader.insert_game_info_df(df_game_info)
-    loader.insert_game_team_stats_df(df_team_stats)
-    loader.insert_game_player_stats_df(df_player_stats)
-    loader.insert_game_drives_df(df_game_drives)
-    
+
+def ETL_player_profiles_by_year(season_year: int, loader, frontier: CrawlFrontier | None = None):
+    # Queues the players of every game of the season that has not been harvested, then crawls
+    # the queue. Games whose players ETL_game_page queued into the same frontier are not fetched again.
+    frontier = frontier or CrawlFrontier(':memory:')
+    job = f'players:{season_year}'
+    team_urls = [f'https://www.pro-football-reference.com/teams/{team}/{season_year}.htm'
+                 for team in TEAM_ID_TO_CITY_MAP]
+    _expand_listings(frontier, team_urls, f'{job}:teams', f'{job}:games', extract_game_links_from_team_page)
+    _expand_listings(frontier, frontier.pending(f'{job}:games'), HARVESTED_GAMES_JOB, PLAYER_PROFILES_JOB,
+                     extract_player_urls_from_game_page)
+    return ETL_pending_player_profiles(loader, frontier)
+
+
+def ETL_pending_player_profiles(loader, frontier: CrawlFrontier):
+    # Profiles of every player harvested from game pages; no game page is fetched here
+    logged_urls = loader.get_url_index('player_profiles')
+    for player_url in frontier.pending(PLAYER_PROFILES_JOB):
+        if player_url in logged_urls:
+            print(f'{player_url} already logged. Skipping')
+        else:
+            try:
+                ETL_player_profile(player_url, loader)
+            except Exception as e:
+                print(f'[!] Failed to scrape {player_url}: {e}')
+                frontier.mark(player_url, PLAYER_PROFILES_JOB, FAILED, e)
+                continue
+        frontier.mark(player_url, PLAYER_PROFILES_JOB, LOADED)
+    logged_urls.save()
+    return frontier.failed(PLAYER_PROFILES_JOB)
+
 
 def ETL_player_profile(url, loader):
     print('Scraping and inserting for:', url)
@@ -89,22 +363,26 @@ def ETL_player_profile(url, loader):
     loader.insert_player_profile_df(player_profile_df)
     
     
-def ETL_season_team_info(url, loader):
+def ETL_season_team_info(url, loader, refresh: bool = False):
+    # refresh overwrites the stored row, but only when the page's data changed since the last run
     print('Scraping and inserting for:', url)
     team_page = TeamPageScraper()
     team_page.load_page(url)
     season_team_info_df = team_page.get_team_info()
     season_team_info_df = transform_season_team_info_df(season_team_info_df)
-    loader.insert_season_team_info_df(season_team_info_df)
+    if refresh:
+        loader.refresh_page(url, [('season_team_info', season_team_info_df)])
+    else:
+        loader.insert_season_team_info_df(season_team_info_df)
 
-def ETL_season_team_info_by_year(season_year: int, loader):
+def ETL_season_team_info_by_year(season_year: int, loader, refresh: bool = False):
     team_ids = list(TEAM_ID_TO_CITY_MAP.keys())
     for team_id in team_ids:
         url = f'https://www.pro-football-reference.com/teams/{team_id}/{season_year}.htm'
-        ETL_season_team_info(url, loader)
+        ETL_season_team_info(url, loader, refresh)
     
     
-def ETL_season_info_by_year(season_year: int, loader):
+def ETL_season_info_by_year(season_year: int, loader, refresh: bool = False):
     scraper = SeasonPageScraper()
     url = f'https://www.pro-football-reference.com/years/{season_year}/'
     scraper.load_page(url)
@@ -114,8 +392,12 @@ def ETL_season_info_by_year(season_year: int, loader):
     
     df_season_info = transform_season_info_df(df_season_info)
     
-    loader.insert_season_info_df(df_season_info)
-    loader.insert_season_team_seeds_df(df_season_team_seeds)
+    if refresh:
+        # Seeds first: season_info references them
+        loader.refresh_page(url, [('season_team_seeds', df_season_team_seeds), ('season_info', df_season_info)])
+    else:
+        loader.insert_season_info_df(df_season_info)
+        loader.insert_season_team_seeds_df(df_season_team_seeds)
 
 
 def ETL_season_and_team_info_by_year(season_year: int, loader):
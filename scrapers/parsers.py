@@ -0,0 +1,191 @@
+from bs4 import BeautifulSoup, Comment
+from bs4.filter import ElementFilter
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+DEFAULT_PARSER = 'lxml'
+
+
+# ---------------------------------------------
+# BeautifulSoup Backends
+# ---------------------------------------------
+class SoupBackend:
+    def __init__(self, features: str):
+        self.features = features
+
+    def parse(self, html: str, parse_only: 'ElementStrainer | None' = None) -> BeautifulSoup:
+        return BeautifulSoup(html, self.features, parse_only=parse_only)
+
+    def comments(self, doc: BeautifulSoup):
+        return doc.find_all(string=lambda text: isinstance(text, Comment))
+
+
+class ElementStrainer(ElementFilter):
+    """Tells BeautifulSoup to build only the tables and divs a scraper needs.
+
+    A table or div is kept, with its whole subtree, when its id, full class
+    attribute or one of its classes is in keys. Everything else is skipped
+    while parsing, except HTML comments that may hold one of the wanted
+    elements, so the comment index can parse them with the same strainer.
+    """
+
+    def __init__(self, keys, tag_names=('table', 'div')):
+        super().__init__()
+        self.keys = frozenset(keys)
+        self.tag_names = frozenset(tag_names)
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix, name: str, attrs) -> bool:
+        if name not in self.tag_names or not attrs:
+            return False
+        if attrs.get('id') in self.keys:
+            return True
+        classes = attrs.get('class')
+        if not classes:
+            return False
+        if isinstance(classes, str):
+            classes = classes.split()
+        return ' '.join(classes) in self.keys or not self.keys.isdisjoint(classes)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return self.may_contain_element(string)
+
+    def may_contain_element(self, markup: str) -> bool:
+        return ('<table' in markup or '<div' in markup) and any(key in markup for key in self.keys)
+
+
+# ---------------------------------------------
+# Selectolax (lexbor) Backend
+# ---------------------------------------------
+class LexborBackend:
+    """Parses with lexbor and exposes nodes through a BeautifulSoup-compatible subset.
+
+    Only the calls used by PageScraper and GamePageScraper are supported, so
+    this backend is meant for the game page path.
+    """
+
+    def parse(self, html: str, parse_only: 'ElementStrainer | None' = None) -> 'LexborTag':
+        # lexbor always builds the whole tree; it is fast enough that straining would not pay off
+        if LexborHTMLParser is None:
+            raise ImportError("The 'selectolax' parser backend requires: pip install selectolax")
+        return LexborTag(LexborHTMLParser(html).root)
+
+    def comments(self, doc: 'LexborTag'):
+        return [node.comment_content for node in doc.node.traverse(include_text=True) if node.is_comment_node]
+
+
+class LexborTag:
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def name(self) -> str:
+        return self.node.tag
+
+    @property
+    def attrs(self) -> dict:
+        attrs = dict(self.node.attributes)
+        if 'class' in attrs:
+            attrs['class'] = (attrs['class'] or '').split()
+        return attrs
+
+    def get(self, key: str, default=None):
+        attributes = self.node.attributes
+        if key not in attributes:
+            return default
+        if key == 'class':
+            return (attributes[key] or '').split()
+        # Valueless attributes come back as None from lexbor and as '' from BeautifulSoup
+        return attributes[key] or ''
+
+    def __getitem__(self, key: str):
+        if key not in self.node.attributes:
+            raise KeyError(key)
+        return self.get(key)
+
+    def has_attr(self, key: str) -> bool:
+        return key in self.node.attributes
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __str__(self) -> str:
+        return self.node.html
+
+    __repr__ = __str__
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        strings = (node.text(deep=False) for node in self.node.traverse(include_text=True) if node.is_text_node)
+        if strip:
+            strings = (text.strip() for text in strings)
+            strings = (text for text in strings if text)
+        return separator.join(strings)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    def find(self, name=None, attrs=None, recursive: bool = True, **kwargs) -> 'LexborTag | None':
+        for tag in self._iter_matches(name, attrs, recursive, kwargs):
+            return tag
+        return None
+
+    def find_all(self, name=None, attrs=None, recursive: bool = True, **kwargs) -> list['LexborTag']:
+        return list(self._iter_matches(name, attrs, recursive, kwargs))
+
+    def _iter_matches(self, name, attrs, recursive: bool, kwargs: dict):
+        filters = dict(attrs or {})
+        if 'class_' in kwargs:
+            filters['class'] = kwargs.pop('class_')
+        filters.update(kwargs)
+        names = {name} if isinstance(name, str) else set(name) if name else None
+
+        if recursive:
+            # css() also returns the node itself, which find_all() never does
+            nodes = self.node.css(', '.join(sorted(names)) if names else '*')
+            nodes = (node for node in nodes if node.mem_id != self.node.mem_id)
+        else:
+            nodes = (node for node in self.node.iter() if names is None or node.tag in names)
+
+        for node in nodes:
+            if _matches_attrs(node, filters):
+                yield LexborTag(node)
+
+
+def _matches_attrs(node, filters: dict) -> bool:
+    attributes = node.attributes
+    for key, expected in filters.items():
+        if expected is True:
+            if key not in attributes:
+                return False
+            continue
+
+        value = attributes.get(key)
+        if value is None:
+            return False
+        if key == 'class':
+            # Matches the whole class attribute or any single class, like BeautifulSoup's class_
+            if value != expected and expected not in value.split():
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+PARSER_BACKENDS = {
+    'lxml': SoupBackend('lxml'),
+    'html.parser': SoupBackend('html.parser'),
+    'selectolax': LexborBackend(),
+}
+
+
+def get_parser_backend(name: str = DEFAULT_PARSER):
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f'Unknown parser backend: {name}. Choose one of {sorted(PARSER_BACKENDS)}')
+    return PARSER_BACKENDS[name]
@@ -0,0 +1,163 @@
+import queue
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One step of a Pipeline.
+
+    Each of the stage's workers is a thread. When an executor is given (e.g. a
+    ProcessPoolExecutor for CPU-bound parsing) the threads hand each item to it
+    and wait for the result, so the executor's workers do the actual work.
+    Returning None from fn drops the item.
+    """
+    name: str
+    fn: Callable
+    workers: int = 1
+    executor: Executor | None = None
+
+
+@dataclass
+class StageStats:
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    starved_seconds: float = 0.0   # waiting on the upstream queue
+    blocked_seconds: float = 0.0   # waiting on a full downstream queue (backpressure)
+    max_queue_depth: int = 0
+    errors: list = field(default_factory=list)
+
+    def summary(self, name: str) -> str:
+        return (f'{name:<10} processed={self.processed:<5} failed={self.failed:<3} '
+                f'busy={self.busy_seconds:7.1f}s starved={self.starved_seconds:7.1f}s '
+                f'blocked={self.blocked_seconds:7.1f}s max_queue={self.max_queue_depth}')
+
+
+class Pipeline:
+    """Runs items through stages connected by bounded queues.
+
+    Every item travels with the input it came from, so failures are reported
+    against the original input (e.g. the game URL). A stage whose workers spend
+    their time blocked is being held back by a slower stage downstream; one that
+    is mostly starved is waiting on a slower stage upstream.
+    """
+
+    def __init__(self, stages: list[Stage], queue_size: int = 16, report_every: float | None = None):
+        if not stages:
+            raise ValueError('A pipeline needs at least one stage')
+        self.stages = stages
+        self.queue_size = queue_size
+        self.report_every = report_every
+        self.stats = {stage.name: StageStats() for stage in stages}
+        self.results = []
+
+        self._queues = [queue.Queue(queue_size) for _ in stages]
+        self._finished = [0] * len(stages)
+        self._lock = threading.Lock()
+        self._stop_reporting = threading.Event()
+
+    def run(self, items: Iterable) -> list:
+        """Feed items through every stage and return the outputs of the last stage."""
+        threads = []
+        for i, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(target=self._work, args=(i,), name=f'{stage.name}-{n}', daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        reporter = None
+        if self.report_every:
+            reporter = threading.Thread(target=self._report_periodically, daemon=True)
+            reporter.start()
+
+        first = self.stats[self.stages[0].name]
+        try:
+            for item in items:
+                self._queues[0].put((item, item))
+                with self._lock:
+                    first.max_queue_depth = max(first.max_queue_depth, self._queues[0].qsize())
+        finally:
+            # Even when items raises, the items already queued drain and every thread stops
+            for _ in range(self.stages[0].workers):
+                self._queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+            self._stop_reporting.set()
+            if reporter is not None:
+                reporter.join()
+
+        print(self.report())
+        return self.results
+
+    @property
+    def errors(self) -> list:
+        return [error for stats in self.stats.values() for error in stats.errors]
+
+    def report(self) -> str:
+        return '\n'.join(self.stats[stage.name].summary(stage.name) for stage in self.stages)
+
+    def _report_periodically(self) -> None:
+        while not self._stop_reporting.wait(self.report_every):
+            depths = ' '.join(f'{stage.name}={q.qsize()}' for stage, q in zip(self.stages, self._queues))
+            print(f'[pipeline] queue depths: {depths}')
+
+    def _work(self, index: int) -> None:
+        stage = self.stages[index]
+        stats = self.stats[stage.name]
+        in_queue = self._queues[index]
+        out_queue = self._queues[index + 1] if index + 1 < len(self.stages) else None
+
+        while True:
+            waited = time.monotonic()
+            item = in_queue.get()
+            started = time.monotonic()
+            if item is _DONE:
+                break
+
+            source, payload = item
+            try:
+                if stage.executor is not None:
+                    result = stage.executor.submit(stage.fn, payload).result()
+                else:
+                    result = stage.fn(payload)
+            except Exception as e:
+                finished = time.monotonic()
+                print(f'[!] {stage.name} failed for {source}: {e}')
+                with self._lock:
+                    stats.failed += 1
+                    stats.errors.append((stage.name, source, e))
+                    stats.starved_seconds += started - waited
+                    stats.busy_seconds += finished - started
+                continue
+
+            finished = time.monotonic()
+            if result is not None:
+                if out_queue is None:
+                    with self._lock:
+                        self.results.append(result)
+                else:
+                    out_queue.put((source, result))
+            blocked = time.monotonic() - finished
+
+            with self._lock:
+                stats.processed += 1
+                stats.starved_seconds += started - waited
+                stats.busy_seconds += finished - started
+                stats.blocked_seconds += blocked
+                if out_queue is not None:
+                    downstream = self.stats[self.stages[index + 1].name]
+                    downstream.max_queue_depth = max(downstream.max_queue_depth, out_queue.qsize())
+
+        # The last worker of a stage to finish closes the next stage's input
+        with self._lock:
+            self._finished[index] += 1
+            last = self._finished[index] == stage.workers
+        if last and out_queue is not None:
+            for _ in range(self.stages[index + 1].workers):
+                out_queue.put(_DONE)
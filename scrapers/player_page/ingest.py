@@ -7,8 +7,8 @@ class PlayerProfilePageScraper(PageScraper):
         super().__init__()
         self.player_df = {}
     
-    def load_page(self, url: str) -> None:
-        super().load_page(url)
+    def load_html(self, url: str, html: str) -> None:
+        super().load_html(url, html)
         self.player_df['url'] = url
         self.player_df['player_id'] = url[-12:-4]
     def get_player_profile(self) -> pd.DataFrame:
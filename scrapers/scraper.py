@@ -1,79 +1,138 @@
-import requests
-from nfl_datacollector.utils import polite_sleep
-from bs4 import BeautifulSoup, Comment, Tag
+import asyncio
+from nfl_datacollector.cache import PageCache
+from nfl_datacollector.http import fetch, fetch_async
+from nfl_datacollector.ratelimit import RateLimiter, default_rate_limiter
+from bs4 import BeautifulSoup, Tag
+from .parsers import DEFAULT_PARSER, ElementStrainer, get_parser_backend
+
+
+def fetch_html(url: str, cache: PageCache | None = None,
+               rate_limiter: RateLimiter = default_rate_limiter) -> str:
+    # Cache hits skip both the request and the rate limiter
+    if cache is not None:
+        html = cache.get(url)
+        if html is not None:
+            return html
+        if cache.offline:
+            raise ValueError(f'[!] Page not found in offline archive: {url}')
+
+    html = fetch(url, rate_limiter=rate_limiter).text
+    if cache is not None:
+        cache.put(url, html)
+    return html
+
+
+async def fetch_html_async(url: str, cache: PageCache | None = None,
+                           rate_limiter: RateLimiter = default_rate_limiter) -> str:
+    if cache is not None:
+        html = await asyncio.to_thread(cache.get, url)
+        if html is not None:
+            return html
+        if cache.offline:
+            raise ValueError(f'[!] Page not found in offline archive: {url}')
+
+    response = await fetch_async(url, rate_limiter=rate_limiter)
+    html = response.text
+    if cache is not None:
+        await asyncio.to_thread(cache.put, url, html)
+    return html
+
 
 class PageScraper:
+    page_cache: PageCache | None = PageCache()
+    # One of parsers.PARSER_BACKENDS; 'selectolax' is faster but only covers the game page path
+    parser_backend: str = DEFAULT_PARSER
+    # Ids/classes of the tables and divs a scraper reads; when set, nothing else is built
+    parse_only: tuple[str, ...] | None = None
+
     def __init__(self):
         self.url = None
         self.soup = None
+        self._strainer = None
         
     
     def load_page(self, url: str) -> None:
+        self.load_html(url, fetch_html(url, self.page_cache))
+
+    def load_html(self, url: str, html: str) -> None:
+        # Subclasses hook in here so pages fetched elsewhere (crawler, archive) parse the same way
         self.url = url
-        html = requests.get(url)
-        self.soup = BeautifulSoup(html.text, 'html.parser')
-        polite_sleep(6, 8)
-        
+        self._strainer = ElementStrainer(self.parse_only) if self.parse_only else None
+        self.soup = get_parser_backend(self.parser_backend).parse(html, self._strainer)
+        self._build_dom_index()
+
     def _extract_table(self, table_id_or_class: str) -> Tag:
-        if self.soup is None:
-            raise ValueError('Page has not been loaded yet')
-        
-        # Searching for id
-        table = self.soup.find('table', id=table_id_or_class)
-        if table:
-            return table
+        return self._lookup_element('table', table_id_or_class)
 
-        # Searching for class
-        table = self.soup.find('table', class_=table_id_or_class)
-        if table:
-            return table
+    def _extract_div(self, div_id: str) -> Tag:
+        return self._lookup_element('div', div_id)
 
-        # If not found, look through HTML comments
-        comments = self.soup.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            if 'table' in c and table_id_or_class in c:
-                comment_soup = BeautifulSoup(c, 'html.parser')
-                
-                table = comment_soup.find('table', id=table_id_or_class)
-                if table:
-                    return table
-                
-                table = comment_soup.find('table', class_=table_id_or_class)
-                if table:
-                    return table
-
-        return None
-        
 
-    def _extract_div(self, div_id: str) -> Tag:
+    # ---------------------------------------------
+    # Element Index
+    # ---------------------------------------------
+    # Pro Football Reference ships most tables inside HTML comments. Every table and div
+    # is indexed by id and class once per page: the live DOM at load time, the commented-out
+    # blocks on the first lookup that misses the DOM. Lookups are then dictionary hits.
+    def _build_dom_index(self) -> None:
+        self._indexed_soup = self.soup
+        self._dom_index = _new_element_index()
+        self._comment_index = None
+        _index_elements(self.soup, self._dom_index)
+
+    def _build_comment_index(self) -> None:
+        backend = get_parser_backend(self.parser_backend)
+        self._comment_index = _new_element_index()
+        for comment in backend.comments(self.soup):
+            if self._strainer is not None:
+                if self._strainer.may_contain_element(comment):
+                    _index_elements(backend.parse(comment, self._strainer), self._comment_index)
+            elif '<table' in comment or '<div' in comment:
+                _index_elements(backend.parse(comment), self._comment_index)
+
+    def _lookup_element(self, tag_name: str, id_or_class: str) -> Tag:
         if self.soup is None:
             raise ValueError('Page has not been loaded yet')
-        
-        # Searching for id
-        div = self.soup.find('div', id=div_id)
-        if div:
-            return div
-
-        # Searching for class
-        div = self.soup.find('div', class_=div_id)
-        if div:
-            return div
-        
+        if self.parse_only and id_or_class not in self.parse_only:
+            raise ValueError(f'[!] {id_or_class} is not in {type(self).__name__}.parse_only, so it was never parsed')
+        if getattr(self, '_indexed_soup', None) is not self.soup:
+            self._build_dom_index()
+
+        element = _find_in_index(self._dom_index, tag_name, id_or_class)
+        if element is not None:
+            return element
+
         # If not found, look through HTML comments
-        comments = self.soup.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            if div_id in c:
-                comment_soup = BeautifulSoup(c, 'html.parser')
-
-                div = comment_soup.find('div', id=div_id)
-                if div:
-                    return div
-                
-                div = comment_soup.find('div', class_=div_id)
-                if div:
-                    return div
-
-        return None
-    
-    
-    
\ No newline at end of file
+        if self._comment_index is None:
+            self._build_comment_index()
+        return _find_in_index(self._comment_index, tag_name, id_or_class)
+
+
+INDEXED_TAGS = ('table', 'div')
+
+
+def _new_element_index() -> dict:
+    return {tag_name: ({}, {}) for tag_name in INDEXED_TAGS}
+
+
+def _index_elements(soup: BeautifulSoup, index: dict) -> None:
+    # The first element in document order wins, matching soup.find()
+    for tag in soup.find_all(INDEXED_TAGS):
+        by_id, by_class = index[tag.name]
+        tag_id = tag.get('id')
+        if tag_id:
+            by_id.setdefault(tag_id, tag)
+        classes = tag.get('class')
+        if classes:
+            # class_='a b' matches the full attribute value, class_='a' matches any single class
+            by_class.setdefault(' '.join(classes), tag)
+            for css_class in classes:
+                by_class.setdefault(css_class, tag)
+
+
+def _find_in_index(index: dict, tag_name: str, id_or_class: str) -> Tag:
+    by_id, by_class = index[tag_name]
+    element = by_id.get(id_or_class)
+    if element is None:
+        element = by_class.get(id_or_class)
+    return element
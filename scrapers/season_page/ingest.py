@@ -12,8 +12,8 @@ class SeasonPageScraper(PageScraper):
         self.season_team_seeds_df = pd.DataFrame()
         self.season_year = None
 
-    def load_page(self, url: str) -> None:
-        super().load_page(url)
+    def load_html(self, url: str, html: str) -> None:
+        super().load_html(url, html)
         self.season_info['url'] = url
         self._set_season_year()
 
@@ -0,0 +1,85 @@
+"""Tests for the on-disk page cache."""
+
+import os
+import tarfile
+import time
+from datetime import date
+
+import pytest
+from nfl_datacollector.cache import PageCache, PageArchive, page_ttl, current_season, CURRENT_SEASON_TTL
+from scrapers.scraper import fetch_html
+
+
+class TestPageTtl:
+    """Test freshness rules for each page type."""
+
+    def test_boxscore_never_expires(self):
+        """Finished game pages are immutable."""
+        url = 'https://www.pro-football-reference.com/boxscores/202409050kan.htm'
+        assert page_ttl(url) is None
+
+    def test_past_season_never_expires(self):
+        """Week and team pages from completed seasons are immutable."""
+        today = date(2024, 10, 1)
+        assert page_ttl('https://www.pro-football-reference.com/years/2023/week_5.htm', today) is None
+        assert page_ttl('https://www.pro-football-reference.com/teams/kan/2023.htm', today) is None
+
+    def test_current_season_expires(self):
+        """Current-season week and team pages get a TTL."""
+        today = date(2025, 1, 15)
+        assert current_season(today) == 2024
+        assert page_ttl('https://www.pro-football-reference.com/years/2024/week_18.htm', today) == CURRENT_SEASON_TTL
+        assert page_ttl('https://www.pro-football-reference.com/teams/kan/2024.htm', today) == CURRENT_SEASON_TTL
+
+
+class TestPageCache:
+    """Test the PageCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored pages are returned unchanged and listed by URL."""
+        cache = PageCache(tmp_path)
+        url = 'https://www.pro-football-reference.com/boxscores/202409050kan.htm'
+        assert cache.get(url) is None
+
+        cache.put(url, '<html>é</html>')
+        assert cache.get(url) == '<html>é</html>'
+        assert list(cache.iter_urls()) == [url]
+
+    def test_stale_page_is_a_miss(self, tmp_path):
+        """Pages older than their TTL are not served."""
+        cache = PageCache(tmp_path, ttl=lambda url: 60)
+        url = 'https://www.pro-football-reference.com/years/2024/week_1.htm'
+        cache.put(url, '<html></html>')
+        assert cache.get(url) == '<html></html>'
+
+        old = time.time() - 120
+        os.utime(cache.path_for(url), (old, old))
+        assert cache.get(url) is None
+
+
+class TestPageArchive:
+    """Test replaying pages from an archived corpus."""
+
+    def test_tarball_archive(self, tmp_path):
+        """Pages are served from a tarball of a cache directory."""
+        url = 'https://www.pro-football-reference.com/years/2024/week_1.htm'
+        cache = PageCache(tmp_path / 'pages')
+        cache.put(url, '<html>week 1</html>')
+
+        tarball = tmp_path / 'pages.tgz'
+        with tarfile.open(tarball, 'w:gz') as tar:
+            tar.add(cache.root, arcname='.')
+
+        archive = PageArchive(tarball)
+        assert archive.get(url) == '<html>week 1</html>'
+        assert list(archive.iter_urls()) == [url]
+
+    def test_missing_page_does_not_hit_network(self, tmp_path):
+        """An offline archive raises instead of falling back to the live site."""
+        archive = PageArchive(tmp_path)
+        with pytest.raises(ValueError):
+            fetch_html('https://www.pro-football-reference.com/years/2024/week_1.htm', archive)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
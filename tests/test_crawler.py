@@ -0,0 +1,68 @@
+"""Tests for the asyncio game page crawler."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from nfl_datacollector.cache import PageCache, PageArchive
+from scrapers.crawler import GamePageCrawler
+from scrapers.scraper import PageScraper
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'boxscore_202309070kan.html'
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+
+
+@pytest.fixture
+def archive(tmp_path):
+    PageCache(tmp_path).put(GAME_URL, FIXTURE.read_text())
+    with patch.object(PageScraper, 'page_cache', PageArchive(tmp_path)):
+        yield
+
+
+class TestGamePageCrawler:
+    """Test the GamePageCrawler class."""
+
+    def test_crawl_loads_every_game(self, archive):
+        """Each fetched page is parsed and written through the loader."""
+        loader = Mock()
+        with ThreadPoolExecutor(2) as executor:
+            crawler = GamePageCrawler(loader, parse_workers=2, parse_executor=executor)
+            loaded = crawler.crawl([GAME_URL])
+
+        assert loaded == [GAME_URL]
+        assert crawler.failed == {}
+        loader.insert_dfs.assert_called_once()
+        tables = dict(loader.insert_dfs.call_args[0][0])
+        assert list(tables) == ['game_info', 'game_stats', 'game_player_stats', 'game_drives']
+        assert tables['game_info']['game_id'].iloc[0] == '2023_kan_det_1'
+
+    def test_failures_do_not_stop_the_crawl(self, archive):
+        """A page that cannot be fetched is recorded and the rest still load."""
+        loader = Mock()
+        missing_url = 'https://www.pro-football-reference.com/boxscores/202309100atl.htm'
+        with ThreadPoolExecutor(1) as executor:
+            crawler = GamePageCrawler(loader, parse_workers=1, parse_executor=executor)
+            loaded = crawler.crawl([missing_url, GAME_URL])
+
+        assert loaded == [GAME_URL]
+        assert list(crawler.failed) == [missing_url]
+
+    def test_failing_url_source_still_writes_queued_games(self, archive):
+        """Games queued before the URL source raises are loaded, then the error reaches the caller."""
+        def urls():
+            yield GAME_URL
+            raise ValueError('week index missing')
+
+        loader = Mock()
+        with ThreadPoolExecutor(1) as executor:
+            crawler = GamePageCrawler(loader, parse_workers=1, parse_executor=executor)
+            with pytest.raises(ValueError, match='week index missing'):
+                crawler.crawl(urls())
+
+        assert crawler.loaded == [GAME_URL]
+        loader.insert_dfs.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,337 @@
+"""Tests for the persistent crawl frontier."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from nfl_datacollector.cache import PageCache, PageArchive
+from nfl_datacollector.frontier import CrawlFrontier, FAILED, LOADED, PARSED, PENDING
+from nfl_datacollector.urlindex import UrlIndex
+from scrapers.games_page.ingest import WeekIndex
+from scrapers.main import (ETL_game_page, ETL_games_season_year, ETL_games_since_last_run,
+                           ETL_pending_player_profiles, ETL_player_profiles_by_year, HARVESTED_GAMES_JOB,
+                           PLAYER_PROFILES_JOB)
+from scrapers.scraper import PageScraper
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'boxscore_202309070kan.html'
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+MISSING_URL = 'https://www.pro-football-reference.com/boxscores/202309100atl.htm'
+WEEK_1_URL = 'https://www.pro-football-reference.com/years/2023/week_1.htm'
+WEEK_URL = 'https://www.pro-football-reference.com/years/2023/week_{}.htm'
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    with CrawlFrontier(tmp_path / 'frontier.sqlite3') as frontier:
+        yield frontier
+
+
+@pytest.fixture
+def archive(tmp_path):
+    PageCache(tmp_path / 'pages').put(GAME_URL, FIXTURE.read_text())
+    with patch.object(PageScraper, 'page_cache', PageArchive(tmp_path / 'pages')):
+        yield
+
+
+class TestCrawlFrontier:
+    """Test the CrawlFrontier class."""
+
+    def test_add_keeps_progress_of_known_urls(self, frontier):
+        """Rediscovering a URL does not reset it."""
+        assert frontier.add(['a', 'b'], 'games:2023') == 2
+        frontier.mark('a', 'games:2023', LOADED)
+
+        assert frontier.add(['a', 'c'], 'games:2023') == 1
+        assert frontier.status('a', 'games:2023') == LOADED
+        assert frontier.pending('games:2023') == ['b', 'c']
+
+    def test_failures_count_attempts(self, frontier):
+        """Failed URLs keep their last error and leave the pending list."""
+        frontier.add(['a'], 'games:2023')
+        frontier.mark('a', 'games:2023', FAILED, ValueError('no linescore'))
+
+        assert frontier.pending('games:2023') == []
+        assert frontier.failed('games:2023') == {'a': 'ValueError: no linescore'}
+        assert frontier.counts('games:2023')[FAILED] == 1
+
+    def test_retry_failed(self, frontier):
+        """Failed URLs return to pending, optionally only below an attempt limit."""
+        frontier.add(['a', 'b'], 'games:2023')
+        frontier.mark_many(['a', 'b'], 'games:2023', FAILED, 'timeout')
+        frontier.mark('b', 'games:2023', FAILED, 'timeout')
+
+        assert frontier.retry_failed('games:2023', max_attempts=2) == 1
+        assert frontier.pending('games:2023') == ['a']
+        assert frontier.status('b', 'games:2023') == FAILED
+
+    def test_survives_reopening(self, tmp_path):
+        """Progress is on disk, so a new process resumes from it."""
+        with CrawlFrontier(tmp_path / 'frontier.sqlite3') as frontier:
+            frontier.add(['a', 'b'], 'games:2023')
+            frontier.mark('a', 'games:2023', PARSED)
+            frontier.mark('b', 'games:2023', LOADED)
+
+        with CrawlFrontier(tmp_path / 'frontier.sqlite3') as frontier:
+            assert frontier.pending('games:2023') == ['a']
+
+    def test_jobs_track_the_same_url_separately(self, frontier):
+        """A URL added to a second job gets its own progress there."""
+        frontier.add(['a'], 'games:2023')
+        frontier.mark('a', 'games:2023', FAILED, 'timeout')
+
+        assert frontier.add(['a'], 'games:harvested') == 1
+        frontier.mark('a', 'games:harvested', LOADED)
+
+        assert frontier.status('a', 'games:2023') == FAILED
+        assert frontier.status('a', 'games:harvested') == LOADED
+
+    def test_upgrades_url_keyed_frontier(self, tmp_path):
+        """A frontier file keyed on url alone keeps its progress and accepts a URL in several jobs."""
+        path = tmp_path / 'frontier.sqlite3'
+        with sqlite3.connect(path) as db:
+            db.executescript('''
+                CREATE TABLE frontier (url TEXT PRIMARY KEY, job TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending',
+                                       attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT, updated_at REAL NOT NULL);
+                CREATE INDEX idx_frontier_job_status ON frontier (job, status);
+                INSERT INTO frontier VALUES ('a', 'games:2023', 'loaded', 1, NULL, 0);
+            ''')
+        db.close()
+
+        with CrawlFrontier(path) as frontier:
+            assert frontier.status('a', 'games:2023') == LOADED
+            assert frontier.add(['a'], 'games:harvested') == 1
+        with CrawlFrontier(path) as frontier:
+            assert frontier.pending('games:harvested') == ['a']
+
+    def test_unknown_status_raises(self, frontier):
+        """Only the documented statuses can be set."""
+        with pytest.raises(ValueError):
+            frontier.mark('a', 'games:2023', 'done')
+
+
+class TestResumableSeasonCrawl:
+    """Test ETL_games_season_year with a frontier."""
+
+    def run_season(self, frontier, week_pages, loader=None, batch_size=50):
+        loader = loader or Mock()
+        loader.get_url_index.return_value = UrlIndex(lambda: [])
+        with patch('scrapers.main.get_game_urls_from_week_index',
+                   side_effect=lambda url: week_pages.get(url, [])) as list_week:
+            failed = ETL_games_season_year(2023, loader, batch_size=batch_size, frontier=frontier)
+        return loader, list_week, failed
+
+    def test_resume_skips_finished_work(self, frontier, archive):
+        """A second run reads no week index and scrapes no game that already loaded."""
+        loader, list_week, failed = self.run_season(frontier, {WEEK_1_URL: [GAME_URL, MISSING_URL]})
+
+        assert list_week.call_count == 22
+        assert frontier.status(GAME_URL, 'games:2023') == LOADED
+        assert list(failed) == [MISSING_URL]
+        loader.insert_dfs.assert_called_once()
+
+        loader, list_week, failed = self.run_season(frontier, {})
+
+        list_week.assert_not_called()
+        loader.insert_dfs.assert_not_called()
+        assert list(failed) == [MISSING_URL]
+
+    def test_flushed_games_keep_their_status(self, frontier, archive):
+        """A game written or rejected as soon as it is added is not reset to parsed."""
+        self.run_season(frontier, {WEEK_1_URL: [GAME_URL]}, batch_size=1)
+
+        assert frontier.status(GAME_URL, 'games:2023') == LOADED
+        assert frontier.pending('games:2023') == []
+
+        frontier.mark(GAME_URL, 'games:2023', PENDING)
+        loader = Mock()
+        loader.insert_dfs.side_effect = ValueError('statement timeout')
+        _, _, failed = self.run_season(frontier, {}, loader=loader, batch_size=1)
+
+        assert list(failed) == [GAME_URL]
+        assert frontier.status(GAME_URL, 'games:2023') == FAILED
+
+    def test_retry_failed_games(self, frontier, archive):
+        """Retried games are scraped again on the next run."""
+        self.run_season(frontier, {WEEK_1_URL: [GAME_URL, MISSING_URL]})
+
+        assert frontier.retry_failed('games:2023') == 1
+        assert frontier.status(MISSING_URL, 'games:2023') == PENDING
+        self.run_season(frontier, {})
+
+        assert frontier.counts('games:2023')[FAILED] == 1
+        # Both attempts were counted, so a two-attempt limit no longer retries it
+        assert frontier.retry_failed('games:2023', max_attempts=2) == 0
+
+
+class TestPlayerHarvest:
+    """Test queueing player profiles from ingested game pages."""
+
+    def ingest_season(self, frontier):
+        loader = Mock()
+        loader.get_url_index.return_value = UrlIndex(lambda: [])
+        with patch('scrapers.main.get_game_urls_from_week_index',
+                   side_effect=lambda url: [GAME_URL] if url == WEEK_1_URL else []):
+            ETL_games_season_year(2023, loader, frontier=frontier)
+        return loader
+
+    def test_game_ingestion_queues_players(self, frontier, archive):
+        """Every player on an ingested game page is queued once."""
+        self.ingest_season(frontier)
+
+        queued = frontier.pending(PLAYER_PROFILES_JOB)
+        assert len(queued) == 9
+        assert 'https://www.pro-football-reference.com/players/M/MahoPa00.htm' in queued
+
+    def test_in_memory_frontier_does_not_harvest(self, archive):
+        """Player URLs are not queued where they would be lost when the run ends."""
+        with CrawlFrontier(':memory:') as frontier:
+            ETL_game_page(GAME_URL, Mock(), frontier=frontier)
+
+            assert frontier.pending(PLAYER_PROFILES_JOB) == []
+            assert frontier.status(GAME_URL, HARVESTED_GAMES_JOB) is None
+
+    def test_game_without_snap_counts_is_harvested_once(self, frontier, tmp_path):
+        """A box score with no player list is recorded as harvested, so it is not read again."""
+        html = FIXTURE.read_text().replace('id="home_snap_counts"', 'id="home_snaps"')
+        PageCache(tmp_path / 'pages').put(GAME_URL, html.replace('id="vis_snap_counts"', 'id="vis_snaps"'))
+        with patch.object(PageScraper, 'page_cache', PageArchive(tmp_path / 'pages')):
+            ETL_game_page(GAME_URL, Mock(), frontier=frontier)
+
+        assert frontier.status(GAME_URL, HARVESTED_GAMES_JOB) == LOADED
+        assert frontier.pending(PLAYER_PROFILES_JOB) == []
+
+    def test_profiles_crawl_from_the_queue(self, frontier, archive):
+        """Queued profiles are scraped without touching a game page, and only once."""
+        loader = self.ingest_season(frontier)
+        loader.get_url_index.return_value = UrlIndex(lambda: [])
+
+        with patch('scrapers.main.ETL_player_profile') as scrape_profile, \
+                patch('scrapers.main.GamePageScraper.load_page') as load_game_page:
+            ETL_pending_player_profiles(loader, frontier)
+            ETL_pending_player_profiles(loader, frontier)
+
+        assert scrape_profile.call_count == 9
+        load_game_page.assert_not_called()
+        assert frontier.pending(PLAYER_PROFILES_JOB) == []
+
+    def test_season_profiles_cover_games_loaded_without_harvest(self, frontier, archive):
+        """Games skipped by the season crawl because they were already stored still get their players queued."""
+        loader = Mock()
+        loader.get_url_index.return_value = UrlIndex(lambda: [GAME_URL])
+        with patch('scrapers.main.get_game_urls_from_week_index',
+                   side_effect=lambda url: [GAME_URL, MISSING_URL] if url == WEEK_1_URL else []):
+            ETL_games_season_year(2023, loader, frontier=frontier)
+        assert frontier.status(GAME_URL, 'games:2023') == LOADED
+        assert frontier.status(MISSING_URL, 'games:2023') == FAILED
+        loader.get_url_index.return_value = UrlIndex(lambda: [])
+
+        with patch('scrapers.main.extract_game_links_from_team_page', return_value=[GAME_URL, MISSING_URL]), \
+                patch('scrapers.main.ETL_player_profile') as scrape_profile:
+            ETL_player_profiles_by_year(2023, loader, frontier)
+
+        assert scrape_profile.call_count == 9
+        assert frontier.status(GAME_URL, HARVESTED_GAMES_JOB) == LOADED
+        assert frontier.status(MISSING_URL, HARVESTED_GAMES_JOB) == FAILED
+
+    def test_season_profiles_skip_ingested_games(self, frontier, archive):
+        """The season player crawl does not re-read games that were already harvested."""
+        loader = self.ingest_season(frontier)
+
+        with patch('scrapers.main.extract_game_links_from_team_page', return_value=[GAME_URL]), \
+                patch('scrapers.main.extract_player_urls_from_game_page') as read_game, \
+                patch('scrapers.main.ETL_player_profile') as scrape_profile:
+            ETL_player_profiles_by_year(2023, loader, frontier)
+
+        read_game.assert_not_called()
+        assert scrape_profile.call_count == 9
+
+
+class TestGamesSinceLastRun:
+    """Test the incremental update of the current season."""
+
+    def run_update(self, loaded_weeks, week_pages, logged_urls=(), frontier=None):
+        loader = Mock()
+        loader.get_loaded_weeks.return_value = loaded_weeks
+        loader.get_url_index.return_value = UrlIndex(lambda: logged_urls)
+
+        def read_week(url):
+            if url not in week_pages:
+                raise ValueError(f'[!] Cannot find div of class=game_summaries at {url}')
+            return week_pages[url]
+
+        with patch('scrapers.main.get_week_index', side_effect=read_week) as list_week:
+            failed = ETL_games_since_last_run(loader, 2023, frontier=frontier)
+        return loader, list_week, failed
+
+    def read_weeks(self, list_week):
+        return [int(call.args[0].split('week_')[1].split('.')[0]) for call in list_week.call_args_list]
+
+    def test_complete_weeks_are_skipped(self, frontier, archive):
+        """Only weeks with fewer stored games than their index lists are queued, however old."""
+        loader, list_week, failed = self.run_update(
+            {1: 2, 2: 15, 3: 16},
+            {WEEK_1_URL: WeekIndex([GAME_URL], 2), WEEK_URL.format(2): WeekIndex([MISSING_URL], 16),
+             WEEK_URL.format(3): WeekIndex([GAME_URL], 16), WEEK_URL.format(4): WeekIndex([], 16)},
+            frontier=frontier)
+
+        assert self.read_weeks(list_week) == [1, 2, 3, 4]
+        assert frontier.status(GAME_URL, 'games:2023') is None
+        assert list(failed) == [MISSING_URL]
+
+    def test_partly_played_week(self, frontier, archive):
+        """The finished games of a week in progress are loaded; the next week without results ends the scan."""
+        loader, list_week, failed = self.run_update(
+            {}, {WEEK_1_URL: WeekIndex([GAME_URL], 16), WEEK_URL.format(2): WeekIndex([], 16)}, frontier=frontier)
+
+        assert self.read_weeks(list_week) == [1, 2]
+        assert frontier.status(GAME_URL, 'games:2023') == LOADED
+        loader.insert_dfs.assert_called_once()
+
+    def test_unpublished_week_ends_the_scan(self, archive):
+        """A 404 for a week index stops reading weeks instead of failing the update."""
+        response = Mock(status_code=404)
+        week_pages = {WEEK_1_URL: WeekIndex([GAME_URL], 16)}
+
+        def read_week(url):
+            if url in week_pages:
+                return week_pages[url]
+            raise requests.HTTPError('404 Client Error', response=response)
+
+        loader = Mock()
+        loader.get_loaded_weeks.return_value = {}
+        loader.get_url_index.return_value = UrlIndex(lambda: [])
+        with patch('scrapers.main.get_week_index', side_effect=read_week):
+            assert ETL_games_since_last_run(loader, 2023) == {}
+        loader.insert_dfs.assert_called_once()
+
+        response.status_code = 503
+        with patch('scrapers.main.get_week_index', side_effect=read_week), pytest.raises(requests.HTTPError):
+            ETL_games_since_last_run(loader, 2023)
+
+    def test_logged_games_are_not_scraped(self, frontier, archive):
+        """Games already in game_info are marked loaded without fetching their pages."""
+        loader, list_week, failed = self.run_update(
+            {}, {WEEK_1_URL: WeekIndex([GAME_URL, MISSING_URL], 16)}, logged_urls=[GAME_URL, MISSING_URL],
+            frontier=frontier)
+
+        assert failed == {}
+        loader.insert_dfs.assert_not_called()
+        assert frontier.pending('games:2023') == []
+
+    def test_earlier_games_left_in_the_frontier_are_loaded(self, frontier, archive):
+        """Games still pending from an earlier run are loaded, and failed ones are retried."""
+        frontier.add([GAME_URL, MISSING_URL], 'games:2023')
+        frontier.mark(MISSING_URL, 'games:2023', FAILED, 'timeout')
+
+        loader, list_week, failed = self.run_update({}, {}, frontier=frontier)
+
+        assert frontier.status(GAME_URL, 'games:2023') == LOADED
+        assert list(failed) == [MISSING_URL]
+        assert frontier.counts('games:2023')[FAILED] == 1
+        loader.insert_dfs.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
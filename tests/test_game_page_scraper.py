@@ -0,0 +1,169 @@
+"""Tests for GamePageScraper on the fixture box score."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from nfl_datacollector.cache import PageCache
+from scrapers.games_page.ingest import GamePageScraper, get_week_index
+from scrapers.scraper import PageScraper
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'boxscore_202309070kan.html'
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+
+
+@pytest.fixture
+def scraper():
+    scraper = GamePageScraper()
+    scraper.load_html(GAME_URL, FIXTURE.read_text())
+    return scraper
+
+
+class TestLinescore:
+    """Test the shared linescore parse."""
+
+    def test_linescore_structure(self, scraper):
+        """Team ids, quarter points and totals come from one parse."""
+        linescore = scraper._get_linescore()
+        assert (linescore.away.team_id, linescore.home.team_id) == ('det', 'kan')
+        assert linescore.away.quarters == (7, 7, 0, 7)
+        assert (linescore.away.total, linescore.home.total) == (21, 20)
+        assert not linescore.overtime
+        assert scraper._get_linescore() is linescore
+
+    def test_consumers_agree(self, scraper):
+        """Game info and game stats read the same totals."""
+        info = scraper.get_game_info().iloc[0]
+        stats = scraper.get_game_stats().set_index('team_id')
+        assert (info['away_points'], info['home_points'], info['winning_team_id']) == (21, 20, 'det')
+        assert stats.loc['det', 'points_total'] == 21
+        assert stats.loc['kan', 'points_q3'] == 7
+        assert (stats['points_overtime'] == 0).all()
+
+    def test_overtime_column(self):
+        """An overtime column is read into the overtime points."""
+        html = FIXTURE.read_text()
+        html = html.replace('<td class="center">7</td><td class="center">21</td>',
+                            '<td class="center">7</td><td class="center">0</td><td class="center">21</td>')
+        html = html.replace('<td class="center">3</td><td class="center">20</td>',
+                            '<td class="center">3</td><td class="center">3</td><td class="center">23</td>')
+        scraper = GamePageScraper()
+        scraper.load_html(GAME_URL, html)
+        linescore = scraper._get_linescore()
+        assert linescore.overtime
+        assert (linescore.away.overtime, linescore.home.overtime) == (0, 3)
+        assert scraper.get_game_info().iloc[0]['winning_team_id'] == 'kan'
+
+
+class TestTeamStats:
+    """Test team stats parsing."""
+
+    def test_combined_stats_split_while_parsing(self, scraper):
+        """Combined cells arrive as separate numeric columns, one row per team."""
+        df = scraper.get_game_stats().set_index('team_id')
+        assert 'Rush-Yds-TDs' not in df.columns
+        assert (df.loc['kan', 'passing_completions'], df.loc['kan', 'passing_attempts']) == (21, 39)
+        assert df.loc['det', 'rushing_yards'] == 118
+        assert df.loc['det', 'Total Yards'] == '364'
+
+
+class TestPlayerStats:
+    """Test player stat collection across tables."""
+
+    def test_one_row_per_player(self, scraper):
+        """Players appearing in several tables are merged into one row."""
+        df = scraper.get_game_player_stats()
+        assert df['player_id'].is_unique
+        assert list(df.columns[:2]) == ['player_id', 'player_name']
+        assert (df['game_id'] == '2023_kan_det_1').all()
+
+    def test_conflicting_values_raise(self, scraper):
+        """A stat reported twice with different values raises."""
+        scraper._validate_and_insert_player_stat('MahoPa00', 'Patrick Mahomes', 'pass_yds', '226')
+        scraper._validate_and_insert_player_stat('MahoPa00', 'Patrick Mahomes', 'pass_yds', '226')
+        with pytest.raises(ValueError):
+            scraper._validate_and_insert_player_stat('MahoPa00', 'Patrick Mahomes', 'pass_yds', '300')
+
+    def test_empty_values_do_not_conflict(self, scraper):
+        """Empty cells become NA and are filled in by later tables."""
+        scraper._validate_and_insert_player_stat('MahoPa00', 'Patrick Mahomes', 'pass_td', '')
+        scraper._validate_and_insert_player_stat('MahoPa00', 'Patrick Mahomes', 'pass_td', '2')
+        scraper._validate_and_insert_player_stat('MahoPa00', 'Patrick Mahomes', 'pass_td', '')
+        assert scraper._player_stats['MahoPa00']['pass_td'] == '2'
+        assert pd.isna(scraper._player_stats['MahoPa00'].get('pass_int', pd.NA))
+
+
+class TestScoringPlays:
+    """Test the scoring-play index used for drive attribution."""
+
+    def test_scoring_plays_dataset(self, scraper):
+        """Every scoring row becomes one play with its score change and team."""
+        scraper.get_game_info()
+        df = scraper.get_scoring_plays()
+        assert len(df) == 7
+        assert df['points'].sum() == 41
+        first = df.iloc[0]
+        assert (first['quarter'], first['seconds_remaining'], first['scoring_team_id']) == ('1', 623, 'kan')
+
+    def test_index_keyed_by_quarter_and_seconds(self, scraper):
+        """Plays are looked up by (quarter, seconds remaining)."""
+        scraper.get_game_info()
+        play = scraper._get_scoring_index()[('2', 455)]
+        assert play.scoring_team_id == 'det'
+        assert play.points == 7
+
+    def test_drive_attribution(self, scraper):
+        """Drives ending on a scoring play get its points; defensive scores flag the opponent."""
+        scraper.get_game_info()
+        drives = scraper.get_game_drives()
+        assert drives['points_scored'].tolist() == [3, 7, 7, 7, 3, 7, 0, 0, 7]
+        assert drives['opposing_touchdown'].tolist() == [False, False, True] + [False] * 6
+
+
+class TestDrives:
+    """Test drive parsing."""
+
+    def test_typed_drive_values(self, scraper):
+        """Clock values are seconds and plays/yards are integers."""
+        scraper.get_game_info()
+        drives = scraper.get_game_drives()
+        assert len(drives) == 9
+        first = drives.iloc[0]
+        assert (first['time_start'], first['time_total'], first['plays'], first['net_yds']) == (900, 277, 9, 58)
+        assert drives['net_yds'].min() == -4
+        assert str(drives['time_start'].dtype) == 'Int64'
+
+
+def game_summary(away, home, scores=('', ''), link=''):
+    return f'''
+    <div class="game_summary expanded nohover"><table class="teams"><tbody>
+      <tr class="date"><td colspan="3">Sep 10, 2023</td></tr>
+      <tr><td><a href="/teams/{away}/2023.htm">{away}</a></td><td class="right">{scores[0]}</td>
+          <td class="right gamelink">{link}</td></tr>
+      <tr><td><a href="/teams/{home}/2023.htm">{home}</a></td><td class="right">{scores[1]}</td>
+          <td class="right"></td></tr>
+    </tbody></table></div>'''
+
+
+class TestWeekIndex:
+    """Test reading a week index."""
+
+    def test_partly_played_week(self, tmp_path, monkeypatch):
+        """Only finished games are returned; games still to be played count as scheduled."""
+        url = 'https://www.pro-football-reference.com/years/2023/week_1.htm'
+        html = '<div class="game_summaries">' + ''.join([
+            game_summary('det', 'kan', ('21', '20'), '<a href="/boxscores/202309070kan.htm">Final</a>'),
+            game_summary('car', 'atl'),
+            game_summary('ram', 'sea', link='<a href="/preview/202309100sea.htm">Preview</a>'),
+        ]) + '</div>'
+        PageCache(tmp_path).put(url, html)
+        monkeypatch.setattr(PageScraper, 'page_cache', PageCache(tmp_path))
+
+        week_index = get_week_index(url)
+
+        assert week_index.played == ['https://www.pro-football-reference.com/boxscores/202309070kan.htm']
+        assert week_index.scheduled == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
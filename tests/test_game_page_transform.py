@@ -0,0 +1,100 @@
+"""Tests for GamePageTransformer."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from scrapers.games_page.etl import scrape_game_page, transform_game_frames, transform_game_frames_batch
+from scrapers.games_page.transform import GamePageTransformer, coerce_frame, split_combined_stat
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'boxscore_202309070kan.html'
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+
+
+def transform_game_stats(game_stats_df: pd.DataFrame) -> pd.DataFrame:
+    return GamePageTransformer(pd.DataFrame(), game_stats_df, pd.DataFrame()).transform_game_stats_df()
+
+
+class TestGameStats:
+    """Test team stats transformation."""
+
+    def test_split_combined_stat(self):
+        """Dashes after a digit separate values; negative numbers survive."""
+        assert split_combined_stat('Rush-Yds-TDs', '20--5-0') == {
+            'rushing_attempts': '20', 'rushing_yards': '-5', 'rushing_touchdowns': '0'}
+        assert split_combined_stat('Sacked-Yards', '') == {'sacks_total': None, 'sack_yards': None}
+
+    def test_combined_columns_still_split(self):
+        """Frames that still carry combined strings are split by the transformer."""
+        raw = pd.DataFrame({'team_id': ['kan'], 'Cmp-Att-Yd-TD-INT': ['21-39-226-2-1']})
+        df = transform_game_stats(raw)
+        assert (df.loc[0, 'passing_completions'], df.loc[0, 'passing_attempts']) == (21, 39)
+        assert 'passing_stats_combined' not in df.columns
+
+    def test_presplit_columns_kept(self):
+        """Columns split by the scraper pass through untouched."""
+        raw = pd.DataFrame({'team_id': ['kan'], 'rushing_attempts': [20], 'rushing_yards': [72]})
+        df = transform_game_stats(raw)
+        assert (df.loc[0, 'rushing_attempts'], df.loc[0, 'rushing_yards']) == (20, 72)
+        assert 'rush_stats_combined' not in df.columns
+
+
+class TestCoercion:
+    """Test schema-driven column types."""
+
+    SCHEMA = {'player_id': 'string', 'pass_yds': 'Int16', 'off_pct': 'float32', 'attendance': 'Int32'}
+
+    def test_declared_types(self):
+        """Numbers lose '%' and separators, empty cells become missing."""
+        raw = pd.DataFrame({'player_id': ['a', 'b'], 'pass_yds': ['226', ''],
+                            'off_pct': ['100%', pd.NA], 'attendance': ['73,522', None]})
+        df = coerce_frame(raw, self.SCHEMA, 'test')
+        assert df.dtypes.astype(str).tolist() == ['string', 'Int16', 'float32', 'Int32']
+        assert df.loc[0, 'pass_yds'] == 226 and pd.isna(df.loc[1, 'pass_yds'])
+        assert df.loc[0, 'off_pct'] == 100.0 and np.isnan(df.loc[1, 'off_pct'])
+        assert df.loc[0, 'attendance'] == 73522
+
+    def test_unexpected_value_raises(self):
+        """Text in a numeric column fails fast."""
+        raw = pd.DataFrame({'player_id': ['a'], 'pass_yds': ['12 yds']})
+        with pytest.raises(ValueError, match='pass_yds'):
+            coerce_frame(raw, self.SCHEMA, 'test')
+
+    def test_fractional_integer_raises(self):
+        """Fractions in a whole-number column fail fast."""
+        raw = pd.DataFrame({'player_id': ['a'], 'pass_yds': ['1.5']})
+        with pytest.raises(ValueError):
+            coerce_frame(raw, self.SCHEMA, 'test')
+
+    def test_undeclared_column_raises(self):
+        """Every column needs a declared type."""
+        with pytest.raises(ValueError):
+            coerce_frame(pd.DataFrame({'mystery': ['1']}), self.SCHEMA, 'test')
+
+
+class TestBatchTransform:
+    """Test transforming many games in one call."""
+
+    def test_batch_matches_single_games(self):
+        """A batch returns the rows of every game, equal to transforming them one by one."""
+        raw = scrape_game_page(GAME_URL, FIXTURE.read_text())
+        playoff = raw._replace(game_info=raw.game_info.assign(season_week=20, game_id='2023_kan_det_20'))
+
+        batch = transform_game_frames_batch([raw, playoff])
+        single = transform_game_frames(raw)
+
+        assert batch.game_info['playoff_game'].tolist() == [pd.NA, 'Divisional']
+        assert len(batch.player_stats) == 2 * len(single.player_stats)
+        for batch_df, single_df in zip(batch, single):
+            pd.testing.assert_frame_equal(batch_df.iloc[:len(single_df)].reset_index(drop=True),
+                                          single_df.reset_index(drop=True))
+
+    def test_empty_batch(self):
+        """An empty batch raises."""
+        with pytest.raises(ValueError):
+            transform_game_frames_batch([])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,57 @@
+"""Tests for the shared HTTP fetch layer."""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+from nfl_datacollector import http
+from nfl_datacollector.ratelimit import RateLimiter
+
+
+def _response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b'<html></html>'
+    return response
+
+
+class TestFetch:
+    """Test retry and backoff behaviour of fetch."""
+
+    def test_retry_after_is_honored(self):
+        """A 429 defers the host by Retry-After before the next attempt."""
+        session = Mock()
+        session.get.side_effect = [_response(429, {'Retry-After': '0'}), _response(200)]
+        limiter = Mock(spec=RateLimiter)
+
+        response = http.fetch('https://www.pro-football-reference.com/a.htm', session, limiter)
+
+        assert response.status_code == 200
+        assert session.get.call_count == 2
+        assert limiter.wait.call_count == 2
+        limiter.defer.assert_called_once_with('https://www.pro-football-reference.com/a.htm', 0.0)
+
+    def test_gives_up_after_max_retries(self):
+        """Persistent 5xx responses raise instead of returning an error page."""
+        session = Mock()
+        session.get.return_value = _response(503, {'Retry-After': '0'})
+        limiter = Mock(spec=RateLimiter)
+
+        with pytest.raises(requests.HTTPError):
+            http.fetch('https://www.pro-football-reference.com/a.htm', session, limiter, max_retries=2)
+        assert session.get.call_count == 3
+
+    def test_client_errors_are_not_retried(self):
+        """A 404 raises immediately."""
+        session = Mock()
+        session.get.return_value = _response(404)
+        limiter = Mock(spec=RateLimiter)
+
+        with pytest.raises(requests.HTTPError):
+            http.fetch('https://www.pro-football-reference.com/a.htm', session, limiter)
+        assert session.get.call_count == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,342 @@
+"""Tests for the DatabaseLoader bulk insert path.
+
+The tests that talk to Postgres run only when NFL_TEST_DATABASE_URL points at
+a scratch database, e.g. postgresql+psycopg2://postgres:@localhost:5432/nfl_test.
+"""
+
+import os
+from typing import NamedTuple
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+import sqlalchemy
+from load import COPY_NULL, BatchWriter, DatabaseLoader, InsertResult, frame_to_copy_csv
+from nfl_datacollector.config import DatabaseConfig
+from nfl_datacollector.urlindex import BloomFilter
+
+TEST_DATABASE_URL = os.environ.get('NFL_TEST_DATABASE_URL')
+
+
+@pytest.fixture
+def loader():
+    if not TEST_DATABASE_URL:
+        pytest.skip('NFL_TEST_DATABASE_URL is not set')
+    config = DatabaseConfig('localhost', 'postgres', 'postgres', '', 5432, statement_timeout_ms=5000)
+    loader = DatabaseLoader(config)
+    loader.engine = sqlalchemy.create_engine(TEST_DATABASE_URL, **config.get_engine_options())
+    with loader.engine.begin() as conn:
+        conn.exec_driver_sql('''
+            DROP TABLE IF EXISTS game_drives;
+            CREATE TABLE game_drives (
+                id SERIAL PRIMARY KEY,
+                game_id VARCHAR(50) NOT NULL,
+                team_id VARCHAR(10) NOT NULL,
+                drive_num VARCHAR(10),
+                time_start INTEGER,
+                end_event VARCHAR(100),
+                opposing_touchdown BOOLEAN DEFAULT FALSE,
+                UNIQUE (game_id, team_id, drive_num)
+            );
+        ''')
+    yield loader
+    with loader.engine.begin() as conn:
+        conn.exec_driver_sql('DROP TABLE IF EXISTS game_drives; DROP TABLE IF EXISTS page_hashes')
+    loader.close()
+
+
+def drives_frame(drive_nums):
+    return pd.DataFrame({
+        'game_id': '2023_kan_det_1',
+        'team_id': 'kan',
+        'drive_num': [str(num) for num in drive_nums],
+        'time_start': pd.array([900 - num for num in drive_nums], dtype='Int64'),
+        'end_event': 'Punt, "short"',
+        'opposing_touchdown': False,
+    })
+
+
+class TestFrameToCopyCsv:
+    """Test the COPY serialization of DataFrames."""
+
+    def test_missing_values_become_null_marker(self):
+        """None, NaN and pd.NA are written as the NULL marker, empty strings stay empty."""
+        df = pd.DataFrame({
+            'name': ['a', None, ''],
+            'yards': pd.array([1, pd.NA, 3], dtype='Int16'),
+            'rate': [1.5, float('nan'), 2.25],
+        })
+
+        rows = frame_to_copy_csv(df).read().splitlines()
+
+        assert rows == ['a,1,1.5', f'{COPY_NULL},{COPY_NULL},{COPY_NULL}', ',3,2.25']
+
+    def test_booleans_and_integral_floats(self):
+        """Booleans become true/false and floats bound for INTEGER columns lose the .0."""
+        df = pd.DataFrame({'flag': [True, False], 'points': [7.0, float('nan')]})
+
+        rows = frame_to_copy_csv(df, integer_columns={'points'}).read().splitlines()
+
+        assert rows == ['true,7', f'false,{COPY_NULL}']
+
+    def test_quotes_and_commas_are_escaped(self):
+        """Text with delimiters is quoted so COPY reads it back unchanged."""
+        df = pd.DataFrame({'weather': ['85 degrees, wind 9 mph'], 'event': ['Punt "short"']})
+
+        assert frame_to_copy_csv(df).read() == '"85 degrees, wind 9 mph","Punt ""short"""\n'
+
+
+class TestInsertDf:
+    """Test DatabaseLoader.insert_df against Postgres."""
+
+    def test_unknown_table_raises(self):
+        """Only tables with declared conflict keys can be loaded."""
+        loader = DatabaseLoader(DatabaseConfig('localhost', 'postgres', 'postgres', '', 5432))
+        with pytest.raises(ValueError, match='Invalid table name'):
+            loader.insert_df(drives_frame([1]), 'game_team_stats')
+
+    def test_insert_then_skip_duplicates(self, loader):
+        """Rows colliding on the conflict keys are skipped and counted."""
+        assert loader.insert_df(drives_frame([1, 2]), 'game_drives') == InsertResult(2, 0)
+        assert loader.insert_df(drives_frame([2, 3, 3]), 'game_drives') == InsertResult(1, 2)
+
+        with loader.engine.connect() as conn:
+            rows = conn.exec_driver_sql(
+                'SELECT drive_num, time_start, end_event, opposing_touchdown FROM game_drives ORDER BY drive_num'
+            ).fetchall()
+        assert [tuple(row) for row in rows] == [
+            ('1', 899, 'Punt, "short"', False),
+            ('2', 898, 'Punt, "short"', False),
+            ('3', 897, 'Punt, "short"', False),
+        ]
+
+    def test_repeated_inserts_skip_the_catalog(self, loader):
+        """The table is reflected once; later inserts only stage and merge."""
+        loader.insert_df(drives_frame([1]), 'game_drives')
+        statements = []
+        sqlalchemy.event.listen(loader.engine, 'before_cursor_execute',
+                                lambda conn, cursor, statement, *args: statements.append(statement))
+
+        loader.insert_df(drives_frame([2]), 'game_drives')
+
+        assert not any('pg_catalog' in statement for statement in statements)
+        assert loader.get_table_spec('game_drives').conflict_keys == ('game_id', 'team_id', 'drive_num')
+
+    def test_missing_unique_constraint_raises(self, loader):
+        """A table without a constraint matching its conflict keys is reported up front."""
+        with loader.engine.begin() as conn:
+            conn.exec_driver_sql('ALTER TABLE game_drives DROP CONSTRAINT game_drives_game_id_team_id_drive_num_key')
+
+        with pytest.raises(ValueError, match='no unique constraint'):
+            loader.insert_df(drives_frame([1]), 'game_drives')
+
+    def test_migrate_old_game_drives_table(self, loader):
+        """A table with text clocks and no drive key is converted in place and loads again."""
+        with loader.engine.begin() as conn:
+            conn.exec_driver_sql('''
+                DROP TABLE game_drives;
+                CREATE TABLE game_drives (
+                    id SERIAL PRIMARY KEY, game_id VARCHAR(50) NOT NULL, team_id VARCHAR(10) NOT NULL,
+                    drive_num VARCHAR(10), time_start VARCHAR(20), plays VARCHAR(100),
+                    time_total VARCHAR(20), net_yds VARCHAR(20)
+                );
+                INSERT INTO game_drives (game_id, team_id, drive_num, time_start, plays, time_total, net_yds) VALUES
+                    ('g', 'kan', '1', '15:00', '5', '2:34', '-3'),
+                    ('g', 'kan', '1', '15:00', '5', '2:34', '-3'),
+                    ('g', 'kan', '2', '', '', '', '');
+            ''')
+
+        loader.migrate_game_drives_table()
+        loader.migrate_game_drives_table()
+
+        with loader.engine.connect() as conn:
+            rows = conn.exec_driver_sql('SELECT drive_num, time_start, plays, time_total, net_yds '
+                                        'FROM game_drives ORDER BY drive_num').fetchall()
+        assert [tuple(row) for row in rows] == [('1', 900, 5, 154, -3), ('2', None, None, None, None)]
+        frame = pd.DataFrame({'game_id': ['g'], 'team_id': ['kan'], 'drive_num': ['2'], 'time_start': [12.0]})
+        assert loader.insert_df(frame, 'game_drives') == InsertResult(0, 1)
+
+    def test_url_index_follows_commits(self, loader):
+        """Committed rows join the URL index; rolled back ones do not."""
+        with loader.engine.begin() as conn:
+            conn.exec_driver_sql('DROP TABLE IF EXISTS game_info CASCADE')
+            conn.exec_driver_sql('CREATE TABLE game_info (game_id TEXT PRIMARY KEY, url TEXT NOT NULL)')
+        try:
+            logged_urls = loader.get_url_index('game_info')
+            assert 'a.htm' not in logged_urls
+
+            loader.insert_df(pd.DataFrame({'game_id': ['a'], 'url': ['a.htm']}), 'game_info')
+            with loader.engine.connect() as conn:
+                loader.insert_df(pd.DataFrame({'game_id': ['b'], 'url': ['b.htm']}), 'game_info', conn)
+                conn.rollback()
+
+            assert 'a.htm' in logged_urls
+            assert 'b.htm' not in logged_urls
+        finally:
+            with loader.engine.begin() as conn:
+                conn.exec_driver_sql('DROP TABLE game_info')
+
+    def test_bloom_filter_sees_every_insert(self, loader, tmp_path):
+        """With url_index_dir set, inserts reach the saved filter even if nothing asked for the index."""
+        with loader.engine.begin() as conn:
+            conn.exec_driver_sql('DROP TABLE IF EXISTS player_profiles CASCADE')
+            conn.exec_driver_sql('CREATE TABLE player_profiles (player_id TEXT PRIMARY KEY, url TEXT NOT NULL)')
+        # A filter saved by an earlier run, so the new URL can only get there through the insert
+        BloomFilter(capacity=100).save(tmp_path / 'player_profiles.bloom')
+        loader.url_index_dir = tmp_path
+        try:
+            loader.insert_df(pd.DataFrame({'player_id': ['a'], 'url': ['a.htm']}), 'player_profiles')
+            loader.get_url_index('player_profiles').save()
+
+            assert 'a.htm' in BloomFilter.load(tmp_path / 'player_profiles.bloom')
+        finally:
+            with loader.engine.begin() as conn:
+                conn.exec_driver_sql('DROP TABLE player_profiles')
+
+    def test_shared_connection(self, loader):
+        """Inserts on a caller's connection are part of the caller's transaction."""
+        with loader.engine.connect() as conn:
+            loader.insert_df(drives_frame([1]), 'game_drives', conn)
+            loader.insert_df(drives_frame([2]), 'game_drives', conn)
+            conn.rollback()
+
+        with loader.engine.connect() as conn:
+            assert conn.exec_driver_sql('SELECT count(*) FROM game_drives').scalar() == 0
+
+
+class TestRefreshPage:
+    """Test rewriting a page's rows only when its content changed."""
+
+    URL = 'https://www.pro-football-reference.com/teams/kan/2023.htm'
+
+    def stored_drives(self, loader):
+        with loader.engine.connect() as conn:
+            return conn.exec_driver_sql('SELECT drive_num, end_event FROM game_drives ORDER BY drive_num').fetchall()
+
+    def test_upsert_overwrites_conflicting_rows(self, loader):
+        """With upsert, a row colliding on the conflict keys takes the new values."""
+        loader.insert_df(drives_frame([1]), 'game_drives')
+        changed = drives_frame([1, 2]).assign(end_event='Touchdown')
+
+        assert loader.insert_df(changed, 'game_drives', upsert=True) == InsertResult(2, 0)
+        assert [tuple(row) for row in self.stored_drives(loader)] == [('1', 'Touchdown'), ('2', 'Touchdown')]
+
+    def test_unchanged_page_is_not_written(self, loader):
+        """The second refresh of identical data writes nothing; changed data is written again."""
+        loader.create_page_hashes_table()
+
+        assert loader.refresh_page(self.URL, [('game_drives', drives_frame([1]))])
+        first_hash = loader.get_page_hash(self.URL)
+        assert not loader.refresh_page(self.URL, [('game_drives', drives_frame([1]))])
+
+        changed = drives_frame([1]).assign(end_event='Touchdown')
+        assert loader.refresh_page(self.URL, [('game_drives', changed)])
+        assert loader.get_page_hash(self.URL) != first_hash
+        assert [tuple(row) for row in self.stored_drives(loader)] == [('1', 'Touchdown')]
+
+
+class TestConnectionPool:
+    """Test the pooled engine shared by reads, writes and DDL."""
+
+    def test_engine_options(self):
+        """The pool pings connections before use and sets the statement timeout."""
+        options = DatabaseConfig('localhost', 'postgres', 'postgres', '', 5432, pool_size=8).get_engine_options()
+
+        assert options['pool_size'] == 8
+        assert options['pool_pre_ping'] is True
+        assert options['connect_args'] == {'options': '-c statement_timeout=300000'}
+
+    def test_statement_timeout_can_be_disabled(self):
+        """A timeout of 0 leaves the server default in place."""
+        config = DatabaseConfig('localhost', 'postgres', 'postgres', '', 5432, statement_timeout_ms=0)
+
+        assert 'connect_args' not in config.get_engine_options()
+
+    def test_reads_reuse_pooled_connections(self, loader):
+        """Reads, DDL and raw connections all check out of the same pool."""
+        loader.create_table('CREATE TABLE IF NOT EXISTS player_profiles (player_id TEXT PRIMARY KEY, url TEXT)',
+                            'player_profiles')
+        try:
+            assert loader.get_all_player_urls() == []
+            assert loader.get_all_player_urls() == []
+            raw = loader.get_connection()
+            with raw.cursor() as cursor:
+                cursor.execute('SHOW statement_timeout')
+                assert cursor.fetchone()[0] == '5s'
+            raw.close()
+
+            assert loader.engine.pool.checkedout() == 0
+            assert loader.engine.pool.checkedin() == 1
+        finally:
+            loader.create_table('DROP TABLE player_profiles', 'player_profiles')
+
+
+class Game(NamedTuple):
+    info: pd.DataFrame
+    drives: pd.DataFrame
+
+
+def game(game_id):
+    return Game(pd.DataFrame({'game_id': [game_id]}), pd.DataFrame({'game_id': [game_id] * 2}))
+
+
+class TestBatchWriter:
+    """Test buffering several games into one transaction."""
+
+    TABLES = {'info': 'game_info', 'drives': 'game_drives'}
+
+    def test_flushes_full_batches_in_table_order(self):
+        """Every max_items games are written with one insert_dfs call, parents first."""
+        loader = Mock()
+        writer = BatchWriter(loader, self.TABLES, max_items=2)
+
+        writer.add('a', game('a'))
+        loader.insert_dfs.assert_not_called()
+        writer.add('b', game('b'))
+
+        loader.insert_dfs.assert_called_once()
+        (info_table, info), (drives_table, drives) = loader.insert_dfs.call_args[0][0]
+        assert (info_table, drives_table) == ('game_info', 'game_drives')
+        assert info['game_id'].tolist() == ['a', 'b']
+        assert drives['game_id'].tolist() == ['a', 'a', 'b', 'b']
+        assert writer.written == ['a', 'b']
+        assert len(writer) == 0
+
+    def test_flushes_after_max_seconds(self):
+        """A partial batch is written once its oldest game has waited long enough."""
+        loader = Mock()
+        writer = BatchWriter(loader, self.TABLES, max_items=50, max_seconds=0)
+
+        writer.add('a', game('a'))
+
+        loader.insert_dfs.assert_called_once()
+
+    def test_flushes_remaining_games_on_exit(self):
+        """Leaving the with block writes whatever is still buffered."""
+        loader = Mock()
+        with BatchWriter(loader, self.TABLES, max_items=50) as writer:
+            writer.add('a', game('a'))
+            loader.insert_dfs.assert_not_called()
+
+        assert writer.written == ['a']
+
+    def test_failed_batch_is_retried_game_by_game(self):
+        """One bad game fails only itself, not the rest of its batch."""
+        def insert_dfs(frames):
+            if 'bad' in frames[0][1]['game_id'].tolist():
+                raise ValueError('bad row')
+
+        loader = Mock()
+        loader.insert_dfs.side_effect = insert_dfs
+        with BatchWriter(loader, self.TABLES, max_items=50) as writer:
+            for game_id in ['a', 'bad', 'b']:
+                writer.add(game_id, game(game_id))
+
+        assert writer.written == ['a', 'b']
+        assert list(writer.failed) == ['bad']
+        assert isinstance(writer.failed['bad'], ValueError)
+        assert loader.insert_dfs.call_count == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,73 @@
+"""Tests for process-pool parsing of stored game pages."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+from nfl_datacollector.cache import PageCache, PageArchive
+from scrapers.games_page.etl import parse_game_page
+from scrapers.games_page.parallel import RecordBatch, parse_stored_game_pages
+from scrapers.main import ETL_reparse_stored_game_pages
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'boxscore_202309070kan.html'
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+
+
+class TestParallelParsing:
+    """Test parsing archived game pages in worker processes."""
+
+    def test_record_batch_round_trip(self):
+        """Record batches rebuild the original frames exactly."""
+        frames = parse_game_page(GAME_URL, FIXTURE.read_text())
+        for df in frames:
+            pd.testing.assert_frame_equal(RecordBatch.from_frame(df).to_frame(), df)
+
+    def test_matches_in_process_parse(self, tmp_path):
+        """Worker output equals parsing the same page in this process."""
+        PageCache(tmp_path).put(GAME_URL, FIXTURE.read_text())
+        missing_url = GAME_URL.replace('kan', 'atl')
+
+        results = {url: (frames, error) for url, frames, error in
+                   parse_stored_game_pages([GAME_URL, missing_url], PageArchive(tmp_path), workers=2)}
+
+        assert results[missing_url][0] is None
+        assert results[missing_url][1]
+        expected = parse_game_page(GAME_URL, FIXTURE.read_text())
+        for actual_df, expected_df in zip(results[GAME_URL][0], expected):
+            pd.testing.assert_frame_equal(actual_df, expected_df)
+
+    def test_reparse_loads_batches(self, tmp_path):
+        """Scraped games are transformed and loaded together per batch."""
+        PageCache(tmp_path).put(GAME_URL, FIXTURE.read_text())
+        PageCache(tmp_path).put(GAME_URL.replace('kan', 'atl'), '<html></html>')
+        loader = Mock()
+
+        failed = ETL_reparse_stored_game_pages(loader, archive_path=tmp_path, workers=2, batch_size=8)
+
+        assert list(failed) == [GAME_URL.replace('kan', 'atl')]
+        game_info = dict(loader.insert_dfs.call_args[0][0])['game_info']
+        assert game_info['game_id'].tolist() == ['2023_kan_det_1']
+
+    def test_failed_batch_load_is_retried_game_by_game(self, tmp_path):
+        """A database error on one game fails only that game, not the rest of its batch."""
+        bad_url = GAME_URL.replace('kan', 'atl')
+        PageCache(tmp_path).put(GAME_URL, FIXTURE.read_text())
+        PageCache(tmp_path).put(bad_url, FIXTURE.read_text())
+
+        def insert_dfs(frames):
+            urls = dict(frames)['game_info']['url'].tolist()
+            if len(urls) > 1 or urls == [bad_url]:
+                raise ValueError('duplicate key value violates unique constraint')
+
+        loader = Mock()
+        loader.insert_dfs.side_effect = insert_dfs
+
+        failed = ETL_reparse_stored_game_pages(loader, archive_path=tmp_path, workers=2, batch_size=8)
+
+        assert list(failed) == [bad_url]
+        assert loader.insert_dfs.call_count == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,102 @@
+"""Tests for the staged producer/consumer pipeline."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from nfl_datacollector.cache import PageCache, PageArchive
+from scrapers.main import ETL_game_pages_pipeline
+from scrapers.pipeline import Pipeline, Stage
+from scrapers.scraper import PageScraper
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'boxscore_202309070kan.html'
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+
+
+def _fail_on_three(x):
+    if x == 3:
+        raise ValueError('bad item')
+    return x
+
+
+class TestPipeline:
+    """Test the Pipeline class."""
+
+    def test_items_flow_through_every_stage(self):
+        """Each item is transformed by every stage in order."""
+        pipeline = Pipeline([
+            Stage('double', lambda x: x * 2, workers=3),
+            Stage('increment', lambda x: x + 1),
+        ], queue_size=2)
+        results = pipeline.run(range(10))
+
+        assert sorted(results) == [x * 2 + 1 for x in range(10)]
+        assert pipeline.stats['double'].processed == 10
+        assert pipeline.stats['increment'].processed == 10
+
+    def test_failures_are_reported_against_the_input(self):
+        """A failing item is recorded with its original input and the rest continue."""
+        pipeline = Pipeline([
+            Stage('square', lambda x: x * x),
+            Stage('check', lambda x: _fail_on_three(x // 3)),
+        ])
+        results = pipeline.run([1, 3, 4])
+
+        assert sorted(results) == [0, 5]
+        assert [(stage, source) for stage, source, _ in pipeline.errors] == [('check', 3)]
+
+    def test_executor_stage(self):
+        """Stages with an executor run their function on it."""
+        with ThreadPoolExecutor(2) as executor:
+            pipeline = Pipeline([Stage('negate', lambda x: -x, workers=2, executor=executor)])
+            assert sorted(pipeline.run([1, 2, 3])) == [-3, -2, -1]
+
+    def test_slow_consumer_blocks_producer(self):
+        """A slow downstream stage shows up as blocked time upstream."""
+        def slow(x):
+            time.sleep(0.02)
+            return x
+
+        pipeline = Pipeline([Stage('fast', lambda x: x), Stage('slow', slow)], queue_size=1)
+        pipeline.run(range(10))
+        assert pipeline.stats['fast'].blocked_seconds > 0.05
+
+    def test_failing_input_stops_every_thread(self):
+        """An error raised by the input iterable reaches the caller after the workers and reporter stop."""
+        def items():
+            yield 1
+            raise ValueError('week page missing')
+
+        before = threading.active_count()
+        pipeline = Pipeline([Stage('double', lambda x: x * 2, workers=2)], report_every=0.01)
+        with pytest.raises(ValueError, match='week page missing'):
+            pipeline.run(items())
+
+        assert pipeline.results == [2]
+        assert threading.active_count() == before
+
+
+class TestGamePagesPipeline:
+    """Test ETL_game_pages_pipeline."""
+
+    def test_load_failures_are_reported(self, tmp_path):
+        """Games the batch writer fails to commit show up as load stage errors."""
+        PageCache(tmp_path).put(GAME_URL, FIXTURE.read_text())
+        loader = Mock()
+        loader.insert_dfs.side_effect = ValueError('statement timeout')
+
+        with patch.object(PageScraper, 'page_cache', PageArchive(tmp_path)):
+            pipeline = ETL_game_pages_pipeline([GAME_URL], loader, parse_workers=1, report_every=None)
+
+        [(stage, source, error)] = pipeline.errors
+        assert (stage, source) == ('load', GAME_URL)
+        assert isinstance(error, ValueError)
+        assert pipeline.stats['load'].processed == 0
+        assert pipeline.stats['load'].failed == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,46 @@
+"""Tests for the per-host rate limiter."""
+
+import asyncio
+
+import pytest
+from nfl_datacollector.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    """Test the RateLimiter class."""
+
+    def test_first_request_is_not_delayed(self):
+        """No time is owed before the first request to a host."""
+        limiter = RateLimiter(requests_per_minute=60, jitter=0)
+        assert limiter.reserve('https://www.pro-football-reference.com/years/2024/') == 0
+
+    def test_only_remaining_time_is_owed(self):
+        """Back-to-back requests are spaced by the configured interval."""
+        limiter = RateLimiter(requests_per_minute=60, jitter=0)
+        limiter.reserve('https://www.pro-football-reference.com/a.htm')
+        delay = limiter.reserve('https://www.pro-football-reference.com/b.htm')
+        assert 0.9 < delay <= 1.0
+
+        # A third caller queues behind the second
+        delay = limiter.reserve('https://www.pro-football-reference.com/c.htm')
+        assert 1.9 < delay <= 2.0
+
+    def test_hosts_are_limited_independently(self):
+        """Requests to different hosts do not wait on each other."""
+        limiter = RateLimiter(requests_per_minute=60, jitter=0)
+        limiter.reserve('https://www.pro-football-reference.com/a.htm')
+        assert limiter.reserve('https://example.com/a.htm') == 0
+
+    def test_wait_async(self):
+        """The asyncio wait returns immediately when nothing is owed."""
+        limiter = RateLimiter(requests_per_minute=60, jitter=0)
+        asyncio.run(limiter.wait_async('https://www.pro-football-reference.com/a.htm'))
+
+    def test_invalid_rate(self):
+        """A non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,123 @@
+"""Tests for the PageScraper base class."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from scrapers import parsers
+from scrapers.games_page.etl import parse_game_page
+from scrapers.games_page.ingest import GamePageScraper
+from scrapers.scraper import PageScraper
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'boxscore_202309070kan.html'
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/202309070kan.htm'
+
+
+BACKENDS = [
+    'lxml',
+    'html.parser',
+    pytest.param('selectolax', marks=pytest.mark.skipif(parsers.LexborHTMLParser is None,
+                                                        reason='selectolax not installed')),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def scraper(request, monkeypatch):
+    monkeypatch.setattr(PageScraper, 'parser_backend', request.param)
+    scraper = PageScraper()
+    scraper.load_html(GAME_URL, FIXTURE.read_text())
+    return scraper
+
+
+class TestElementLookup:
+    """Test _extract_table and _extract_div."""
+
+    def test_live_table_by_id(self, scraper):
+        """Tables in the live DOM are found by id."""
+        assert scraper._extract_table('player_offense')['id'] == 'player_offense'
+
+    def test_commented_table_by_id(self, scraper):
+        """Tables inside HTML comments are found by id."""
+        table = scraper._extract_table('home_drives')
+        assert table['id'] == 'home_drives'
+        assert len(table.find('tbody').find_all('tr')) == 5
+
+    def test_table_by_full_and_single_class(self, scraper):
+        """Class lookups match the full class attribute or any single class."""
+        full = scraper._extract_table('linescore nohover stats_table no_freeze')
+        assert full is not None
+        assert scraper._extract_table('linescore') is full
+
+    def test_div_lookup(self, scraper):
+        """Divs are found by class in the DOM and by id inside comments."""
+        assert scraper._extract_div('scorebox_meta') is not None
+        assert scraper._extract_div('div_other_scores').find('h2') is not None
+
+    def test_missing_element(self, scraper):
+        """Unknown ids return None."""
+        assert scraper._extract_table('does_not_exist') is None
+
+    def test_assigned_soup(self):
+        """A soup assigned without load_html is indexed, comments included."""
+        scraper = PageScraper()
+        scraper.soup = parsers.get_parser_backend('html.parser').parse(FIXTURE.read_text())
+
+        assert scraper._extract_table('home_drives')['id'] == 'home_drives'
+
+    def test_page_not_loaded(self):
+        """Lookups before a page is loaded raise."""
+        with pytest.raises(ValueError):
+            PageScraper()._extract_table('scoring')
+
+
+class TestParseOnly:
+    """Test partial parsing of the elements a scraper declares."""
+
+    @pytest.fixture(params=['lxml', 'html.parser'])
+    def strained(self, request, monkeypatch):
+        monkeypatch.setattr(PageScraper, 'parser_backend', request.param)
+        monkeypatch.setattr(PageScraper, 'parse_only', ('linescore', 'home_drives', 'scorebox'))
+        scraper = PageScraper()
+        scraper.load_html(GAME_URL, FIXTURE.read_text())
+        return scraper
+
+    def test_only_declared_elements_are_built(self, strained):
+        """Undeclared live tables are not in the parsed tree."""
+        assert strained.soup.find('table', id='player_offense') is None
+        assert strained.soup.find('table', class_='linescore') is not None
+
+    def test_declared_elements_found(self, strained):
+        """Declared elements are found in the DOM and inside comments."""
+        assert strained._extract_div('scorebox') is not None
+        table = strained._extract_table('home_drives')
+        assert len(table.find('tbody').find_all('tr')) == 5
+
+    def test_undeclared_lookup_raises(self, strained):
+        """Looking up an element that was never parsed raises."""
+        with pytest.raises(ValueError):
+            strained._extract_table('player_offense')
+
+
+class TestParserBackends:
+    """Test that every parser backend yields the same game page DataFrames."""
+
+    @pytest.mark.parametrize('backend', BACKENDS[:1] + BACKENDS[2:])
+    def test_frames_match_html_parser(self, backend, monkeypatch):
+        """Each backend matches the html.parser reference frame for frame."""
+        html = FIXTURE.read_text()
+        monkeypatch.setattr(GamePageScraper, 'parser_backend', 'html.parser')
+        expected = parse_game_page(GAME_URL, html)
+        monkeypatch.setattr(GamePageScraper, 'parser_backend', backend)
+        actual = parse_game_page(GAME_URL, html)
+
+        for name, a, b in zip(expected._fields, expected, actual):
+            pd.testing.assert_frame_equal(a, b, obj=name)
+
+    def test_unknown_backend(self):
+        """Unknown backend names raise."""
+        with pytest.raises(ValueError):
+            parsers.get_parser_backend('html5')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,116 @@
+"""Tests for the index of already loaded URLs."""
+
+from unittest.mock import Mock
+
+import pytest
+from nfl_datacollector.urlindex import BloomFilter, UrlIndex
+
+GAME_URL = 'https://www.pro-football-reference.com/boxscores/{}.htm'
+
+
+def game_urls(count, start=0):
+    return [GAME_URL.format(f'2023{i:05d}kan') for i in range(start, start + count)]
+
+
+class TestBloomFilter:
+    """Test the BloomFilter class."""
+
+    def test_no_false_negatives(self):
+        """Every added item is reported as present."""
+        bloom = BloomFilter(capacity=1000)
+        urls = game_urls(1000)
+        for url in urls:
+            bloom.add(url)
+
+        assert all(url in bloom for url in urls)
+
+    def test_false_positive_rate(self):
+        """Unseen items are rarely reported as present when the filter is within capacity."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for url in game_urls(1000):
+            bloom.add(url)
+
+        false_positives = sum(url in bloom for url in game_urls(10_000, start=1000))
+        assert false_positives < 300
+
+    def test_save_and_load(self, tmp_path):
+        """A saved filter loads back with the same answers and counts."""
+        bloom = BloomFilter(capacity=100)
+        bloom.add('a')
+        bloom.save(tmp_path / 'urls.bloom')
+
+        loaded = BloomFilter.load(tmp_path / 'urls.bloom')
+
+        assert 'a' in loaded
+        assert (loaded.num_bits, loaded.num_hashes, loaded.capacity, loaded.count) == (
+            bloom.num_bits, bloom.num_hashes, 100, 1)
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """A file that is not a saved filter is refused."""
+        path = tmp_path / 'urls.bloom'
+        path.write_bytes(b'not a bloom filter at all, just some bytes')
+
+        with pytest.raises(ValueError):
+            BloomFilter.load(path)
+
+
+class TestUrlIndex:
+    """Test the UrlIndex class."""
+
+    def test_hashed_set_loads_once(self):
+        """Without a Bloom filter, URLs are loaded on first use and never queried again."""
+        load_urls = Mock(return_value=game_urls(3))
+        index = UrlIndex(load_urls)
+
+        assert game_urls(3)[0] in index
+        assert game_urls(1, start=5)[0] not in index
+        load_urls.assert_called_once()
+
+    def test_added_urls_are_found(self):
+        """URLs added during the run are members without touching the database."""
+        index = UrlIndex(Mock(return_value=[]))
+        index.add(GAME_URL.format('new'))
+
+        assert GAME_URL.format('new') in index
+
+    def test_bloom_filter_is_built_then_reused(self, tmp_path):
+        """The first run saves a filter; later runs read it instead of loading every URL."""
+        path = tmp_path / 'game_info.bloom'
+        UrlIndex(Mock(return_value=game_urls(3)), Mock(), path).update([])
+        assert path.exists()
+
+        load_urls = Mock(return_value=[])
+        exists = Mock(return_value=True)
+        index = UrlIndex(load_urls, exists, path)
+
+        assert game_urls(3)[1] in index
+        assert game_urls(3)[1] in index
+        load_urls.assert_not_called()
+        # A filter hit is confirmed once, then cached
+        exists.assert_called_once_with(game_urls(3)[1])
+
+    def test_bloom_miss_skips_the_database(self, tmp_path):
+        """A URL the filter has never seen is new without a lookup."""
+        exists = Mock()
+        index = UrlIndex(Mock(return_value=game_urls(3)), exists, tmp_path / 'game_info.bloom')
+
+        assert GAME_URL.format('unseen') not in index
+        exists.assert_not_called()
+
+    def test_save_persists_added_urls(self, tmp_path):
+        """URLs added this run are in the filter the next run loads."""
+        path = tmp_path / 'game_info.bloom'
+        index = UrlIndex(Mock(return_value=[]), Mock(), path)
+        index.add(GAME_URL.format('new'))
+        index.save()
+
+        assert GAME_URL.format('new') in BloomFilter.load(path)
+
+    def test_bloom_filter_needs_a_lookup(self, tmp_path):
+        """Filter hits cannot be confirmed without exists()."""
+        with pytest.raises(ValueError):
+            UrlIndex(Mock(), bloom_path=tmp_path / 'game_info.bloom')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])